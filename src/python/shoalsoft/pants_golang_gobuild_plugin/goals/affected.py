@@ -0,0 +1,146 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+from __future__ import annotations
+
+from collections import defaultdict
+
+from pants.base.specs import DirGlobSpec, RawSpecs
+from pants.core.util_rules.environments import ChosenLocalEnvironmentName
+from pants.engine.console import Console
+from pants.engine.environment import EnvironmentName
+from pants.engine.fs import GlobMatchErrorBehavior
+from pants.engine.goal import Goal, GoalSubsystem
+from pants.engine.internals.graph import resolve_targets
+from pants.engine.rules import collect_rules, concurrently, goal_rule, implicitly
+from pants.engine.target import Targets
+from pants.util.strutil import softwrap
+from shoalsoft.pants_golang_gobuild_plugin.target_types import (
+    GoModuleSourcesField,
+    GoPackageSourcesField,
+)
+from shoalsoft.pants_golang_gobuild_plugin.util_rules import go_mod, goroot, package_graph
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.go_mod import (
+    OwningGoModRequest,
+    find_owning_go_mod,
+)
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.package_graph import (
+    GoPackageGraphRequest,
+    list_go_package_graph,
+)
+
+
+class GoAffectedSubsystem(GoalSubsystem):
+    name = "go-affected"
+    help = softwrap(
+        """
+        List the `go_package` targets affected by changes to the given targets.
+
+        Meant to be combined with `--changed-since`, to test or check only the packages whose
+        build or tests depend on the changes, e.g.:
+
+            pants test $(pants --changed-since=origin/main go-affected)
+
+        A package is affected if it changed, if it transitively imports a changed package, or if
+        its tests import an affected package. A changed `go_module` affects all of its packages,
+        as does a changed `go_package` whose directory no longer holds a package (e.g. because it
+        was deleted or renamed), since its importers can no longer be found.
+        Imports are read from the package graph of each module, so the packages of other modules
+        are not considered. The number of packages pruned from each module is reported on stderr.
+        """
+    )
+
+
+class GoAffectedGoal(Goal):
+    subsystem_cls = GoAffectedSubsystem
+    environment_behavior = Goal.EnvironmentBehavior.LOCAL_ONLY
+
+
+@goal_rule
+async def go_affected(
+    console: Console,
+    targets: Targets,
+    local_environment: ChosenLocalEnvironmentName,
+) -> GoAffectedGoal:
+    environment = {local_environment.val: EnvironmentName}
+    go_targets = [
+        tgt
+        for tgt in targets
+        if tgt.has_field(GoPackageSourcesField) or tgt.has_field(GoModuleSourcesField)
+    ]
+    owning_go_mods = await concurrently(
+        find_owning_go_mod(OwningGoModRequest(tgt.address), **implicitly(environment))
+        for tgt in go_targets
+    )
+    changed_by_module: dict[str, list[str]] = defaultdict(list)
+    whole_modules: set[str] = set()
+    for tgt, owning_go_mod in zip(go_targets, owning_go_mods):
+        changed_dirs = changed_by_module[owning_go_mod.module_dir]
+        if tgt.has_field(GoModuleSourcesField):
+            # A changed `go.mod` or `go.sum` may change how any package of the module builds.
+            whole_modules.add(owning_go_mod.module_dir)
+        else:
+            changed_dirs.append(tgt.address.spec_path)
+
+    module_dirs = sorted(changed_by_module)
+    graphs = await concurrently(
+        list_go_package_graph(GoPackageGraphRequest(module_dir), **implicitly(environment))
+        for module_dir in module_dirs
+    )
+    affected_dirs: set[str] = set()
+    for module_dir, graph in zip(module_dirs, graphs):
+        first_party = graph.first_party_packages()
+        packages_by_dir = graph.packages_by_dir()
+        changed_dirs = changed_by_module[module_dir]
+        missing_dirs = sorted({d for d in changed_dirs if d not in packages_by_dir})
+        if missing_dirs and module_dir not in whole_modules:
+            # A changed package which is no longer listed was deleted or renamed, so its importers
+            # are unknown: rather than pruning them, the whole module is affected.
+            console.print_stderr(
+                f"{module_dir or '.'}: no Go package found in {', '.join(missing_dirs)}, so all of "
+                "the module's packages are affected."
+            )
+        if module_dir in whole_modules or missing_dirs:
+            affected = {pkg.import_path for pkg in first_party}
+        else:
+            affected = graph.affected_packages(
+                packages_by_dir[d].import_path for d in changed_dirs if d in packages_by_dir
+            )
+        affected_dirs.update(
+            pkg.dir for pkg in first_party if pkg.dir is not None and pkg.import_path in affected
+        )
+        console.print_stderr(
+            f"{module_dir or '.'}: {len(affected)} of {len(first_party)} Go packages affected, "
+            f"{len(first_party) - len(affected)} pruned."
+        )
+
+    if not affected_dirs:
+        return GoAffectedGoal(exit_code=0)
+    candidate_targets = await resolve_targets(
+        **implicitly(
+            {
+                RawSpecs(
+                    dir_globs=tuple(DirGlobSpec(d) for d in sorted(affected_dirs)),
+                    unmatched_glob_behavior=GlobMatchErrorBehavior.ignore,
+                    description_of_origin="the `go-affected` goal",
+                ): RawSpecs,
+                **environment,
+            }
+        )
+    )
+    for address in sorted(
+        tgt.address
+        for tgt in candidate_targets
+        if tgt.has_field(GoPackageSourcesField) and tgt.residence_dir in affected_dirs
+    ):
+        console.print_stdout(address.spec)
+    return GoAffectedGoal(exit_code=0)
+
+
+def rules():
+    return (
+        *collect_rules(),
+        *go_mod.rules(),
+        *goroot.rules(),
+        *package_graph.rules(),
+    )
@@ -0,0 +1,276 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+from __future__ import annotations
+
+import os
+import statistics
+
+from pants.core.util_rules.environments import ChosenLocalEnvironmentName
+from pants.engine.console import Console
+from pants.engine.env_vars import EnvironmentVarsRequest
+from pants.engine.environment import EnvironmentName
+from pants.engine.fs import CreateDigest, FileContent, PathGlobs, Workspace
+from pants.engine.goal import Goal, GoalSubsystem
+from pants.engine.internals.platform_rules import environment_vars_subset
+from pants.engine.intrinsics import create_digest, execute_process, get_digest_contents
+from pants.engine.process import Process, ProcessCacheScope
+from pants.engine.rules import collect_rules, goal_rule, implicitly
+from pants.engine.target import Targets
+from pants.option.errors import OptionsError
+from pants.option.option_types import BoolOption, FloatOption, IntOption, StrOption
+from pants.util.logging import LogLevel
+from pants.util.strutil import softwrap
+from shoalsoft.pants_golang_gobuild_plugin.target_types import GoPackageSourcesField
+from shoalsoft.pants_golang_gobuild_plugin.util_rules import go_mod, goroot, package_inputs
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.benchmarks import (
+    BenchmarkKey,
+    compare_benchmarks,
+    deserialize_benchmarks,
+    parse_benchmark_output,
+    serialize_benchmarks,
+    unmatched_benchmarks,
+)
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.go_cache import SANDBOX_APPEND_ONLY_CACHES
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.go_mod import (
+    GoModulePathsRequest,
+    OwningGoModRequest,
+    find_go_module_paths,
+    find_owning_go_mod,
+)
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.goroot import setup_goroot
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.package_inputs import (
+    GoPackageInputsRequest,
+    find_go_package_inputs,
+)
+
+
+class GoBenchSubsystem(GoalSubsystem):
+    name = "go-bench"
+    help = softwrap(
+        """
+        Run the Go benchmarks of `go_package` targets and compare them against a baseline.
+
+        Each package's benchmarks run with `go test -bench`, one package at a time so that
+        packages do not compete for the machine. With `--baseline`, each metric (e.g. `ns/op`,
+        `B/op` or `allocs/op`) is compared with the baseline using a Mann-Whitney U test over the
+        repetitions of `--count`, and the goal fails if any metric regressed significantly by
+        more than `--threshold`.
+        """
+    )
+
+    bench = StrOption(
+        default=".",
+        help="Run only the benchmarks matching this regular expression, as with `go test -bench`.",
+    )
+    count = IntOption(
+        default=10,
+        help=softwrap(
+            """
+            The number of times to run each benchmark. Significance tests need several samples:
+            with fewer than 5 repetitions on either side, no change can be significant at the
+            default `--alpha`.
+            """
+        ),
+    )
+    benchtime = StrOption(
+        default=None,
+        help="The time (e.g. `1s`) or iterations (e.g. `100x`) to run each benchmark for.",
+    )
+    baseline = StrOption(
+        default=None,
+        help=softwrap(
+            """
+            The path, relative to the build root, of the JSON file holding the baseline results
+            to compare against.
+            """
+        ),
+    )
+    update_baseline = BoolOption(
+        default=False,
+        help=softwrap(
+            """
+            Write the results of this run to `--baseline` instead of comparing against it. The
+            baseline is not written if any benchmarks fail.
+            """
+        ),
+    )
+    threshold = FloatOption(
+        default=5.0,
+        help=softwrap(
+            """
+            The change in a metric's median, as a percentage of the baseline, beyond which a
+            significant change in the worse direction fails the goal.
+            """
+        ),
+    )
+    fail_on_missing = BoolOption(
+        default=False,
+        help=softwrap(
+            """
+            Fail if a metric in the baseline for one of the benchmarked packages was not measured
+            by this run, e.g. because its benchmark was renamed or removed. Such metrics are
+            reported either way, as are metrics missing from the baseline.
+            """
+        ),
+    )
+    alpha = FloatOption(
+        default=0.05,
+        help="The p-value below which a change is considered significant.",
+        advanced=True,
+    )
+
+
+class GoBenchGoal(Goal):
+    subsystem_cls = GoBenchSubsystem
+    environment_behavior = Goal.EnvironmentBehavior.LOCAL_ONLY
+
+
+def _format_value(value: float) -> str:
+    return f"{value:.4g}"
+
+
+@goal_rule
+async def go_bench(
+    console: Console,
+    targets: Targets,
+    go_bench_subsystem: GoBenchSubsystem,
+    workspace: Workspace,
+    local_environment: ChosenLocalEnvironmentName,
+) -> GoBenchGoal:
+    baseline_path = go_bench_subsystem.baseline
+    if go_bench_subsystem.update_baseline and not baseline_path:
+        raise OptionsError(
+            f"The option `--{GoBenchSubsystem.name}-update-baseline` requires "
+            f"`--{GoBenchSubsystem.name}-baseline` to name the file to write."
+        )
+
+    environment = {local_environment.val: EnvironmentName}
+    go_root = await setup_goroot(**implicitly(environment))
+    env_vars = await environment_vars_subset(
+        **implicitly(
+            {
+                EnvironmentVarsRequest(["PATH"], allowed=["PATH"]): EnvironmentVarsRequest,
+                **environment,
+            }
+        )
+    )
+    package_addresses = sorted(
+        tgt.address for tgt in targets if tgt.has_field(GoPackageSourcesField)
+    )
+
+    samples: dict[BenchmarkKey, list[float]] = {}
+    import_paths = set()
+    exit_code = 0
+    for address in package_addresses:
+        owning_go_mod = await find_owning_go_mod(  # noqa: PNT30: benchmarks run one at a time
+            OwningGoModRequest(address), **implicitly(environment)
+        )
+        module_paths = await find_go_module_paths(  # noqa: PNT30: benchmarks run one at a time
+            GoModulePathsRequest((owning_go_mod.module_dir,)), **implicitly(environment)
+        )
+        import_paths.add(module_paths.import_path(address.spec_path))
+        inputs = await find_go_package_inputs(  # noqa: PNT30: benchmarks run one at a time
+            GoPackageInputsRequest(owning_go_mod.module_dir, address.spec_path),
+            **implicitly(environment),
+        )
+        argv = [
+            os.path.join(go_root.path, "bin", "go"),
+            "test",
+            "-run=^$",
+            f"-bench={go_bench_subsystem.bench}",
+            "-benchmem",
+            f"-count={go_bench_subsystem.count}",
+        ]
+        if go_bench_subsystem.benchtime:
+            argv.append(f"-benchtime={go_bench_subsystem.benchtime}")
+        argv.append(f"./{address.spec_path}")
+        result = await execute_process(  # noqa: PNT30: benchmarks run one at a time
+            Process(
+                argv=argv,
+                description=f"Run Go benchmarks: {address}",
+                input_digest=inputs.sandbox.digest,
+                env={"PATH": env_vars.get("PATH", ""), **inputs.sandbox.env},
+                append_only_caches=SANDBOX_APPEND_ONLY_CACHES,
+                # Timings are only meaningful if the benchmarks actually run.
+                cache_scope=ProcessCacheScope.PER_SESSION,
+                level=LogLevel.DEBUG,
+            ),
+            **implicitly(environment),
+        )
+        output = result.stdout.decode(errors="replace")
+        if result.exit_code != 0:
+            console.print_stderr(f"Benchmarks of {address} failed:\n{output}")
+            console.print_stderr(result.stderr.decode(errors="replace"))
+            exit_code = result.exit_code
+            continue
+        samples.update(parse_benchmark_output(output))
+
+    if baseline_path and go_bench_subsystem.update_baseline:
+        if exit_code != 0:
+            console.print_stderr(f"Not updating {baseline_path}, since benchmarks failed.")
+            return GoBenchGoal(exit_code=exit_code)
+        digest = await create_digest(
+            CreateDigest([FileContent(baseline_path, serialize_benchmarks(samples))])
+        )
+        workspace.write_digest(digest)
+        console.print_stdout(f"Wrote {len(samples)} benchmark metrics to {baseline_path}.")
+        return GoBenchGoal(exit_code=exit_code)
+
+    baseline_contents = (
+        await get_digest_contents(**implicitly({PathGlobs([baseline_path]): PathGlobs}))
+        if baseline_path
+        else ()
+    )
+    if not baseline_contents:
+        if baseline_path:
+            console.print_stderr(f"No benchmark baseline found at {baseline_path}.")
+        for key, values in sorted(samples.items(), key=lambda item: str(item[0])):
+            console.print_stdout(f"{key}: median {_format_value(statistics.median(values))}")
+        return GoBenchGoal(exit_code=exit_code)
+
+    alpha = go_bench_subsystem.alpha
+    threshold = go_bench_subsystem.threshold / 100
+    baseline = deserialize_benchmarks(baseline_contents[0].content)
+    regressions = 0
+    for comparison in compare_benchmarks(baseline, samples):
+        if comparison.is_regression(alpha=alpha, threshold=threshold):
+            status = console.red("regression")
+            regressions += 1
+        elif comparison.is_significant(alpha):
+            status = "changed"
+        else:
+            status = "~"
+        console.print_stdout(
+            f"{comparison.key}: {_format_value(comparison.baseline_median)} -> "
+            f"{_format_value(comparison.median)} ({comparison.delta:+.2%}, "
+            f"p={comparison.p_value:.3f}) {status}"
+        )
+    missing, added = unmatched_benchmarks(
+        {key: values for key, values in baseline.items() if key.package in import_paths}, samples
+    )
+    for key in missing:
+        console.print_stdout(f"{key}: missing from this run")
+    for key in added:
+        console.print_stdout(f"{key}: not in the baseline")
+    if missing and go_bench_subsystem.fail_on_missing:
+        console.print_stderr(
+            f"{len(missing)} benchmark metrics in {baseline_path} were not measured by this run."
+        )
+        exit_code = exit_code or 1
+    if regressions:
+        console.print_stderr(
+            f"{regressions} benchmark metrics regressed by more than "
+            f"{go_bench_subsystem.threshold}% compared to {baseline_path}."
+        )
+        exit_code = exit_code or 1
+    return GoBenchGoal(exit_code=exit_code)
+
+
+def rules():
+    return (
+        *collect_rules(),
+        *go_mod.rules(),
+        *goroot.rules(),
+        *package_inputs.rules(),
+    )
@@ -0,0 +1,131 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+from __future__ import annotations
+
+import os
+
+from pants.core.util_rules.environments import ChosenLocalEnvironmentName
+from pants.engine.console import Console
+from pants.engine.environment import EnvironmentName
+from pants.engine.goal import Goal, GoalSubsystem
+from pants.engine.rules import collect_rules, goal_rule, implicitly
+from pants.option.option_types import BoolOption
+from pants.util.strutil import softwrap
+from shoalsoft.pants_golang_gobuild_plugin.subsystems.golang import GolangSubsystem
+from shoalsoft.pants_golang_gobuild_plugin.util_rules import goroot
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.go_cache import (
+    GoCacheDirs,
+    directory_size,
+    entries_to_evict,
+    read_check_stats,
+    scan_build_cache,
+)
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.goroot import setup_goroot
+
+
+class GoCacheSubsystem(GoalSubsystem):
+    name = "go-cache"
+    help = softwrap(
+        """
+        Report on the plugin's persistent Go caches and evict the least recently used entries of
+        its build caches so that each fits within `[golang2].build_cache_max_size`.
+
+        The build caches are the one in `[golang2].cache_dir`, used by processes which run in the
+        workspace, and the `shoalsoft_go_build` named cache, used by sandboxed processes. The
+        module caches of downloaded modules, in `[golang2].cache_dir` and the `shoalsoft_go_mod`
+        named cache, are reported but not evicted, since Go cannot use partially removed
+        modules: clear one with `GOMODCACHE=<path> go clean -modcache`.
+        """
+    )
+
+    dry_run = BoolOption(
+        default=False,
+        help="If true, only report which entries would be evicted without removing them.",
+    )
+
+
+class GoCacheGoal(Goal):
+    subsystem_cls = GoCacheSubsystem
+    environment_behavior = Goal.EnvironmentBehavior.LOCAL_ONLY
+
+
+def _format_size(size: int) -> str:
+    value = float(size)
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if value < 1024 or unit == "GiB":
+            break
+        value /= 1024
+    return f"{value:.1f} {unit}" if unit != "B" else f"{size} B"
+
+
+def _evict_build_cache(
+    console: Console, description: str, build_cache: str, max_size: int, dry_run: bool
+) -> None:
+    entries = scan_build_cache(build_cache)
+    total_size = sum(e.size for e in entries)
+    console.print_stdout(f"{description}: {build_cache}")
+    console.print_stdout(
+        f"  Size: {_format_size(total_size)} in {len(entries)} entries "
+        f"(budget {_format_size(max_size)})"
+    )
+
+    evicted = entries_to_evict(entries, max_size)
+    evicted_size = sum(e.size for e in evicted)
+    if dry_run:
+        console.print_stdout(
+            f"  Would evict {len(evicted)} entries ({_format_size(evicted_size)})."
+        )
+        return
+
+    for entry in evicted:
+        try:
+            os.unlink(entry.path)
+        except FileNotFoundError:
+            # Another process (e.g. `go clean -cache`) may have removed it concurrently.
+            pass
+    console.print_stdout(f"  Evicted {len(evicted)} entries ({_format_size(evicted_size)}).")
+
+
+@goal_rule
+async def go_cache(
+    console: Console,
+    go_cache_subsystem: GoCacheSubsystem,
+    golang_subsystem: GolangSubsystem,
+    go_cache_dirs: GoCacheDirs,
+    local_environment: ChosenLocalEnvironmentName,
+) -> GoCacheGoal:
+    go_root = await setup_goroot(**implicitly({local_environment.val: EnvironmentName}))
+    max_size = golang_subsystem.build_cache_max_size
+
+    stats = read_check_stats(go_cache_dirs.check_stats_file)
+    if stats is not None and stats.hit_ratio is not None:
+        console.print_stdout(
+            f"Last check: {stats.hits} hits, {stats.misses} misses "
+            f"({stats.hit_ratio:.1%} hit ratio)"
+        )
+    else:
+        console.print_stdout("Last check: no cache statistics recorded")
+
+    for description, build_cache in (
+        ("Go build cache", go_root.build_cache_path),
+        ("Sandboxed Go build cache", go_cache_dirs.sandbox_build_cache),
+    ):
+        _evict_build_cache(
+            console, description, build_cache, max_size, dry_run=go_cache_subsystem.dry_run
+        )
+
+    for description, module_cache in (
+        ("Go module cache", go_cache_dirs.module_cache),
+        ("Sandboxed Go module cache", go_cache_dirs.sandbox_module_cache),
+    ):
+        console.print_stdout(f"{description}: {module_cache}")
+        console.print_stdout(f"  Size: {_format_size(directory_size(module_cache))} (not evicted)")
+    return GoCacheGoal(exit_code=0)
+
+
+def rules():
+    return (
+        *collect_rules(),
+        *goroot.rules(),
+    )
@@ -2,23 +2,103 @@
 # Copyright (C) 2024 Shoal Software LLC. All rights reserved.
 
 
+import dataclasses
+import logging
 import os
+import re
+from collections import defaultdict
 from dataclasses import dataclass
+from typing import Any, Iterable, Iterator, Sequence
 
+from pants.base.build_environment import get_buildroot
+from pants.build_graph.address import Address
 from pants.core.goals.check import CheckRequest, CheckResult, CheckResults
 from pants.engine.env_vars import EnvironmentVars, EnvironmentVarsRequest
+from pants.engine.fs import EMPTY_DIGEST, CreateDigest, Digest, FileContent
 from pants.engine.internals.platform_rules import environment_vars_subset
-from pants.engine.intrinsics import execute_process
+from pants.engine.intrinsics import create_digest, execute_process, get_digest_contents
 from pants.engine.platform import Platform
-from pants.engine.process import Process, ProcessCacheScope, ProcessExecutionEnvironment
+from pants.engine.process import (
+    FallibleProcessResult,
+    Process,
+    ProcessCacheScope,
+    ProcessExecutionEnvironment,
+)
 from pants.engine.rules import collect_rules, concurrently, implicitly, rule
 from pants.engine.target import FieldSet
 from pants.engine.unions import UnionRule
+from pants.option.errors import OptionsError
+from pants.option.global_options import GlobalOptions
 from pants.util.logging import LogLevel
-from shoalsoft.pants_golang_gobuild_plugin.target_types import GoModuleSourcesField
-from shoalsoft.pants_golang_gobuild_plugin.util_rules import goroot
+from shoalsoft.pants_golang_gobuild_plugin.subsystems.golang import (
+    GoCheckGranularity,
+    GoCheckMode,
+    GolangSubsystem,
+)
+from shoalsoft.pants_golang_gobuild_plugin.target_types import (
+    GoModuleSourcesField,
+    GoPackageSourcesField,
+)
+from shoalsoft.pants_golang_gobuild_plugin.util_rules import (
+    go_cache,
+    go_mod,
+    go_sandbox,
+    go_work,
+    goroot,
+)
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.build_events import (
+    GoPackageBuildResult,
+    GoPackageBuildStatus,
+    package_build_results,
+    render_build_json,
+    summarize_package_results,
+    write_build_report,
+)
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.duration_history import (
+    estimate_durations,
+    partition_longest_first,
+    read_duration_history,
+    write_duration_history,
+)
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.go_cache import (
+    SANDBOX_APPEND_ONLY_CACHES,
+    GoBuildCacheStats,
+    GoCacheDirs,
+    write_check_stats,
+)
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.go_mod import (
+    GoModulePaths,
+    GoModulePathsRequest,
+    OwningGoModRequest,
+    find_go_module_paths,
+    find_owning_go_mod,
+)
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.go_sandbox import (
+    GoCgoEnv,
+    GoSandbox,
+    GoSandboxRequest,
+    setup_go_cgo_env,
+    setup_go_sandbox,
+)
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.go_work import (
+    FindGoWorkFilesRequest,
+    GoWorkFile,
+    GoWorkFiles,
+    find_go_work_files,
+    go_work_version,
+    synthesize_go_work,
+)
 from shoalsoft.pants_golang_gobuild_plugin.util_rules.goroot import GoRoot
 
+logger = logging.getLogger(__name__)
+
+# Written by `go build -debug-actiongraph` and used to compute build cache hit rates.
+_ACTION_GRAPH_FILE = "__actiongraph.json"
+
+# Name of the `go.work` file synthesized for unsandboxed batches of modules outside of any
+# workspace.
+_SYNTHESIZED_GO_WORK_FILE = "__go.work"
+
 
 @dataclass(frozen=True)
 class GoCheckModuleFieldSet(FieldSet):
@@ -30,62 +110,640 @@ class GoCheckModuleRequest(CheckRequest):
     tool_name = "go-compile"
 
 
+@dataclass(frozen=True)
+class GoCheckPackageFieldSet(FieldSet):
+    required_fields = (GoPackageSourcesField,)
+
+
+class GoCheckPackageRequest(CheckRequest):
+    """Check only the requested `go_package` targets.
+
+    Packages importing the requested ones are not added here: they are only checked if Pants
+    selects their targets too, e.g. with `--changed-dependents` over the inferred dependencies.
+    """
+
+    field_set_type = GoCheckPackageFieldSet
+    tool_name = "go-compile"
+
+
+@dataclass(frozen=True)
+class _CheckTarget:
+    """A target to check: the directory `build_dir` is compiled within the module `module_dir`."""
+
+    address: Address
+    module_dir: str
+    build_dir: str
+    is_package: bool = False
+
+    @property
+    def package_pattern(self) -> str:
+        """The `go` package pattern to compile: a module covers every package beneath it."""
+        if self.is_package:
+            return f"./{self.build_dir}"
+        return f"./{self.build_dir}/..." if self.build_dir else "./..."
+
+
+@dataclass(frozen=True)
+class _CheckBatch:
+    """Targets compiled by a single `go build` invocation.
+
+    `go_work_path` is the `go.work` file shared by the targets' modules, if any, and
+    `workspace_module_dirs` are all of the modules it uses. Without a `go.work` file, a synthesized
+    workspace is used unless the only module is at the build root, where `go build` finds it by
+    itself. Sandboxed batches instead use the workspace synthesized for their sandbox, which
+    contains every module of the `go.work` file so that imports between them resolve as they do
+    in the workspace.
+    """
+
+    targets: tuple[_CheckTarget, ...]
+    go_work_path: str | None = None
+    sandboxed: bool = False
+    workspace_module_dirs: tuple[str, ...] = ()
+
+    @property
+    def module_dirs(self) -> tuple[str, ...]:
+        return tuple(dict.fromkeys(target.module_dir for target in self.targets))
+
+    @property
+    def sandbox_module_dirs(self) -> tuple[str, ...]:
+        """The modules captured in the batch's sandbox."""
+        return tuple(dict.fromkeys((*self.workspace_module_dirs, *self.module_dirs)))
+
+    @property
+    def build_dirs(self) -> tuple[str, ...]:
+        return tuple(target.build_dir for target in self.targets)
+
+    @property
+    def history_key(self) -> str:
+        return ",".join(sorted(target.address.spec for target in self.targets))
+
+    @property
+    def needs_synthesized_go_work(self) -> bool:
+        if self.sandboxed:
+            return False
+        return self.go_work_path is None and self.module_dirs != ("",)
+
+    @property
+    def description(self) -> str:
+        noun = "package" if any(target.is_package for target in self.targets) else "module"
+        if len(self.targets) == 1:
+            return f"Compile Go {noun} at {self.targets[0].build_dir or '.'}"
+        if len(self.module_dirs) == 1:
+            where = f"module {self.module_dirs[0] or '.'}"
+        else:
+            where = self.go_work_path or "a synthesized workspace"
+        return f"Compile {len(self.targets)} Go {noun}s in {where}"
+
+
+_FILE_POSITION_RE = re.compile(r"^(?:\./)?(?P<path>[^\s:]+\.[A-Za-z0-9]+):\d+")
+
+
+def _owning_module_dir(line: str, module_dirs: Sequence[str]) -> str | None:
+    match = _FILE_POSITION_RE.match(line)
+    if not match:
+        return None
+    path = match.group("path")
+    build_root = get_buildroot()
+    if os.path.isabs(path) and path.startswith(f"{build_root}{os.sep}"):
+        path = os.path.relpath(path, build_root)
+    candidates = [d for d in module_dirs if not d or path.startswith(f"{d}/")]
+    if not candidates:
+        return None
+    return max(candidates, key=len)
+
+
+def split_build_output(output: str, module_dirs: Sequence[str]) -> dict[str, str]:
+    """Attribute the output of a batched `go build` to the modules which produced it.
+
+    `go build` groups compiler errors under a `# <import path>` header. Each group is assigned to
+    the module containing the files it mentions, as are standalone diagnostics with a file
+    position. Output which cannot be attributed (e.g. module resolution failures) is shared by
+    every module.
+    """
+    groups: list[list[str]] = []
+    for line in output.splitlines(keepends=True):
+        continues_group = bool(groups) and (
+            line[:1].isspace()
+            or (
+                groups[-1][0].startswith("# ")
+                and (_FILE_POSITION_RE.match(line) is not None or line.strip() == "too many errors")
+            )
+        )
+        if continues_group:
+            groups[-1].append(line)
+        else:
+            groups.append([line])
+
+    per_module: dict[str, list[str]] = defaultdict(list)
+    for group in groups:
+        owner = next(
+            (
+                module_dir
+                for module_dir in (_owning_module_dir(line, module_dirs) for line in group)
+                if module_dir is not None
+            ),
+            None,
+        )
+        for module_dir in module_dirs if owner is None else (owner,):
+            per_module[module_dir].extend(group)
+
+    return {module_dir: "".join(per_module[module_dir]) for module_dir in module_dirs}
+
+
+def _partition_into_batches(
+    targets: Iterable[_CheckTarget],
+    go_work_files: GoWorkFiles,
+    *,
+    batch_outside_workspaces: bool,
+    sandboxed: bool,
+) -> list[_CheckBatch]:
+    """Group the targets compiled by the same `go build`.
+
+    Targets in the same module or `go.work` workspace always share a build, so that the workspace's
+    module graph is loaded once. With `batch_outside_workspaces`, all of the targets outside of any
+    workspace share a build too.
+    """
+    groups: dict[tuple[str, str], list[_CheckTarget]] = defaultdict(list)
+    work_files: dict[tuple[str, str], GoWorkFile | None] = {}
+    for target in targets:
+        work_file = go_work_files.workspace_for(target.module_dir)
+        if work_file or batch_outside_workspaces:
+            key = (work_file.path if work_file else "", "")
+        else:
+            key = ("", target.module_dir)
+        groups[key].append(target)
+        work_files[key] = work_file
+    return [
+        _CheckBatch(
+            tuple(groups[key]),
+            go_work_path=work_file.path if work_file else None,
+            sandboxed=sandboxed,
+            workspace_module_dirs=tuple(work_file.module_dirs) if work_file else (),
+        )
+        for key, work_file in sorted(work_files.items())
+    ]
+
+
+@dataclass(frozen=True)
+class CompileLane:
+    """A sequence of `go build` processes which run one after another with a fixed worker share."""
+
+    process_indices: tuple[int, ...]
+    workers: int
+
+
+def schedule_compile_lanes(
+    num_processes: int,
+    *,
+    worker_budget: int,
+    max_concurrent_processes: int,
+    estimated_durations: Sequence[float] | None = None,
+) -> list[CompileLane]:
+    """Schedule `go build` processes so that their compile workers stay within a budget.
+
+    Each `go build` otherwise starts `GOMAXPROCS` compile workers, so running one process per
+    module at once oversubscribes the machine. Instead, processes are placed onto a number of lanes
+    bounded by the worker budget and by how many processes Pants will run at once. Lanes run
+    concurrently, the processes in a lane run sequentially, and each lane receives an equal share
+    of the budget (the remainder going to the first lanes).
+
+    Processes are placed longest-processing-time-first: in decreasing order of their estimated
+    duration, each goes onto the lane with the least estimated work so far. This keeps the
+    slowest modules off the tail of the run. Without estimates, processes are dealt round-robin.
+    """
+    if num_processes <= 0:
+        return []
+    durations = list(estimated_durations) if estimated_durations else [1.0] * num_processes
+    worker_budget = max(worker_budget, 1)
+    num_lanes = max(1, min(num_processes, max_concurrent_processes, worker_budget))
+    base_share, remainder = divmod(worker_budget, num_lanes)
+    lane_indices = partition_longest_first(durations, num_lanes)
+
+    return [
+        CompileLane(
+            process_indices=tuple(lane_indices[lane]),
+            workers=base_share + (1 if lane < remainder else 0),
+        )
+        for lane in range(num_lanes)
+    ]
+
+
+async def _execute_lane(
+    processes: Sequence[Process], environment: ProcessExecutionEnvironment | None
+) -> tuple[FallibleProcessResult, ...]:
+    results = []
+    for process in processes:
+        # NB: Processes in a lane deliberately run one after another to bound parallelism.
+        if environment is None:
+            result = await execute_process(process, **implicitly())  # noqa: PNT30
+        else:
+            result = await execute_process(process, environment)  # noqa: PNT30
+        results.append(result)
+    return tuple(results)
+
+
+def _uses_build_json(goroot: GoRoot, golang_subsystem: GolangSubsystem) -> bool:
+    """Whether build output is a stream of JSON build events, which needs Go 1.24+."""
+    return golang_subsystem.check_mode == GoCheckMode.BUILD and goroot.is_compatible_version("1.24")
+
+
 def _process_for_compilation(
-    field_set: GoCheckModuleFieldSet, goroot: GoRoot, env_vars: EnvironmentVars
+    batch: _CheckBatch,
+    goroot: GoRoot,
+    go_cache_dirs: GoCacheDirs,
+    golang_subsystem: GolangSubsystem,
+    env_vars: EnvironmentVars,
+    input_digest: Digest,
+    sandbox: GoSandbox | None,
+    compile_workers: int,
+    cgo_env: GoCgoEnv,
 ) -> Process:
-    spec_path = field_set.address.spec_path
+    if golang_subsystem.check_mode == GoCheckMode.COMPILE_ONLY:
+        # `go list -export` compiles each package to produce its export data, but never links.
+        # The template suppresses the usual listing, leaving only compiler errors.
+        argv = [os.path.join(goroot.path, "bin", "go"), "list", "-export", "-f={{/* */}}"]
+    else:
+        # `go build` of a single `main` package would otherwise write its binary into the working
+        # directory. Go discards the output for `/dev/null`, however many packages are built.
+        argv = [os.path.join(goroot.path, "bin", "go"), "build", "-o", "/dev/null"]
+    argv.extend([f"-p={compile_workers}", f"-debug-actiongraph={{chroot}}/{_ACTION_GRAPH_FILE}"])
+    if _uses_build_json(goroot, golang_subsystem):
+        argv.append("-json")
+    argv.extend(dict.fromkeys(target.package_pattern for target in batch.targets))
+
+    if sandbox:
+        # Only inputs which affect the build may appear in the environment, since it is part of the
+        # cache key. In particular, the host's `PATH` is only passed with cgo, to find the C
+        # toolchain.
+        env = {**sandbox.env, **cgo_env.env}
+        input_digest = sandbox.digest
+    else:
+        env = {**env_vars, **go_cache_dirs.env}
+        if batch.go_work_path:
+            env["GOWORK"] = os.path.join(get_buildroot(), batch.go_work_path)
+        elif batch.needs_synthesized_go_work:
+            env["GOWORK"] = f"{{chroot}}/{_SYNTHESIZED_GO_WORK_FILE}"
+    env["GOMAXPROCS"] = str(compile_workers)
 
     process = Process(
-        argv=[os.path.join(goroot.path, "bin", "go"), "build", f"./{spec_path}"],
-        description=f"Compile Go module at {spec_path}",
-        cache_scope=ProcessCacheScope.PER_SESSION,
-        env=env_vars,
+        argv=argv,
+        description=batch.description,
+        input_digest=input_digest,
+        cache_scope=ProcessCacheScope.SUCCESSFUL if sandbox else ProcessCacheScope.PER_SESSION,
+        append_only_caches=SANDBOX_APPEND_ONLY_CACHES if sandbox else None,
+        env=env,
+        output_files=(_ACTION_GRAPH_FILE,),
     )
 
     return process
 
 
-@rule(desc="Check Go compilation", level=LogLevel.DEBUG)
-async def check_go_module(
-    request: GoCheckModuleRequest, goroot: GoRoot, platform: Platform
+def _attribute_package_results(
+    batch: _CheckBatch,
+    package_results: Iterable[GoPackageBuildResult],
+    module_paths: GoModulePaths,
+) -> dict[str, list[GoPackageBuildResult]]:
+    """Group the results of first-party packages by the build directory they were checked for.
+
+    Module targets own every package beneath them (except those of nested modules), while package
+    targets own only their own package.
+    """
+    by_build_dir: dict[str, list[GoPackageBuildResult]] = {
+        build_dir: [] for build_dir in batch.build_dirs
+    }
+    for package_result in package_results:
+        owner = _owning_target(batch, module_paths.package_dir(package_result.import_path))
+        if owner is not None:
+            by_build_dir[owner.build_dir].append(package_result)
+    return by_build_dir
+
+
+def _owning_target(batch: _CheckBatch, package_dir: str | None) -> _CheckTarget | None:
+    if package_dir is None:
+        return None
+    candidates = [
+        target
+        for target in batch.targets
+        if package_dir == target.build_dir
+        or (
+            not target.is_package
+            and (not target.build_dir or package_dir.startswith(f"{target.build_dir}/"))
+        )
+    ]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda target: len(target.build_dir))
+
+
+def _report_entries(
+    batch: _CheckBatch,
+    package_results: Iterable[GoPackageBuildResult],
+    module_paths: GoModulePaths,
+) -> Iterator[dict[str, Any]]:
+    for package_result in package_results:
+        package_dir = module_paths.package_dir(package_result.import_path)
+        owner = _owning_target(batch, package_dir)
+        yield {
+            "import_path": package_result.import_path,
+            "dir": package_dir,
+            "target": owner.address.spec if owner else None,
+            "status": package_result.status.value,
+            "duration_seconds": round(package_result.duration, 6),
+        }
+
+
+def _partition_description(build_dir: str, package_results: Sequence[GoPackageBuildResult]) -> str:
+    name = build_dir or "."
+    if not package_results:
+        return name
+    return f"{name} ({summarize_package_results(package_results)})"
+
+
+async def _check_targets(
+    targets: Sequence[_CheckTarget],
+    *,
+    tool_name: str,
+    goroot: GoRoot,
+    go_cache_dirs: GoCacheDirs,
+    golang_subsystem: GolangSubsystem,
+    global_options: GlobalOptions,
+    platform: Platform,
 ) -> CheckResults:
-    process_execution_environment = ProcessExecutionEnvironment(
-        environment_name=None,
-        platform=platform.value,
-        docker_image=None,
-        remote_execution=False,
-        remote_execution_extra_platform_properties=(),
-        execute_in_workspace=True,
+    sandboxed = golang_subsystem.check_in_sandbox
+    process_execution_environment = (
+        None
+        if sandboxed
+        else ProcessExecutionEnvironment(
+            environment_name=None,
+            platform=platform.value,
+            docker_image=None,
+            remote_execution=False,
+            remote_execution_extra_platform_properties=(),
+            execute_in_workspace=True,
+        )
+    )
+
+    env_vars, cgo_env = await concurrently(
+        environment_vars_subset(
+            **implicitly(EnvironmentVarsRequest(["PATH", "HOME"], allowed=["PATH", "HOME"]))
+        ),
+        setup_go_cgo_env(**implicitly()),
+    )
+
+    go_work_files = await find_go_work_files(
+        FindGoWorkFilesRequest(tuple(dict.fromkeys(target.module_dir for target in targets)))
+    )
+    batches = _partition_into_batches(
+        targets,
+        go_work_files,
+        batch_outside_workspaces=golang_subsystem.batch_check,
+        sandboxed=sandboxed,
     )
 
-    env_vars = await environment_vars_subset(
-        **implicitly(EnvironmentVarsRequest(["PATH", "HOME"], allowed=["PATH", "HOME"]))
+    synthesized_go_work_digests = await concurrently(
+        create_digest(
+            CreateDigest(
+                [
+                    FileContent(
+                        _SYNTHESIZED_GO_WORK_FILE,
+                        synthesize_go_work(
+                            batch.module_dirs,
+                            go_version=go_work_version(goroot),
+                            base_dir=get_buildroot(),
+                        ),
+                    )
+                ]
+            )
+        )
+        for batch in batches
+        if batch.needs_synthesized_go_work
+    )
+    synthesized_go_work_digests_iter = iter(synthesized_go_work_digests)
+    input_digests = [
+        next(synthesized_go_work_digests_iter) if batch.needs_synthesized_go_work else EMPTY_DIGEST
+        for batch in batches
+    ]
+
+    sandboxes: Sequence[GoSandbox | None] = [None] * len(batches)
+    if sandboxed:
+        sandboxes = await concurrently(
+            setup_go_sandbox(GoSandboxRequest(batch.sandbox_module_dirs), **implicitly())
+            for batch in batches
+        )
+
+    decay = golang_subsystem.check_duration_decay
+    if not 0 < decay <= 1:
+        raise OptionsError(
+            f"The option `[{GolangSubsystem.options_scope}].check_duration_decay` must be greater "
+            f"than 0 and at most 1, but was {decay}."
+        )
+    duration_history = read_duration_history(go_cache_dirs.check_durations_file)
+    lanes = schedule_compile_lanes(
+        len(batches),
+        worker_budget=golang_subsystem.build_parallelism or os.cpu_count() or 1,
+        max_concurrent_processes=global_options.process_execution_local_parallelism,
+        estimated_durations=estimate_durations(
+            [batch.history_key for batch in batches], duration_history
+        ),
     )
+    workers_by_batch = {i: lane.workers for lane in lanes for i in lane.process_indices}
 
     processes = [
-        _process_for_compilation(field_set, goroot=goroot, env_vars=env_vars)
-        for field_set in request.field_sets
+        _process_for_compilation(
+            batch,
+            goroot=goroot,
+            go_cache_dirs=go_cache_dirs,
+            golang_subsystem=golang_subsystem,
+            env_vars=env_vars,
+            input_digest=input_digests[i],
+            sandbox=sandboxes[i],
+            compile_workers=workers_by_batch[i],
+            cgo_env=cgo_env,
+        )
+        for i, batch in enumerate(batches)
     ]
 
-    results = await concurrently(
-        (execute_process(process, process_execution_environment) for process in processes)
+    lane_results = await concurrently(
+        _execute_lane([processes[i] for i in lane.process_indices], process_execution_environment)
+        for lane in lanes
     )
+    results_by_batch = {
+        i: result
+        for lane, results_in_lane in zip(lanes, lane_results)
+        for i, result in zip(lane.process_indices, results_in_lane)
+    }
+    results = [results_by_batch[i] for i in range(len(batches))]
 
-    check_results = [
-        CheckResult(
-            result.exit_code,
-            stdout=result.stdout.decode(errors="replace"),
-            stderr=result.stderr.decode(errors="replace"),
+    observed_durations = {
+        batch.history_key: result.metadata.total_elapsed_ms / 1000
+        for batch, result in zip(batches, results)
+        if result.metadata.total_elapsed_ms is not None
+    }
+    if observed_durations:
+        write_duration_history(
+            go_cache_dirs.check_durations_file,
+            duration_history.updated(
+                observed_durations,
+                decay=decay,
+                max_age=golang_subsystem.check_duration_max_age,
+            ),
         )
-        for result in results
+
+    all_digest_contents = await concurrently(
+        get_digest_contents(result.output_digest) for result in results
+    )
+    action_graphs = [
+        next((fc.content for fc in digest_contents if fc.path == _ACTION_GRAPH_FILE), None)
+        for digest_contents in all_digest_contents
     ]
 
-    return CheckResults(check_results, checker_name=request.tool_name)
+    if golang_subsystem.record_build_cache_stats:
+        stats = GoBuildCacheStats()
+        for action_graph in action_graphs:
+            if action_graph:
+                stats += GoBuildCacheStats.from_action_graph(action_graph)
+        logger.debug(f"Go build cache: {stats.hits} hits, {stats.misses} misses.")
+        write_check_stats(go_cache_dirs.check_stats_file, stats)
+
+    module_paths = await find_go_module_paths(
+        GoModulePathsRequest(tuple(sorted({target.module_dir for target in targets})))
+    )
+
+    check_results = []
+    report_entries: list[dict[str, Any]] = []
+    for batch, result, action_graph in zip(batches, results, action_graphs):
+        stdout = result.stdout.decode(errors="replace")
+        stderr = result.stderr.decode(errors="replace")
+        failed_import_paths: frozenset[str] = frozenset()
+        if _uses_build_json(goroot, golang_subsystem):
+            # With `-json`, compiler output is a stream of build events on stdout.
+            rendered, failed_import_paths = render_build_json(stdout)
+            stdout, stderr = "", rendered + stderr
+
+        package_results = package_build_results(action_graph) if action_graph else ()
+        package_results = tuple(
+            (
+                dataclasses.replace(package_result, status=GoPackageBuildStatus.FAILED)
+                if package_result.import_path in failed_import_paths
+                else package_result
+            )
+            for package_result in package_results
+        )
+        results_by_build_dir = _attribute_package_results(batch, package_results, module_paths)
+        report_entries.extend(_report_entries(batch, package_results, module_paths))
+
+        if len(batch.targets) == 1:
+            build_dir = batch.targets[0].build_dir
+            check_results.append(
+                CheckResult(
+                    result.exit_code,
+                    stdout=stdout,
+                    stderr=stderr,
+                    partition_description=(
+                        _partition_description(build_dir, results_by_build_dir[build_dir])
+                        if package_results
+                        else None
+                    ),
+                )
+            )
+            continue
+
+        target_stdouts = split_build_output(stdout, batch.build_dirs)
+        target_stderrs = split_build_output(stderr, batch.build_dirs)
+        for build_dir in dict.fromkeys(batch.build_dirs):
+            has_output = bool(target_stdouts[build_dir] or target_stderrs[build_dir])
+            check_results.append(
+                CheckResult(
+                    result.exit_code if has_output else 0,
+                    stdout=target_stdouts[build_dir],
+                    stderr=target_stderrs[build_dir],
+                    partition_description=_partition_description(
+                        build_dir, results_by_build_dir[build_dir]
+                    ),
+                )
+            )
+
+    if golang_subsystem.check_report:
+        write_build_report(
+            os.path.join(get_buildroot(), golang_subsystem.check_report), report_entries
+        )
+
+    return CheckResults(check_results, checker_name=tool_name)
+
+
+@rule(desc="Check Go compilation", level=LogLevel.DEBUG)
+async def check_go_module(
+    request: GoCheckModuleRequest,
+    goroot: GoRoot,
+    go_cache_dirs: GoCacheDirs,
+    golang_subsystem: GolangSubsystem,
+    global_options: GlobalOptions,
+    platform: Platform,
+) -> CheckResults:
+    if golang_subsystem.check_granularity != GoCheckGranularity.MODULE:
+        return CheckResults([], checker_name=request.tool_name)
+
+    return await _check_targets(
+        [
+            _CheckTarget(
+                field_set.address,
+                module_dir=field_set.address.spec_path,
+                build_dir=field_set.address.spec_path,
+            )
+            for field_set in request.field_sets
+        ],
+        tool_name=request.tool_name,
+        goroot=goroot,
+        go_cache_dirs=go_cache_dirs,
+        golang_subsystem=golang_subsystem,
+        global_options=global_options,
+        platform=platform,
+    )
+
+
+@rule(desc="Check Go package compilation", level=LogLevel.DEBUG)
+async def check_go_packages(
+    request: GoCheckPackageRequest,
+    goroot: GoRoot,
+    go_cache_dirs: GoCacheDirs,
+    golang_subsystem: GolangSubsystem,
+    global_options: GlobalOptions,
+    platform: Platform,
+) -> CheckResults:
+    if golang_subsystem.check_granularity != GoCheckGranularity.PACKAGE:
+        return CheckResults([], checker_name=request.tool_name)
+
+    owning_go_mods = await concurrently(
+        find_owning_go_mod(OwningGoModRequest(field_set.address))
+        for field_set in request.field_sets
+    )
+    return await _check_targets(
+        [
+            _CheckTarget(
+                field_set.address,
+                module_dir=owning_go_mod.module_dir,
+                build_dir=field_set.address.spec_path,
+                is_package=True,
+            )
+            for field_set, owning_go_mod in zip(request.field_sets, owning_go_mods)
+        ],
+        tool_name=request.tool_name,
+        goroot=goroot,
+        go_cache_dirs=go_cache_dirs,
+        golang_subsystem=golang_subsystem,
+        global_options=global_options,
+        platform=platform,
+    )
 
 
 def rules():
     return (
         *collect_rules(),
+        *go_cache.rules(),
+        *go_mod.rules(),
+        *go_work.rules(),
+        *go_sandbox.rules(),
         *goroot.rules(),
         UnionRule(CheckRequest, GoCheckModuleRequest),
+        UnionRule(CheckRequest, GoCheckPackageRequest),
     )
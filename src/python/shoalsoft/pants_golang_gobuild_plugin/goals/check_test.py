@@ -2,16 +2,22 @@
 # Copyright (C) 2024 Shoal Software LLC. All rights reserved.
 
 import io
+import os
 import textwrap
 
 import pytest
 
-from pants.core.goals.check import CheckResults
+from pants.core.goals.check import CheckResult, CheckResults
 from pants.engine.internals.native_engine import Address
 from pants.testutil.rule_runner import QueryRule, RuleRunner
 from shoalsoft.pants_golang_gobuild_plugin.goals.check import (
+    CompileLane,
     GoCheckModuleFieldSet,
     GoCheckModuleRequest,
+    GoCheckPackageFieldSet,
+    GoCheckPackageRequest,
+    schedule_compile_lanes,
+    split_build_output,
 )
 from shoalsoft.pants_golang_gobuild_plugin.register import rules as all_rules
 from shoalsoft.pants_golang_gobuild_plugin.register import target_types
@@ -23,6 +29,7 @@ def rule_runner() -> RuleRunner:
         rules=[
             *all_rules(),
             QueryRule(CheckResults, (GoCheckModuleRequest,)),
+            QueryRule(CheckResults, (GoCheckPackageRequest,)),
         ],
         target_types=target_types(),
     )
@@ -52,6 +59,11 @@ def _assert_results_success(check_results: CheckResults) -> None:
     raise AssertionError(f"Check was not successful.\n\n{msg.getvalue()}")
 
 
+def _results_by_partition(check_results: CheckResults) -> dict[str, CheckResult]:
+    # Partition descriptions are the target directory followed by a summary of package results.
+    return {(r.partition_description or "").split(" (")[0]: r for r in check_results.results}
+
+
 def test_build_go_module_success(rule_runner: RuleRunner) -> None:
     rule_runner.write_files(
         {
@@ -75,3 +87,246 @@ def test_build_go_module_success(rule_runner: RuleRunner) -> None:
     )
     results = _compile(rule_runner, Address("", target_name="mod"))
     _assert_results_success(results)
+
+
+def test_check_covers_nested_packages_in_go_work_workspace(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "ws/go.work": "go 1.21\n\nuse (\n\t./a\n\t./b\n)\n",
+            "ws/a/BUILD": "go_module(name='mod')\n",
+            "ws/a/go.mod": "module example.com/a\ngo 1.21\n",
+            # `example.com/b` is only resolvable through the workspace.
+            "ws/a/sub/sub.go": textwrap.dedent(
+                """\
+                package sub
+
+                import "example.com/b"
+
+                func Sub() int { return b.B() }
+                """
+            ),
+            "ws/b/BUILD": "go_module(name='mod')\n",
+            "ws/b/go.mod": "module example.com/b\ngo 1.21\n",
+            "ws/b/b.go": "package b\n\nfunc B() int { return 1 }\n",
+        }
+    )
+    _assert_results_success(_compile(rule_runner, Address("ws/a", target_name="mod")))
+
+    # Packages nested beneath the module root are compiled too.
+    rule_runner.write_files({"ws/a/sub/sub.go": 'package sub\n\nfunc Sub() int { return "s" }\n'})
+    check_results = _compile(rule_runner, Address("ws/a", target_name="mod"))
+    assert check_results.exit_code != 0
+    assert "sub.go" in check_results.results[0].stderr
+
+
+def test_batched_check_attributes_errors_to_modules(rule_runner: RuleRunner) -> None:
+    rule_runner.set_options(
+        ["--golang2-go-search-paths=['<PATH>']", "--golang2-batch-check"],
+        env_inherit={"PATH", "HOME"},
+    )
+    rule_runner.write_files(
+        {
+            "a/BUILD": "go_module(name='mod')\n",
+            "a/go.mod": "module example.com/a\ngo 1.16\n",
+            "a/a.go": "package a\n\nfunc A() int { return 1 }\n",
+            "b/BUILD": "go_module(name='mod')\n",
+            "b/go.mod": "module example.com/b\ngo 1.16\n",
+            "b/b.go": 'package b\n\nfunc B() int { return "b" }\n',
+        }
+    )
+    field_sets = [
+        GoCheckModuleFieldSet.create(rule_runner.get_target(Address(d, target_name="mod")))
+        for d in ("a", "b")
+    ]
+    check_results = rule_runner.request(CheckResults, [GoCheckModuleRequest(field_sets=field_sets)])
+    results_by_module = _results_by_partition(check_results)
+    assert results_by_module["a"].exit_code == 0
+    assert results_by_module["b"].exit_code != 0
+    assert "b/b.go" in results_by_module["b"].stderr
+    assert "b/b.go" not in results_by_module["a"].stderr
+
+
+def test_sandboxed_check_only_sees_module_sources(rule_runner: RuleRunner) -> None:
+    rule_runner.set_options(
+        ["--golang2-go-search-paths=['<PATH>']", "--golang2-check-in-sandbox"],
+        env_inherit={"PATH", "HOME"},
+    )
+    rule_runner.write_files(
+        {
+            "a/BUILD": "go_module(name='mod')\n",
+            "a/go.mod": "module example.com/a\ngo 1.16\n",
+            "a/a.go": "package a\n\nfunc A() int { return 1 }\n",
+            # A broken nested module is not part of `a` and so must not be compiled with it.
+            "a/nested/go.mod": "module example.com/nested\ngo 1.16\n",
+            "a/nested/nested.go": 'package nested\n\nfunc N() int { return "n" }\n',
+        }
+    )
+    check_results = _compile(rule_runner, Address("a", target_name="mod"))
+    _assert_results_success(check_results)
+
+    rule_runner.write_files({"a/a.go": 'package a\n\nfunc A() int { return "a" }\n'})
+    check_results = _compile(rule_runner, Address("a", target_name="mod"))
+    assert check_results.exit_code != 0
+    assert "a/a.go" in check_results.results[0].stderr
+
+
+def test_sandboxed_check_includes_go_work_modules(rule_runner: RuleRunner) -> None:
+    rule_runner.set_options(
+        ["--golang2-go-search-paths=['<PATH>']", "--golang2-check-in-sandbox"],
+        env_inherit={"PATH", "HOME"},
+    )
+    rule_runner.write_files(
+        {
+            "ws/go.work": "go 1.21\n\nuse (\n\t./a\n\t./b\n)\n",
+            "ws/a/BUILD": "go_module(name='mod')\n",
+            "ws/a/go.mod": "module example.com/a\ngo 1.21\n",
+            # `example.com/b` is only resolvable through the workspace, and is not requested.
+            "ws/a/a.go": 'package a\n\nimport "example.com/b"\n\nfunc A() int { return b.B() }\n',
+            "ws/b/BUILD": "go_module(name='mod')\n",
+            "ws/b/go.mod": "module example.com/b\ngo 1.21\n",
+            "ws/b/b.go": "package b\n\nfunc B() int { return 1 }\n",
+        }
+    )
+    _assert_results_success(_compile(rule_runner, Address("ws/a", target_name="mod")))
+
+
+def test_package_granularity_compiles_only_requested_packages(rule_runner: RuleRunner) -> None:
+    rule_runner.set_options(
+        ["--golang2-go-search-paths=['<PATH>']", "--golang2-check-granularity=package"],
+        env_inherit={"PATH", "HOME"},
+    )
+    rule_runner.write_files(
+        {
+            "mod/BUILD": "go_module(name='mod')\n",
+            "mod/go.mod": "module example.com/mod\ngo 1.16\n",
+            "mod/lib/BUILD": "go_package()\n",
+            "mod/lib/lib.go": "package lib\n\nfunc Lib() int { return 1 }\n",
+            "mod/app/BUILD": "go_package()\n",
+            "mod/app/app.go": textwrap.dedent(
+                """\
+                package app
+
+                import "example.com/mod/lib"
+
+                func App() int { return lib.Lib() }
+                """
+            ),
+            "mod/broken/BUILD": "go_package()\n",
+            "mod/broken/broken.go": 'package broken\n\nfunc Broken() int { return "b" }\n',
+        }
+    )
+
+    def check_packages(*dirs: str) -> CheckResults:
+        field_sets = [
+            GoCheckPackageFieldSet.create(rule_runner.get_target(Address(d))) for d in dirs
+        ]
+        return rule_runner.request(CheckResults, [GoCheckPackageRequest(field_sets=field_sets)])
+
+    _assert_results_success(check_packages("mod/app", "mod/lib"))
+
+    check_results = check_packages("mod/app", "mod/broken")
+    results_by_package = _results_by_partition(check_results)
+    assert results_by_package["mod/app"].exit_code == 0
+    assert results_by_package["mod/broken"].exit_code != 0
+    assert "broken.go" in results_by_package["mod/broken"].stderr
+    assert "1 failed" in (results_by_package["mod/broken"].partition_description or "")
+
+    # Modules are not checked at package granularity.
+    module_results = _compile(rule_runner, Address("mod", target_name="mod"))
+    assert not module_results.results
+
+
+def test_build_check_does_not_write_binaries(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "BUILD": "go_module(name='mod')\n",
+            "go.mod": "module example.com/cmd\ngo 1.16\n",
+            "main.go": "package main\n\nfunc main() {}\n",
+        }
+    )
+    _assert_results_success(_compile(rule_runner, Address("", target_name="mod")))
+    assert not os.path.exists(os.path.join(rule_runner.build_root, "cmd"))
+
+
+def test_compile_only_check_does_not_link(rule_runner: RuleRunner) -> None:
+    rule_runner.set_options(
+        ["--golang2-go-search-paths=['<PATH>']", "--golang2-check-mode=compile-only"],
+        env_inherit={"PATH", "HOME"},
+    )
+    rule_runner.write_files(
+        {
+            "BUILD": "go_module(name='mod')\n",
+            "go.mod": "module example.com/cmd\ngo 1.16\n",
+            "main.go": "package main\n\nfunc main() {}\n",
+        }
+    )
+    _assert_results_success(_compile(rule_runner, Address("", target_name="mod")))
+    # `go build` of a single `main` package would have written the `cmd` binary.
+    assert not os.path.exists(os.path.join(rule_runner.build_root, "cmd"))
+
+    rule_runner.write_files({"main.go": 'package main\n\nfunc main() { var x int = "x" }\n'})
+    check_results = _compile(rule_runner, Address("", target_name="mod"))
+    assert check_results.exit_code != 0
+    assert "main.go" in check_results.results[0].stderr
+
+
+def test_split_build_output() -> None:
+    output = textwrap.dedent(
+        """\
+        a/x.go:3:2: no required module provides package example.com/missing
+        # example.com/b/cmd
+        b/cmd/main.go:2:27: cannot use "s" (untyped string constant) as int value
+        # example.com/root
+        ./root.go:3:1: syntax error: unexpected }
+        \tcontinuation of the previous error
+        go: some workspace-wide failure
+        """
+    )
+    assert split_build_output(output, ["", "a", "b"]) == {
+        "": "# example.com/root\n./root.go:3:1: syntax error: unexpected }\n"
+        "\tcontinuation of the previous error\ngo: some workspace-wide failure\n",
+        "a": "a/x.go:3:2: no required module provides package example.com/missing\n"
+        "go: some workspace-wide failure\n",
+        "b": '# example.com/b/cmd\nb/cmd/main.go:2:27: cannot use "s" (untyped string constant) '
+        "as int value\ngo: some workspace-wide failure\n",
+    }
+
+
+def test_schedule_compile_lanes() -> None:
+    # Fewer processes than the budget: each process runs at once with an equal share.
+    assert schedule_compile_lanes(2, worker_budget=16, max_concurrent_processes=8) == [
+        CompileLane((0,), 8),
+        CompileLane((1,), 8),
+    ]
+    # Pants only runs 4 processes at once, so the budget is split into 4 lanes.
+    assert schedule_compile_lanes(6, worker_budget=16, max_concurrent_processes=4) == [
+        CompileLane((0, 4), 4),
+        CompileLane((1, 5), 4),
+        CompileLane((2,), 4),
+        CompileLane((3,), 4),
+    ]
+    assert schedule_compile_lanes(3, worker_budget=7, max_concurrent_processes=3) == [
+        CompileLane((0,), 3),
+        CompileLane((1,), 2),
+        CompileLane((2,), 2),
+    ]
+    # 40 modules on a 16 worker budget never run more than 16 compile workers at once.
+    lanes = schedule_compile_lanes(40, worker_budget=16, max_concurrent_processes=64)
+    assert len(lanes) == 16
+    assert sum(lane.workers for lane in lanes) == 16
+    assert sorted(i for lane in lanes for i in lane.process_indices) == list(range(40))
+    assert schedule_compile_lanes(0, worker_budget=16, max_concurrent_processes=4) == []
+
+
+def test_schedule_compile_lanes_longest_first() -> None:
+    # The slowest module starts first on its own lane; the rest fill in around it.
+    lanes = schedule_compile_lanes(
+        5,
+        worker_budget=8,
+        max_concurrent_processes=2,
+        estimated_durations=[1.0, 10.0, 3.0, 4.0, 2.0],
+    )
+    assert lanes == [
+        CompileLane((1,), 4),
+        CompileLane((3, 2, 4, 0), 4),
+    ]
@@ -0,0 +1,180 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+from __future__ import annotations
+
+import os
+import shlex
+from dataclasses import dataclass
+
+from pants.core.goals.package import (
+    BuiltPackage,
+    BuiltPackageArtifact,
+    OutputPathField,
+    PackageFieldSet,
+)
+from pants.core.goals.run import RunFieldSet, RunInSandboxBehavior
+from pants.engine.env_vars import EnvironmentVarsRequest
+from pants.engine.fs import MergeDigests
+from pants.engine.internals.platform_rules import environment_vars_subset
+from pants.engine.intrinsics import merge_digests
+from pants.engine.process import Process, execute_process_or_raise
+from pants.engine.rules import collect_rules, concurrently, implicitly, rule
+from pants.engine.unions import UnionRule
+from pants.util.logging import LogLevel
+from shoalsoft.pants_golang_gobuild_plugin.target_types import (
+    GoAddressSanitizerEnabledField,
+    GoAssemblerFlagsField,
+    GoBinaryMainPackageField,
+    GoBinaryPgoField,
+    GoCgoEnabledField,
+    GoCompilerFlagsField,
+    GoLinkerFlagsField,
+    GoMemorySanitizerEnabledField,
+    GoRaceDetectorEnabledField,
+    GoStripSymbolsField,
+)
+from shoalsoft.pants_golang_gobuild_plugin.util_rules import (
+    binary,
+    go_mod,
+    goroot,
+    package_inputs,
+    pgo_profile,
+)
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.binary import (
+    GoBinaryMainPackageRequest,
+    determine_main_pkg_for_go_binary,
+)
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.go_cache import SANDBOX_APPEND_ONLY_CACHES
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.go_mod import (
+    OwningGoModRequest,
+    find_owning_go_mod,
+)
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.goroot import GoRoot
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.package_inputs import (
+    GoPackageInputsRequest,
+    find_go_package_inputs,
+)
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.pgo_profile import (
+    GoPgoProfileRequest,
+    find_go_pgo_profile,
+)
+
+# Flags which make the binary depend only on its inputs rather than on where and how it was built:
+# `-trimpath` drops sandbox paths, and `-buildvcs=false` drops the VCS state, which is not part of
+# the sandbox anyway.
+REPRODUCIBLE_BUILD_FLAGS = ("-trimpath", "-buildvcs=false")
+
+
+@dataclass(frozen=True)
+class GoBinaryFieldSet(PackageFieldSet, RunFieldSet):
+    required_fields = (GoBinaryMainPackageField,)
+    supports_debug_adapter = False
+    run_in_sandbox_behavior = RunInSandboxBehavior.RUN_REQUEST_HERMETIC
+
+    main: GoBinaryMainPackageField
+    output_path: OutputPathField
+    pgo: GoBinaryPgoField
+    cgo_enabled: GoCgoEnabledField
+    race: GoRaceDetectorEnabledField
+    msan: GoMemorySanitizerEnabledField
+    asan: GoAddressSanitizerEnabledField
+    assembler_flags: GoAssemblerFlagsField
+    compiler_flags: GoCompilerFlagsField
+    linker_flags: GoLinkerFlagsField
+    strip_symbols: GoStripSymbolsField
+
+    @property
+    def cgo(self) -> bool:
+        if self.cgo_enabled.value is not None:
+            return self.cgo_enabled.value
+        return self.race.value or self.msan.value or self.asan.value
+
+    def variant_flags(self) -> list[str]:
+        """The `go build` flags selecting this binary's build variant.
+
+        The flags are part of the build's argv, so each variant is cached separately by Pants, and
+        the Go build cache likewise keeps the compiled packages of each variant side by side.
+        """
+        flags = []
+        if self.race.value:
+            flags.append("-race")
+        if self.msan.value:
+            flags.append("-msan")
+        if self.asan.value:
+            flags.append("-asan")
+        if self.assembler_flags.value:
+            flags.append(f"-asmflags={shlex.join(self.assembler_flags.value)}")
+        if self.compiler_flags.value:
+            flags.append(f"-gcflags={shlex.join(self.compiler_flags.value)}")
+        linker_flags = [
+            *(self.linker_flags.value or ()),
+            *(("-s", "-w") if self.strip_symbols.value else ()),
+        ]
+        if linker_flags:
+            flags.append(f"-ldflags={shlex.join(linker_flags)}")
+        return flags
+
+
+@rule(desc="Package Go binary", level=LogLevel.DEBUG)
+async def package_go_binary(field_set: GoBinaryFieldSet, goroot: GoRoot) -> BuiltPackage:
+    main_pkg = await determine_main_pkg_for_go_binary(GoBinaryMainPackageRequest(field_set.main))
+    if main_pkg.is_third_party:
+        raise ValueError(
+            f"The `{field_set.main.alias}` field of {field_set.address} refers to the third-party "
+            f"package {main_pkg.import_path}, but only first-party main packages can be built."
+        )
+    owning_go_mod = await find_owning_go_mod(OwningGoModRequest(main_pkg.address))
+    inputs, pgo = await concurrently(
+        find_go_package_inputs(
+            GoPackageInputsRequest(owning_go_mod.module_dir, main_pkg.address.spec_path), goroot
+        ),
+        find_go_pgo_profile(GoPgoProfileRequest(field_set.pgo)),
+    )
+    input_digest, env_vars = await concurrently(
+        merge_digests(MergeDigests([inputs.sandbox.digest, pgo.digest])),
+        environment_vars_subset(**implicitly(EnvironmentVarsRequest(["PATH"], allowed=["PATH"]))),
+    )
+    env = {**inputs.sandbox.env, "CGO_ENABLED": "1" if field_set.cgo else "0"}
+    if field_set.cgo:
+        # The C toolchain is found on the `PATH`.
+        env["PATH"] = env_vars.get("PATH", "")
+
+    output_filename = field_set.output_path.value_or_default(file_ending=None)
+    result = await execute_process_or_raise(
+        **implicitly(
+            Process(
+                argv=[
+                    os.path.join(goroot.path, "bin", "go"),
+                    "build",
+                    *REPRODUCIBLE_BUILD_FLAGS,
+                    *field_set.variant_flags(),
+                    *([pgo.build_flag] if pgo.build_flag else []),
+                    "-o",
+                    f"{{chroot}}/{output_filename}",
+                    f"./{main_pkg.address.spec_path}",
+                ],
+                description=f"Build Go binary: {field_set.address}",
+                input_digest=input_digest,
+                # NB: Unless cgo is enabled, `PATH` is deliberately not passed: the binary should
+                # not depend on the C toolchain or anything else outside of the sandbox.
+                env=env,
+                append_only_caches=SANDBOX_APPEND_ONLY_CACHES,
+                output_files=(output_filename,),
+                level=LogLevel.DEBUG,
+            )
+        )
+    )
+    return BuiltPackage(result.output_digest, (BuiltPackageArtifact(output_filename),))
+
+
+def rules():
+    return (
+        *collect_rules(),
+        *binary.rules(),
+        *go_mod.rules(),
+        *goroot.rules(),
+        *package_inputs.rules(),
+        *pgo_profile.rules(),
+        UnionRule(PackageFieldSet, GoBinaryFieldSet),
+    )
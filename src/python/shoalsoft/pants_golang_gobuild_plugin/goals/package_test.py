@@ -0,0 +1,118 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+import os
+import subprocess
+import textwrap
+
+import pytest
+
+from pants.core.goals.package import BuiltPackage
+from pants.engine.internals.native_engine import Address
+from pants.testutil.rule_runner import QueryRule, RuleRunner
+from shoalsoft.pants_golang_gobuild_plugin.goals.package import GoBinaryFieldSet
+from shoalsoft.pants_golang_gobuild_plugin.register import rules as all_rules
+from shoalsoft.pants_golang_gobuild_plugin.register import target_types
+
+
+@pytest.fixture
+def rule_runner() -> RuleRunner:
+    rr = RuleRunner(
+        rules=[
+            *all_rules(),
+            QueryRule(BuiltPackage, (GoBinaryFieldSet,)),
+        ],
+        target_types=target_types(),
+    )
+    rr.set_options(["--golang2-go-search-paths=['<PATH>']"], env_inherit={"PATH", "HOME"})
+    return rr
+
+
+def _package(rule_runner: RuleRunner, address: Address) -> BuiltPackage:
+    field_set = GoBinaryFieldSet.create(rule_runner.get_target(address))
+    return rule_runner.request(BuiltPackage, [field_set])
+
+
+def test_package_go_binary(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "mod/BUILD": "go_module(name='mod')\n",
+            "mod/go.mod": "module example.com/mod\ngo 1.21\n",
+            "mod/greeting/BUILD": "go_package()\n",
+            "mod/greeting/greeting.go": textwrap.dedent(
+                """\
+                package greeting
+
+                const Hello = "Hello from Go!"
+                """
+            ),
+            "mod/cmd/hello/BUILD": "go_package()\ngo_binary(name='bin')\n",
+            "mod/cmd/hello/main.go": textwrap.dedent(
+                """\
+                package main
+
+                import (
+                    "fmt"
+
+                    "example.com/mod/greeting"
+                )
+
+                func main() { fmt.Println(greeting.Hello) }
+                """
+            ),
+            "mod/unrelated/BUILD": "go_package()\n",
+            "mod/unrelated/unrelated.go": "package unrelated\n",
+        }
+    )
+    address = Address("mod/cmd/hello", target_name="bin")
+    built_package = _package(rule_runner, address)
+    (artifact,) = built_package.artifacts
+    assert artifact.relpath == "mod.cmd.hello/bin"
+
+    rule_runner.write_digest(built_package.digest)
+    result = subprocess.run(
+        [os.path.join(rule_runner.build_root, artifact.relpath)], capture_output=True, check=True
+    )
+    assert result.stdout == b"Hello from Go!\n"
+
+    # Packages outside of the binary's dependencies are not inputs of its build.
+    rule_runner.write_files({"mod/unrelated/unrelated.go": "package unrelated\n\nvar X = 1\n"})
+    assert _package(rule_runner, address).digest == built_package.digest
+
+
+def test_variant_flags(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "mod/go.mod": "module example.com/mod\ngo 1.21\n",
+            "mod/main.go": "package main\n\nfunc main() {}\n",
+            "mod/BUILD": textwrap.dedent(
+                """\
+                go_module(name='mod')
+                go_package(name='pkg')
+                go_binary(name='dev', race=True, compiler_flags=['-N', '-l'])
+                go_binary(
+                    name='release',
+                    linker_flags=['-X', 'main.version=1.0 beta'],
+                    strip_symbols=True,
+                )
+                go_binary(name='nocgo', race=True, cgo_enabled=False)
+                """
+            ),
+        }
+    )
+
+    def field_set(name: str) -> GoBinaryFieldSet:
+        return GoBinaryFieldSet.create(rule_runner.get_target(Address("mod", target_name=name)))
+
+    dev = field_set("dev")
+    assert dev.cgo
+    assert dev.variant_flags() == ["-race", "-gcflags=-N -l"]
+
+    release = field_set("release")
+    assert not release.cgo
+    assert release.variant_flags() == ["-ldflags=-X 'main.version=1.0 beta' -s -w"]
+
+    assert not field_set("nocgo").cgo
+
+    (artifact,) = _package(rule_runner, Address("mod", target_name="release")).artifacts
+    assert artifact.relpath == "mod/release"
@@ -0,0 +1,217 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+from __future__ import annotations
+
+import os
+
+from pants.core.util_rules.environments import ChosenLocalEnvironmentName
+from pants.engine.console import Console
+from pants.engine.env_vars import EnvironmentVarsRequest
+from pants.engine.environment import EnvironmentName
+from pants.engine.fs import (
+    AddPrefix,
+    CreateDigest,
+    Digest,
+    FileContent,
+    GlobMatchErrorBehavior,
+    MergeDigests,
+    PathGlobs,
+    Workspace,
+)
+from pants.engine.goal import Goal, GoalSubsystem
+from pants.engine.internals.platform_rules import environment_vars_subset
+from pants.engine.intrinsics import (
+    add_prefix,
+    create_digest,
+    digest_to_snapshot,
+    execute_process,
+    get_digest_contents,
+    merge_digests,
+    path_globs_to_digest,
+)
+from pants.engine.process import Process, ProcessCacheScope
+from pants.engine.rules import collect_rules, goal_rule, implicitly
+from pants.engine.target import Targets
+from pants.option.option_types import StrListOption, StrOption
+from pants.util.logging import LogLevel
+from pants.util.strutil import softwrap
+from shoalsoft.pants_golang_gobuild_plugin.target_types import GoPackageSourcesField
+from shoalsoft.pants_golang_gobuild_plugin.util_rules import go_mod, goroot, package_inputs
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.go_cache import (
+    SANDBOX_APPEND_ONLY_CACHES,
+    SANDBOX_CACHE_ENV,
+)
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.go_mod import (
+    OwningGoModRequest,
+    find_owning_go_mod,
+)
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.goroot import setup_goroot
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.package_inputs import (
+    GoPackageInputsRequest,
+    find_go_package_inputs,
+)
+
+# The CPU profile written by a package's benchmarks.
+_BENCH_PROFILE = "__cpu.pprof"
+
+_PROFILES_DIR = "__profiles"
+
+_MERGED_PROFILE = "__merged.pgo"
+
+
+class GoPgoSubsystem(GoalSubsystem):
+    name = "go-pgo"
+    help = softwrap(
+        """
+        Collect a CPU profile for profile-guided optimization of `go_binary` targets.
+
+        Runs the benchmarks of the given `go_package` targets with `-cpuprofile`, merges their
+        profiles and any `--profiles` (e.g. collected from production with `net/http/pprof`)
+        using `go tool pprof -proto`, and writes the result to `--output`. Check in that file and
+        point the `pgo` field of `go_binary` targets at it, or name it `default.pgo` in the main
+        package's directory.
+        """
+    )
+
+    output = StrOption(
+        default=None,
+        help="The path, relative to the build root, to write the merged profile to.",
+    )
+    profiles = StrListOption(
+        help="Paths, relative to the build root, of existing pprof CPU profiles to merge in.",
+    )
+    bench = StrOption(
+        default=".",
+        help="Profile only the benchmarks matching this regular expression.",
+    )
+    benchtime = StrOption(
+        default=None,
+        help="The time (e.g. `10s`) to run each benchmark for while profiling.",
+    )
+
+
+class GoPgoGoal(Goal):
+    subsystem_cls = GoPgoSubsystem
+    environment_behavior = Goal.EnvironmentBehavior.LOCAL_ONLY
+
+
+@goal_rule
+async def go_pgo(
+    console: Console,
+    targets: Targets,
+    go_pgo_subsystem: GoPgoSubsystem,
+    workspace: Workspace,
+    local_environment: ChosenLocalEnvironmentName,
+) -> GoPgoGoal:
+    output = go_pgo_subsystem.output
+    if not output:
+        console.print_stderr("Set `--go-pgo-output` to the path to write the merged profile to.")
+        return GoPgoGoal(exit_code=1)
+
+    environment = {local_environment.val: EnvironmentName}
+    go_root = await setup_goroot(**implicitly(environment))
+    go = os.path.join(go_root.path, "bin", "go")
+    env_vars = await environment_vars_subset(
+        **implicitly(
+            {
+                EnvironmentVarsRequest(["PATH"], allowed=["PATH"]): EnvironmentVarsRequest,
+                **environment,
+            }
+        )
+    )
+
+    profile_digests: list[Digest] = []
+    for i, tgt in enumerate(tgt for tgt in targets if tgt.has_field(GoPackageSourcesField)):
+        owning_go_mod = await find_owning_go_mod(  # noqa: PNT30: profile one package at a time
+            OwningGoModRequest(tgt.address), **implicitly(environment)
+        )
+        inputs = await find_go_package_inputs(  # noqa: PNT30: profile one package at a time
+            GoPackageInputsRequest(owning_go_mod.module_dir, tgt.address.spec_path),
+            **implicitly(environment),
+        )
+        argv = [
+            go,
+            "test",
+            "-run=^$",
+            f"-bench={go_pgo_subsystem.bench}",
+            f"-cpuprofile={{chroot}}/{_BENCH_PROFILE}",
+        ]
+        if go_pgo_subsystem.benchtime:
+            argv.append(f"-benchtime={go_pgo_subsystem.benchtime}")
+        argv.append(f"./{tgt.address.spec_path}")
+        result = await execute_process(  # noqa: PNT30: profile one package at a time
+            Process(
+                argv=argv,
+                description=f"Profile Go benchmarks: {tgt.address}",
+                input_digest=inputs.sandbox.digest,
+                env={"PATH": env_vars.get("PATH", ""), **inputs.sandbox.env},
+                append_only_caches=SANDBOX_APPEND_ONLY_CACHES,
+                output_files=(_BENCH_PROFILE,),
+                cache_scope=ProcessCacheScope.PER_SESSION,
+                level=LogLevel.DEBUG,
+            ),
+            **implicitly(environment),
+        )
+        if result.exit_code != 0:
+            console.print_stderr(
+                f"Benchmarks of {tgt.address} failed:\n{result.stdout.decode(errors='replace')}"
+                f"{result.stderr.decode(errors='replace')}"
+            )
+            return GoPgoGoal(exit_code=result.exit_code)
+        # Packages without benchmarks write no profile.
+        profile_digests.append(
+            await add_prefix(  # noqa: PNT30: profile one package at a time
+                AddPrefix(result.output_digest, os.path.join(_PROFILES_DIR, str(i)))
+            )
+        )
+
+    if go_pgo_subsystem.profiles:
+        profile_digests.append(
+            await path_globs_to_digest(
+                PathGlobs(
+                    go_pgo_subsystem.profiles,
+                    glob_match_error_behavior=GlobMatchErrorBehavior.error,
+                    description_of_origin="the `[go-pgo].profiles` option",
+                )
+            )
+        )
+    input_digest = await merge_digests(MergeDigests(profile_digests))
+    snapshot = await digest_to_snapshot(input_digest)
+    if not snapshot.files:
+        console.print_stderr("No CPU profiles were collected: no benchmarks or profiles to merge.")
+        return GoPgoGoal(exit_code=1)
+
+    merge_result = await execute_process(
+        Process(
+            argv=[go, "tool", "pprof", "-proto", f"-output={_MERGED_PROFILE}", *snapshot.files],
+            description=f"Merge {len(snapshot.files)} CPU profiles",
+            input_digest=input_digest,
+            env={"PATH": env_vars.get("PATH", ""), **SANDBOX_CACHE_ENV},
+            append_only_caches=SANDBOX_APPEND_ONLY_CACHES,
+            output_files=(_MERGED_PROFILE,),
+            level=LogLevel.DEBUG,
+        ),
+        **implicitly(environment),
+    )
+    if merge_result.exit_code != 0:
+        console.print_stderr(
+            f"Failed to merge CPU profiles:\n{merge_result.stderr.decode(errors='replace')}"
+        )
+        return GoPgoGoal(exit_code=merge_result.exit_code)
+
+    (merged_profile,) = await get_digest_contents(merge_result.output_digest)
+    workspace.write_digest(
+        await create_digest(CreateDigest([FileContent(output, merged_profile.content)]))
+    )
+    console.print_stdout(f"Wrote the merged profile of {len(snapshot.files)} profiles to {output}.")
+    return GoPgoGoal(exit_code=0)
+
+
+def rules():
+    return (
+        *collect_rules(),
+        *go_mod.rules(),
+        *goroot.rules(),
+        *package_inputs.rules(),
+    )
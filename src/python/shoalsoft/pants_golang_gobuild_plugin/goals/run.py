@@ -0,0 +1,35 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+from __future__ import annotations
+
+import os
+
+from pants.core.goals.run import RunRequest
+from pants.engine.rules import collect_rules, implicitly, rule
+from pants.util.logging import LogLevel
+from shoalsoft.pants_golang_gobuild_plugin.goals import package
+from shoalsoft.pants_golang_gobuild_plugin.goals.package import (
+    GoBinaryFieldSet,
+    package_go_binary,
+)
+
+
+@rule(desc="Run Go binary", level=LogLevel.DEBUG)
+async def create_go_binary_run_request(field_set: GoBinaryFieldSet) -> RunRequest:
+    # Under pantsd, `pants run` restarts `restartable=True` binaries when their sources change.
+    # Rebuilding is incremental: the build's inputs are only the main package's dependency
+    # closure, so edits elsewhere reuse the cached binary, and `go build` recompiles only the
+    # changed packages, reusing the rest from the persistent Go build cache.
+    binary = await package_go_binary(field_set, **implicitly())
+    artifact_relpath = binary.artifacts[0].relpath
+    assert artifact_relpath is not None
+    return RunRequest(digest=binary.digest, args=(os.path.join("{chroot}", artifact_relpath),))
+
+
+def rules():
+    return (
+        *collect_rules(),
+        *package.rules(),
+        *GoBinaryFieldSet.rules(),
+    )
@@ -0,0 +1,45 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+import pytest
+
+from pants.core.goals.run import RestartableField, RunRequest
+from pants.engine.fs import Digest, DigestContents
+from pants.engine.internals.native_engine import Address
+from pants.testutil.rule_runner import QueryRule, RuleRunner
+from shoalsoft.pants_golang_gobuild_plugin.goals.package import GoBinaryFieldSet
+from shoalsoft.pants_golang_gobuild_plugin.register import rules as all_rules
+from shoalsoft.pants_golang_gobuild_plugin.register import target_types
+
+
+@pytest.fixture
+def rule_runner() -> RuleRunner:
+    rr = RuleRunner(
+        rules=[
+            *all_rules(),
+            QueryRule(RunRequest, (GoBinaryFieldSet,)),
+            QueryRule(DigestContents, (Digest,)),
+        ],
+        target_types=target_types(),
+    )
+    rr.set_options(["--golang2-go-search-paths=['<PATH>']"], env_inherit={"PATH", "HOME"})
+    return rr
+
+
+def test_run_go_binary(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "mod/BUILD": "go_module(name='mod')\n",
+            "mod/go.mod": "module example.com/mod\ngo 1.21\n",
+            "mod/cmd/server/BUILD": "go_package()\ngo_binary(name='bin', restartable=True)\n",
+            "mod/cmd/server/main.go": "package main\n\nfunc main() {}\n",
+        }
+    )
+    tgt = rule_runner.get_target(Address("mod/cmd/server", target_name="bin"))
+    assert tgt[RestartableField].value
+
+    run_request = rule_runner.request(RunRequest, [GoBinaryFieldSet.create(tgt)])
+    assert run_request.args == ("{chroot}/mod.cmd.server/bin",)
+    (binary,) = rule_runner.request(DigestContents, [run_request.digest])
+    assert binary.path == "mod.cmd.server/bin"
+    assert binary.is_executable
@@ -0,0 +1,447 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import os
+import re
+from dataclasses import dataclass
+from typing import Any, Iterable, Sequence
+
+from pants.core.goals.test import (
+    TestDebugRequest,
+    TestExtraEnv,
+    TestFieldSet,
+    TestRequest,
+    TestResult,
+    TestSubsystem,
+)
+from pants.engine.env_vars import EnvironmentVarsRequest
+from pants.engine.fs import CreateDigest, Digest, FileContent, FileDigest, MergeDigests
+from pants.engine.internals.platform_rules import environment_vars_subset
+from pants.engine.intrinsics import (
+    create_digest,
+    digest_to_snapshot,
+    execute_process,
+    merge_digests,
+)
+from pants.engine.process import (
+    FallibleProcessResult,
+    InteractiveProcess,
+    Process,
+    ProcessCacheScope,
+)
+from pants.engine.rules import collect_rules, concurrently, implicitly, rule
+from pants.engine.target import Target
+from pants.util.frozendict import FrozenDict
+from pants.util.logging import LogLevel
+from shoalsoft.pants_golang_gobuild_plugin.subsystems.gotest import GoTestSubsystem
+from shoalsoft.pants_golang_gobuild_plugin.target_types import (
+    GoPackageSourcesField,
+    GoTestExtraEnvVarsField,
+    GoTestTimeoutField,
+    SkipGoTestsField,
+)
+from shoalsoft.pants_golang_gobuild_plugin.util_rules import (
+    coverage,
+    go_cache,
+    go_mod,
+    goroot,
+    package_inputs,
+)
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.coverage import (
+    COVERAGE_PROFILE,
+    GoCoverageData,
+)
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.duration_history import (
+    estimate_durations,
+    partition_longest_first,
+    read_duration_history,
+    write_duration_history,
+)
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.go_cache import (
+    SANDBOX_APPEND_ONLY_CACHES,
+    GoCacheDirs,
+)
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.go_mod import (
+    GoModulePathsRequest,
+    OwningGoModRequest,
+    find_go_module_paths,
+    find_owning_go_mod,
+)
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.go_sandbox import GoSandbox, setup_go_cgo_env
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.goroot import GoRoot
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.package_inputs import (
+    GoPackageInputsRequest,
+    find_go_package_inputs,
+)
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.test_events import (
+    GoTestRun,
+    junit_xml,
+    merge_retried_test_run,
+    merge_test_runs,
+    parse_test_events,
+)
+
+# The test binary compiled for sharded test runs.
+_TEST_BINARY = "__go_test.bin"
+
+# `-test.list` also lists benchmarks, which only run with `-test.bench`.
+_SHARDABLE_TEST_RE = re.compile(r"^(Test|Example|Fuzz)")
+
+# Smoothing of the recorded test function durations used to balance shards.
+_DURATION_DECAY = 0.5
+_DURATION_MAX_AGE = 50
+
+
+@dataclass(frozen=True)
+class GoTestFieldSet(TestFieldSet):
+    required_fields = (GoPackageSourcesField,)
+
+    sources: GoPackageSourcesField
+    timeout: GoTestTimeoutField
+    extra_env_vars: GoTestExtraEnvVarsField
+
+    @classmethod
+    def opt_out(cls, tgt: Target) -> bool:
+        return tgt.get(SkipGoTestsField).value
+
+
+class GoTestRequest(TestRequest):
+    tool_subsystem = GoTestSubsystem
+    field_set_type = GoTestFieldSet
+    supports_debug_adapter = False
+
+
+def _with_stdout(result: FallibleProcessResult, stdout: bytes) -> FallibleProcessResult:
+    # NB: Pants identifies process output by its SHA-256 digest.
+    return dataclasses.replace(
+        result,
+        stdout=stdout,
+        stdout_digest=FileDigest(hashlib.sha256(stdout).hexdigest(), len(stdout)),
+    )
+
+
+@dataclass(frozen=True)
+class _GoTestSetup:
+    """What every process testing a package needs."""
+
+    field_set: GoTestFieldSet
+    import_path: str
+    sandbox: GoSandbox
+    env: FrozenDict[str, str]
+    timeout: int | None
+    cache_scope: ProcessCacheScope
+    coverage: bool
+
+    @property
+    def pkg_dir(self) -> str:
+        return self.field_set.address.spec_path
+
+    def process(
+        self,
+        argv: Sequence[str],
+        *,
+        description: str,
+        input_digest: Digest | None = None,
+        **kwargs: Any,
+    ) -> Process:
+        return Process(
+            argv=argv,
+            description=description,
+            input_digest=input_digest or self.sandbox.digest,
+            env=self.env,
+            append_only_caches=SANDBOX_APPEND_ONLY_CACHES,
+            cache_scope=self.cache_scope,
+            level=LogLevel.DEBUG,
+            **kwargs,
+        )
+
+
+def _run_pattern(test_names: Iterable[str]) -> str:
+    # `-run` matches top-level names against the pattern before any `/`, so anchoring on the exact
+    # names selects just these tests (and all of their subtests).
+    return f"^({'|'.join(re.escape(name) for name in test_names)})$"
+
+
+async def _run_go_test(
+    setup: _GoTestSetup,
+    goroot: GoRoot,
+    args: Sequence[str],
+    *,
+    retry: bool = False,
+    run_pattern: str | None = None,
+    description: str,
+) -> tuple[FallibleProcessResult, GoTestRun, tuple[Digest, ...]]:
+    argv = [os.path.join(goroot.path, "bin", "go"), "test", "-json"]
+    if setup.timeout:
+        # NB: `go test` applies its timeout to running the test binary, but not to compiling it.
+        argv.append(f"-timeout={setup.timeout}s")
+    argv.extend(args)
+    if retry:
+        # A retry must re-run the tests rather than report results cached by `go test`.
+        argv.append("-count=1")
+    if run_pattern is not None:
+        argv.append(f"-run={run_pattern}")
+    if setup.coverage:
+        argv.append(f"-coverprofile={{chroot}}/{COVERAGE_PROFILE}")
+    argv.append(f"./{setup.pkg_dir}")
+
+    result = await execute_process(
+        setup.process(
+            argv,
+            description=description,
+            output_files=(COVERAGE_PROFILE,) if setup.coverage else (),
+        ),
+        **implicitly(),
+    )
+    return (
+        result,
+        parse_test_events(result.stdout.decode(errors="replace")),
+        (result.output_digest,) if setup.coverage else (),
+    )
+
+
+async def _run_sharded(
+    setup: _GoTestSetup,
+    goroot: GoRoot,
+    args: Sequence[str],
+    num_shards: int,
+    go_cache_dirs: GoCacheDirs,
+) -> tuple[FallibleProcessResult, GoTestRun, tuple[Digest, ...]]:
+    go = os.path.join(goroot.path, "bin", "go")
+    address = setup.field_set.address
+    compile_argv = [go, "test", "-c", "-o", f"{{chroot}}/{_TEST_BINARY}"]
+    if setup.coverage:
+        compile_argv.append("-cover")
+    compile_result = await execute_process(
+        setup.process(
+            [*compile_argv, *args, f"./{setup.pkg_dir}"],
+            description=f"Compile Go test binary: {address}",
+            output_files=(_TEST_BINARY,),
+        ),
+        **implicitly(),
+    )
+    compile_snapshot = await digest_to_snapshot(compile_result.output_digest)
+    if compile_result.exit_code != 0 or _TEST_BINARY not in compile_snapshot.files:
+        # Either the package failed to compile or it has no tests.
+        return (
+            compile_result,
+            parse_test_events(compile_result.stdout.decode(errors="replace")),
+            (),
+        )
+
+    input_digest = await merge_digests(
+        MergeDigests([setup.sandbox.digest, compile_result.output_digest])
+    )
+    # Like `go test`, run the binary in the package's directory.
+    working_directory = setup.pkg_dir or None
+    list_result = await execute_process(
+        setup.process(
+            [f"{{chroot}}/{_TEST_BINARY}", "-test.list", "."],
+            description=f"List Go tests: {address}",
+            input_digest=input_digest,
+            working_directory=working_directory,
+        ),
+        **implicitly(),
+    )
+    test_names = [
+        name
+        for name in list_result.stdout.decode(errors="replace").splitlines()
+        if _SHARDABLE_TEST_RE.match(name)
+    ]
+
+    history = read_duration_history(go_cache_dirs.test_durations_file)
+    estimates = estimate_durations([f"{setup.import_path}.{name}" for name in test_names], history)
+    shards = [
+        [test_names[i] for i in indices]
+        for indices in partition_longest_first(estimates, min(num_shards, len(test_names)))
+        if indices
+    ] or [[]]
+
+    def shard_argv(shard: Sequence[str]) -> list[str]:
+        argv = [go, "tool", "test2json", "-t", "-p", setup.import_path]
+        # `-test.v=test2json` frames output so that `test2json` attributes it reliably, but it
+        # needs Go 1.20: older test binaries only support plain verbose output.
+        verbose_flag = "-test.v=test2json" if goroot.is_compatible_version("1.20") else "-test.v"
+        argv.extend([f"{{chroot}}/{_TEST_BINARY}", verbose_flag])
+        if len(shards) > 1:
+            argv.append(f"-test.run={_run_pattern(shard)}")
+        if setup.timeout:
+            argv.append(f"-test.timeout={setup.timeout}s")
+        if setup.coverage:
+            argv.append(f"-test.coverprofile={{chroot}}/{COVERAGE_PROFILE}")
+        return argv
+
+    shard_results = await concurrently(
+        execute_process(
+            setup.process(
+                shard_argv(shard),
+                description=f"Run Go tests: {address} (shard {i + 1}/{len(shards)})",
+                input_digest=input_digest,
+                working_directory=working_directory,
+                timeout_seconds=setup.timeout,
+                output_files=(COVERAGE_PROFILE,) if setup.coverage else (),
+            ),
+            **implicitly(),
+        )
+        for i, shard in enumerate(shards)
+    )
+    test_run = merge_test_runs(
+        [parse_test_events(result.stdout.decode(errors="replace")) for result in shard_results]
+    )
+
+    observed_durations = {
+        f"{setup.import_path}.{case.name}": case.elapsed
+        for case in test_run.cases
+        if case.name == case.top_level_name
+    }
+    if observed_durations:
+        write_duration_history(
+            go_cache_dirs.test_durations_file,
+            history.updated(observed_durations, decay=_DURATION_DECAY, max_age=_DURATION_MAX_AGE),
+        )
+
+    # Report the shards as one process, which failed if any shard failed: Pants treats multiple
+    # process results as attempts of the same process.
+    failed_results = [result for result in shard_results if result.exit_code != 0]
+    coverage_digests = (
+        tuple(result.output_digest for result in shard_results) if setup.coverage else ()
+    )
+    return (failed_results or shard_results)[0], test_run, coverage_digests
+
+
+async def _setup_go_test(
+    field_set: GoTestFieldSet,
+    goroot: GoRoot,
+    test_subsystem: TestSubsystem,
+    test_extra_env: TestExtraEnv,
+) -> _GoTestSetup:
+    owning_go_mod = await find_owning_go_mod(OwningGoModRequest(field_set.address))
+    inputs, module_paths, cgo_env, field_set_extra_env = await concurrently(
+        find_go_package_inputs(
+            GoPackageInputsRequest(owning_go_mod.module_dir, field_set.address.spec_path), goroot
+        ),
+        find_go_module_paths(GoModulePathsRequest((owning_go_mod.module_dir,))),
+        setup_go_cgo_env(**implicitly()),
+        environment_vars_subset(
+            **implicitly(EnvironmentVarsRequest(field_set.extra_env_vars.sorted()))
+        ),
+    )
+
+    return _GoTestSetup(
+        field_set=field_set,
+        import_path=module_paths.import_path(field_set.address.spec_path) or "",
+        sandbox=inputs.sandbox,
+        # NB: The host's `PATH` is only passed with cgo, to find the C toolchain, so that results
+        # are otherwise shared by machines with different environments.
+        env=FrozenDict(
+            {
+                **cgo_env.env,
+                **test_extra_env.env,
+                **field_set_extra_env,
+                **inputs.sandbox.env,
+            }
+        ),
+        timeout=field_set.timeout.calculate_from_global_options(test_subsystem),
+        cache_scope=(
+            ProcessCacheScope.PER_SESSION if test_subsystem.force else ProcessCacheScope.SUCCESSFUL
+        ),
+        coverage=test_subsystem.use_coverage,
+    )
+
+
+@rule(desc="Test with Go", level=LogLevel.DEBUG)
+async def run_go_tests(
+    batch: GoTestRequest.Batch[GoTestFieldSet, Any],
+    goroot: GoRoot,
+    go_cache_dirs: GoCacheDirs,
+    go_test_subsystem: GoTestSubsystem,
+    test_subsystem: TestSubsystem,
+    test_extra_env: TestExtraEnv,
+) -> TestResult:
+    field_set = batch.single_element
+    setup = await _setup_go_test(field_set, goroot, test_subsystem, test_extra_env)
+    args = go_test_subsystem.args
+    if go_test_subsystem.shards > 1:
+        result, test_run, coverage_digests = await _run_sharded(
+            setup, goroot, args, go_test_subsystem.shards, go_cache_dirs
+        )
+    else:
+        result, test_run, coverage_digests = await _run_go_test(
+            setup, goroot, args, description=f"Run Go tests: {field_set.address}"
+        )
+
+    attempts = [_with_stdout(result, test_run.output.encode())]
+    for attempt in range(2, go_test_subsystem.attempts + 1):
+        failed_tests = sorted({case.top_level_name for case in test_run.failed_cases})
+        # If a test panicked, timed out or exited, then the tests after it never ran, and so the
+        # whole package is re-run rather than just the failed tests.
+        whole_package = test_run.interrupted
+        if result.exit_code == 0 or not (failed_tests or whole_package):
+            # Nothing to retry, or the failure is not attributable to particular tests.
+            break
+        retried = await _run_go_test(  # noqa: PNT30: each retry depends on the last
+            setup,
+            goroot,
+            args,
+            retry=True,
+            run_pattern=None if whole_package else _run_pattern(failed_tests),
+            description=(
+                f"Retry {'' if whole_package else 'failed '}Go tests: {field_set.address} "
+                f"(attempt {attempt}/{go_test_subsystem.attempts})"
+            ),
+        )
+        result, retry_run, retry_coverage_digests = retried
+        attempts.append(_with_stdout(result, retry_run.output.encode()))
+        test_run = merge_retried_test_run(test_run, retry_run)
+        # The coverage of every attempt is merged: a retry's profile only covers the code which
+        # its tests ran.
+        coverage_digests += retry_coverage_digests
+
+    xml_results_digest = await create_digest(
+        CreateDigest([FileContent(f"{field_set.address.path_safe_spec}.xml", junit_xml(test_run))])
+    )
+    xml_results = await digest_to_snapshot(xml_results_digest)
+    return TestResult.from_fallible_process_result(
+        process_results=tuple(attempts),
+        address=field_set.address,
+        output_setting=test_subsystem.output,
+        coverage_data=(
+            GoCoverageData(field_set.address, coverage_digests) if coverage_digests else None
+        ),
+        xml_results=xml_results,
+    )
+
+
+@rule(desc="Set up Go test debugging", level=LogLevel.DEBUG)
+async def generate_go_tests_debug_request(
+    batch: GoTestRequest.Batch[GoTestFieldSet, Any],
+    goroot: GoRoot,
+    go_test_subsystem: GoTestSubsystem,
+    test_subsystem: TestSubsystem,
+    test_extra_env: TestExtraEnv,
+) -> TestDebugRequest:
+    field_set = batch.single_element
+    setup = await _setup_go_test(field_set, goroot, test_subsystem, test_extra_env)
+    # Run the tests verbosely and uncached, with their output going straight to the terminal.
+    argv = [os.path.join(goroot.path, "bin", "go"), "test", "-v", "-count=1"]
+    if setup.timeout:
+        argv.append(f"-timeout={setup.timeout}s")
+    argv.extend([*go_test_subsystem.args, f"./{setup.pkg_dir}"])
+    process = setup.process(argv, description=f"Debug Go tests: {field_set.address}")
+    return TestDebugRequest(InteractiveProcess.from_process(process))
+
+
+def rules():
+    return (
+        *collect_rules(),
+        *GoTestRequest.rules(),
+        *coverage.rules(),
+        *go_cache.rules(),
+        *go_mod.rules(),
+        *goroot.rules(),
+        *package_inputs.rules(),
+    )
@@ -0,0 +1,283 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from pants.core.goals.test import TestDebugRequest, TestResult, get_filtered_environment
+from pants.engine.fs import Digest, DigestContents
+from pants.engine.internals.native_engine import Address
+from pants.testutil.rule_runner import QueryRule, RuleRunner
+from shoalsoft.pants_golang_gobuild_plugin.goals.test import GoTestFieldSet, GoTestRequest
+from shoalsoft.pants_golang_gobuild_plugin.register import rules as all_rules
+from shoalsoft.pants_golang_gobuild_plugin.register import target_types
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.coverage import (
+    COVERAGE_PROFILE,
+    GoCoverageData,
+)
+
+
+@pytest.fixture
+def rule_runner() -> RuleRunner:
+    rr = RuleRunner(
+        rules=[
+            *all_rules(),
+            get_filtered_environment,
+            QueryRule(TestResult, (GoTestRequest.Batch,)),
+            QueryRule(TestDebugRequest, (GoTestRequest.Batch,)),
+            QueryRule(DigestContents, (Digest,)),
+        ],
+        target_types=target_types(),
+    )
+    rr.set_options(["--golang2-go-search-paths=['<PATH>']"], env_inherit={"PATH", "HOME"})
+    return rr
+
+
+def _run_tests(rule_runner: RuleRunner, address: Address) -> TestResult:
+    tgt = rule_runner.get_target(address)
+    field_set = GoTestFieldSet.create(tgt)
+    return rule_runner.request(
+        TestResult, [GoTestRequest.Batch("", (field_set,), partition_metadata=None)]
+    )
+
+
+def test_go_test(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "mod/BUILD": "go_module(name='mod')\n",
+            "mod/go.mod": "module example.com/mod\ngo 1.16\n",
+            "mod/pkg/BUILD": "go_package(test_extra_env_vars=['GREETING=hello'])\n",
+            "mod/pkg/pkg.go": "package pkg\n\nfunc Add(x, y int) int { return x + y }\n",
+            "mod/pkg/pkg_test.go": textwrap.dedent(
+                """\
+                package pkg
+
+                import (
+                    "os"
+                    "testing"
+                )
+
+                func TestAdd(t *testing.T) {
+                    if Add(1, 2) != 3 {
+                        t.Fatal("bad sum")
+                    }
+                }
+
+                func TestEnv(t *testing.T) {
+                    if os.Getenv("GREETING") != "hello" {
+                        t.Fatal("missing GREETING")
+                    }
+                }
+                """
+            ),
+        }
+    )
+    result = _run_tests(rule_runner, Address("mod/pkg"))
+    assert result.exit_code == 0
+    assert "--- PASS: TestAdd" in result.stdout_simplified_str
+    assert result.xml_results is not None
+    assert result.xml_results.files == ("mod.pkg.xml",)
+
+    rule_runner.write_files(
+        {"mod/pkg/pkg.go": "package pkg\n\nfunc Add(x, y int) int { return x - y }\n"}
+    )
+    result = _run_tests(rule_runner, Address("mod/pkg"))
+    assert result.exit_code != 0
+    assert "bad sum" in result.stdout_simplified_str
+
+
+def test_debug_go_test(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "mod/BUILD": "go_module(name='mod')\n",
+            "mod/go.mod": "module example.com/mod\ngo 1.16\n",
+            "mod/pkg/BUILD": "go_package()\n",
+            "mod/pkg/pkg_test.go": textwrap.dedent(
+                """\
+                package pkg
+
+                import "testing"
+
+                func TestPass(t *testing.T) {}
+                """
+            ),
+        }
+    )
+    field_set = GoTestFieldSet.create(rule_runner.get_target(Address("mod/pkg")))
+    debug_request = rule_runner.request(
+        TestDebugRequest, [GoTestRequest.Batch("", (field_set,), partition_metadata=None)]
+    )
+    assert "-v" in debug_request.process.process.argv
+    # Interrupting the debug session lets the tests clean up, as when run by `go test` directly.
+    assert debug_request.process.forward_signals_to_process
+    assert rule_runner.run_interactive_process(debug_request.process).exit_code == 0
+
+
+def test_skip_tests(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "mod/BUILD": "go_module(name='mod')\n",
+            "mod/go.mod": "module example.com/mod\ngo 1.16\n",
+            "mod/pkg/BUILD": "go_package(skip_tests=True)\n",
+            "mod/pkg/pkg.go": "package pkg\n",
+        }
+    )
+    assert GoTestFieldSet.opt_out(rule_runner.get_target(Address("mod/pkg")))
+
+
+def test_sharded_go_test(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "mod/BUILD": "go_module(name='mod')\n",
+            "mod/go.mod": "module example.com/mod\ngo 1.16\n",
+            "mod/pkg/BUILD": "go_package()\n",
+            "mod/pkg/pkg_test.go": textwrap.dedent(
+                """\
+                package pkg
+
+                import "testing"
+
+                func TestA(t *testing.T) {}
+
+                func TestB(t *testing.T) {
+                    t.Run("sub", func(t *testing.T) {})
+                }
+
+                func TestC(t *testing.T) {
+                    t.Fatal("C failed")
+                }
+                """
+            ),
+        }
+    )
+    rule_runner.set_options(
+        ["--golang2-go-search-paths=['<PATH>']", "--go-test2-shards=2"],
+        env_inherit={"PATH", "HOME"},
+    )
+    result = _run_tests(rule_runner, Address("mod/pkg"))
+    assert result.exit_code != 0
+    assert "--- PASS: TestA" in result.stdout_simplified_str
+    assert "--- PASS: TestB/sub" in result.stdout_simplified_str
+    assert "C failed" in result.stdout_simplified_str
+
+
+def test_retry_failed_tests(rule_runner: RuleRunner, tmp_path: Path) -> None:
+    rule_runner.write_files(
+        {
+            "mod/BUILD": "go_module(name='mod')\n",
+            "mod/go.mod": "module example.com/mod\ngo 1.16\n",
+            "mod/pkg/BUILD": f"go_package(test_extra_env_vars=['RUNS_DIR={tmp_path}'])\n",
+            "mod/pkg/pkg_test.go": textwrap.dedent(
+                """\
+                package pkg
+
+                import (
+                    "os"
+                    "path/filepath"
+                    "testing"
+                )
+
+                // Records a run of the test, failing on its first run.
+                func flaky(t *testing.T) {
+                    marker := filepath.Join(os.Getenv("RUNS_DIR"), t.Name())
+                    if _, err := os.Stat(marker); err != nil {
+                        os.WriteFile(marker, nil, 0o644)
+                        t.Fatal("first run")
+                    }
+                }
+
+                func TestStable(t *testing.T) {}
+
+                func TestFlaky(t *testing.T) { flaky(t) }
+                """
+            ),
+        }
+    )
+    rule_runner.set_options(
+        ["--golang2-go-search-paths=['<PATH>']", "--go-test2-attempts=2"],
+        env_inherit={"PATH", "HOME"},
+    )
+    result = _run_tests(rule_runner, Address("mod/pkg"))
+    assert result.exit_code == 0
+    assert "--- PASS: TestFlaky" in result.stdout_simplified_str
+    # Only the failed test was re-run.
+    assert "TestStable" not in result.stdout_simplified_str
+
+
+def test_retry_panicking_tests(rule_runner: RuleRunner, tmp_path: Path) -> None:
+    rule_runner.write_files(
+        {
+            "mod/BUILD": "go_module(name='mod')\n",
+            "mod/go.mod": "module example.com/mod\ngo 1.16\n",
+            "mod/pkg/BUILD": f"go_package(test_extra_env_vars=['RUNS_DIR={tmp_path}'])\n",
+            "mod/pkg/pkg_test.go": textwrap.dedent(
+                """\
+                package pkg
+
+                import (
+                    "os"
+                    "path/filepath"
+                    "testing"
+                )
+
+                // Records a run of the test, panicking on its first run.
+                func TestFlakyPanic(t *testing.T) {
+                    marker := filepath.Join(os.Getenv("RUNS_DIR"), t.Name())
+                    if _, err := os.Stat(marker); err != nil {
+                        os.WriteFile(marker, nil, 0o644)
+                        panic("first run")
+                    }
+                }
+
+                func TestBroken(t *testing.T) { t.Fatal("always fails") }
+                """
+            ),
+        }
+    )
+    rule_runner.set_options(
+        ["--golang2-go-search-paths=['<PATH>']", "--go-test2-attempts=2"],
+        env_inherit={"PATH", "HOME"},
+    )
+    result = _run_tests(rule_runner, Address("mod/pkg"))
+    # The panic stopped the first run before `TestBroken` ran, so the retry re-ran the whole
+    # package rather than just the flaky test.
+    assert result.exit_code != 0
+    assert "--- PASS: TestFlakyPanic" in result.stdout_simplified_str
+    assert "--- FAIL: TestBroken" in result.stdout_simplified_str
+
+
+def test_coverage(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "mod/BUILD": "go_module(name='mod')\n",
+            "mod/go.mod": "module example.com/mod\ngo 1.16\n",
+            "mod/pkg/BUILD": "go_package()\n",
+            "mod/pkg/pkg.go": "package pkg\n\nfunc Add(x, y int) int { return x + y }\n",
+            "mod/pkg/pkg_test.go": textwrap.dedent(
+                """\
+                package pkg
+
+                import "testing"
+
+                func TestAdd(t *testing.T) {
+                    if Add(1, 2) != 3 {
+                        t.Fatal("bad sum")
+                    }
+                }
+                """
+            ),
+        }
+    )
+    rule_runner.set_options(
+        ["--golang2-go-search-paths=['<PATH>']", "--test-use-coverage"],
+        env_inherit={"PATH", "HOME"},
+    )
+    result = _run_tests(rule_runner, Address("mod/pkg"))
+    assert result.exit_code == 0
+    assert isinstance(result.coverage_data, GoCoverageData)
+    (profile_digest,) = result.coverage_data.profile_digests
+    (profile,) = rule_runner.request(DigestContents, [profile_digest])
+    assert profile.path == COVERAGE_PROFILE
+    assert b"example.com/mod/pkg/pkg.go:3." in profile.content
@@ -1,20 +1,65 @@
 # Pants Plugin to invoke Official Go toolchain.
 # Copyright (C) 2024 Shoal Software LLC. All rights reserved.
 
-from shoalsoft.pants_golang_gobuild_plugin.goals import check, tailor
-from shoalsoft.pants_golang_gobuild_plugin.target_types import GoModuleTarget
-from shoalsoft.pants_golang_gobuild_plugin.util_rules import binary, go_bootstrap, goroot
+from shoalsoft.pants_golang_gobuild_plugin.goals import (
+    affected,
+    bench,
+    cache,
+    check,
+    package,
+    pgo,
+    run,
+    tailor,
+    test,
+)
+from shoalsoft.pants_golang_gobuild_plugin.target_types import (
+    GoBinaryTarget,
+    GoModuleTarget,
+    GoPackageTarget,
+    GoThirdPartyPackagesTarget,
+    GoThirdPartyPackageTarget,
+)
+from shoalsoft.pants_golang_gobuild_plugin.util_rules import (
+    binary,
+    dependency_inference,
+    go_bootstrap,
+    go_cache,
+    goroot,
+    package_graph,
+    pgo_profile,
+    stdlib,
+    third_party_pkg,
+)
 
 
 def target_types():
-    return (GoModuleTarget,)
+    return (
+        GoBinaryTarget,
+        GoModuleTarget,
+        GoPackageTarget,
+        GoThirdPartyPackagesTarget,
+        GoThirdPartyPackageTarget,
+    )
 
 
 def rules():
     return (
+        *affected.rules(),
+        *bench.rules(),
         *binary.rules(),
+        *cache.rules(),
         *check.rules(),
+        *dependency_inference.rules(),
         *go_bootstrap.rules(),
+        *go_cache.rules(),
         *goroot.rules(),
+        *package_graph.rules(),
+        *package.rules(),
+        *pgo.rules(),
+        *pgo_profile.rules(),
+        *stdlib.rules(),
+        *third_party_pkg.rules(),
+        *run.rules(),
         *tailor.rules(),
+        *test.rules(),
     )
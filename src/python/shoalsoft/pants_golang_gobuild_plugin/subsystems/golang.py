@@ -1,11 +1,31 @@
 # Pants Plugin to invoke Official Go toolchain.
 # Copyright (C) 2024 Shoal Software LLC. All rights reserved.
 
-from pants.option.option_types import BoolOption, StrListOption, StrOption
+from enum import Enum
+
+from pants.option.option_types import (
+    BoolOption,
+    EnumOption,
+    FloatOption,
+    IntOption,
+    MemorySizeOption,
+    StrListOption,
+    StrOption,
+)
 from pants.option.subsystem import Subsystem
 from pants.util.strutil import softwrap
 
 
+class GoCheckGranularity(Enum):
+    MODULE = "module"
+    PACKAGE = "package"
+
+
+class GoCheckMode(Enum):
+    BUILD = "build"
+    COMPILE_ONLY = "compile-only"
+
+
 class GolangSubsystem(Subsystem):
     options_scope = "golang2"
     help = "Options for Golang support."
@@ -50,6 +70,183 @@ class GolangSubsystem(Subsystem):
         ),
     )
 
+    cache_dir = StrOption(
+        default=None,
+        help=softwrap(
+            """
+            Directory in which the plugin keeps its persistent Go caches.
+
+            The Go build cache (`GOCACHE`) and module cache (`GOMODCACHE`) are placed in
+            subdirectories of this directory and are used by every Go process the plugin runs, so
+            that compiled packages and downloaded modules are reused across Pants sessions.
+
+            If unset, defaults to `shoalsoft_go` under `[GLOBAL].named_caches_dir`. Relative
+            paths are resolved against the build root.
+            """
+        ),
+        advanced=True,
+    )
+
+    build_cache_max_size = MemorySizeOption(
+        default=10 * 1024 * 1024 * 1024,
+        help=softwrap(
+            """
+            The byte budget for each of the plugin's Go build caches: the one in
+            `[golang2].cache_dir`, and the `shoalsoft_go_build` named cache used by sandboxed
+            processes.
+
+            The `go-cache` goal evicts the least recently used entries until each cache fits
+            within this budget.
+            """
+        ),
+        advanced=True,
+    )
+    record_build_cache_stats = BoolOption(
+        default=True,
+        help=softwrap(
+            """
+            If true, record how many compile actions of each `check` run were served from the Go
+            build cache, for reporting by the `go-cache` goal.
+            """
+        ),
+        advanced=True,
+    )
+    check_report = StrOption(
+        default=None,
+        help=softwrap(
+            """
+            If set, `check` writes a JSON report to this path (relative to the build root) with
+            the compile status (`compiled`, `cached`, `failed` or `skipped`) and compile duration
+            of every package it built, and the target each first-party package was checked for.
+            """
+        ),
+        advanced=True,
+    )
+
+    batch_check = BoolOption(
+        default=False,
+        help=softwrap(
+            """
+            If true, `check` compiles all `go_module` targets which are not part of a `go.work`
+            workspace in a single invocation using a workspace synthesized by Pants, rather than
+            running one `go` process per module. Errors are attributed back to each module.
+
+            Modules which share a `go.work` workspace are always compiled together.
+            """
+        ),
+        advanced=True,
+    )
+    build_parallelism = IntOption(
+        default=None,
+        help=softwrap(
+            """
+            The total number of Go compile workers `check` may use across all of its concurrent
+            `go build` processes.
+
+            The budget is divided evenly between the processes which can run at once (bounded by
+            `[GLOBAL].process_execution_local_parallelism`), and each process is given its share
+            via the `-p` flag and `GOMAXPROCS`. This avoids running one full set of compile
+            workers per module when many modules are checked together.
+
+            If unset, defaults to the number of CPUs.
+            """
+        ),
+        advanced=True,
+    )
+    check_mode = EnumOption(
+        default=GoCheckMode.BUILD,
+        help=softwrap(
+            f"""
+            How `check` verifies that packages compile.
+
+            With `{GoCheckMode.BUILD.value}`, `check` runs `go build`, which also links every
+            `main` package it builds (and, for a single `main` package, writes the binary).
+
+            With `{GoCheckMode.COMPILE_ONLY.value}`, `check` runs `go list -export`, which
+            compiles every package (reporting the same compiler errors) but never runs the linker.
+            Linking is usually the slowest and most memory hungry step of building large
+            binaries, so this reduces both check latency and peak memory use, at the cost of not
+            detecting link-time errors.
+            """
+        ),
+    )
+    check_granularity = EnumOption(
+        default=GoCheckGranularity.MODULE,
+        help=softwrap(
+            f"""
+            Which targets `check` compiles.
+
+            With `{GoCheckGranularity.MODULE.value}`, each `go_module` target compiles its module
+            and `go_package` targets are skipped.
+
+            With `{GoCheckGranularity.PACKAGE.value}`, each `go_package` target compiles only its
+            own package (and the packages it imports) and `go_module` targets are skipped. Combined
+            with `--changed-since` and `--changed-dependents=transitive`, this compiles only the
+            packages affected by a change rather than every package of each affected module. The
+            packages importing a changed package are found through the dependencies inferred
+            between `go_package` targets from their imports, so only packages with `go_package`
+            targets are selected.
+            """
+        ),
+    )
+    check_in_sandbox = BoolOption(
+        default=False,
+        help=softwrap(
+            """
+            If true, `check` compiles each module in a Pants sandbox containing only the module's
+            files, rather than directly in the workspace.
+
+            Sandboxed compilation results are cached by Pants across runs (and by a remote cache,
+            if configured), so checking an unchanged module is a cache hit. The Go build and
+            module caches are provided as the `shoalsoft_go_build` and `shoalsoft_go_mod` Pants
+            named caches rather than from `[golang2].cache_dir`.
+
+            Whether cgo is used, and so whether the `PATH` is passed, is set by
+            `[golang2].cgo_enabled`.
+            """
+        ),
+        advanced=True,
+    )
+    cgo_enabled = BoolOption(
+        default=True,
+        help=softwrap(
+            """
+            Whether to enable cgo (i.e. set `CGO_ENABLED=1`) when the `go` tool runs in a Pants
+            sandbox: for a sandboxed `check`, for `test`, and when listing packages.
+
+            With cgo, the `PATH`, `CC` and `CXX` environment variables are passed so that the C
+            toolchain can be found, which keys cached results on them. If no package, including
+            third-party ones, needs cgo, disable it so that results can be shared between
+            machines with different environments.
+            """
+        ),
+        advanced=True,
+    )
+    check_duration_decay = FloatOption(
+        default=0.5,
+        help=softwrap(
+            """
+            How strongly the most recent run affects the recorded compile time of a module.
+
+            `check` records the wall-clock time of each `go build` process and starts the
+            processes expected to take longest first. Each new measurement is blended into the
+            recorded time with this weight (between 0 and 1), so that 1 uses only the most recent
+            run.
+            """
+        ),
+        advanced=True,
+    )
+    check_duration_max_age = IntOption(
+        default=50,
+        help=softwrap(
+            """
+            The number of `check` runs after which a recorded compile time which has not been
+            measured again is forgotten.
+            """
+        ),
+        advanced=True,
+    )
+
     tailor_go_mod_targets = BoolOption(
         default=True,
         help=softwrap(
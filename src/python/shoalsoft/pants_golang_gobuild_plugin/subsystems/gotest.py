@@ -0,0 +1,60 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+from pants.option.option_types import ArgsListOption, IntOption, SkipOption, StrListOption
+from pants.option.subsystem import Subsystem
+from pants.util.strutil import softwrap
+
+
+class GoTestSubsystem(Subsystem):
+    options_scope = "go-test2"
+    name = "Go test"
+    help = "Options for Go tests."
+
+    args = ArgsListOption(
+        example="-run TestFoo -count=1",
+        extra_help="These flags are passed to `go test` before the package to test.",
+        passthrough=True,
+    )
+    skip = SkipOption("test")
+    attempts = IntOption(
+        default=1,
+        help=softwrap(
+            """
+            The number of times to run failing tests before giving up.
+
+            Retries re-run only the top-level test functions which failed (by anchoring `-run` on
+            their names), so a flaky test does not re-run every test of its package. Tests which
+            pass on a retry are reported as passing.
+            """
+        ),
+    )
+    shards = IntOption(
+        default=1,
+        help=softwrap(
+            """
+            The number of processes to run each package's tests in.
+
+            With more than one shard, each package's test binary is compiled once (as with
+            `go test -c`) and its test functions are partitioned across that many concurrent
+            runs of the binary, balancing the durations recorded for each test function by
+            previous runs. `test_timeout` then applies to each shard. Only the build flags of
+            `[go-test2].args` take effect when sharding, since they are passed when compiling the
+            test binary.
+            """
+        ),
+        advanced=True,
+    )
+    integration_coverage_dirs = StrListOption(
+        help=softwrap(
+            """
+            Directories, relative to the build root, holding coverage data written by Go binaries
+            built with `-cover` while running with `GOCOVERDIR` set to them, e.g. by integration
+            tests.
+
+            With `--test-use-coverage`, this data is converted with `go tool covdata textfmt` and
+            merged into the coverage profile of the Go tests.
+            """
+        ),
+        advanced=True,
+    )
@@ -19,7 +19,10 @@ from pants.engine.target import (
     InvalidFieldException,
     MultipleSourcesField,
     StringField,
+    StringSequenceField,
     Target,
+    TargetGenerator,
+    TriBoolField,
     ValidNumbers,
     generate_multiple_sources_field_help_message,
 )
@@ -176,6 +179,108 @@ class GoBinaryDependenciesField(Dependencies):
     alias = "_dependencies"
 
 
+class GoBinaryPgoField(StringField):
+    alias = "pgo"
+    default = "auto"
+    help = help_text(
+        """
+        The CPU profile to optimize this binary with, as with `go build -pgo`.
+
+        Either a path to a pprof profile, relative to this target's directory, `auto` to use the
+        `default.pgo` file in the main package's directory if there is one, or `off` to disable
+        profile-guided optimization. Use the `go-pgo` goal to collect and merge a profile.
+
+        The profile is part of the inputs of the build, so changing it rebuilds the binary.
+        Profile-guided optimization requires Go 1.20 or later: with older toolchains, `auto` and
+        `off` have no effect and a path is an error.
+        """
+    )
+    value: str
+
+    @property
+    def profile_path(self) -> str | None:
+        """The build root relative path of an explicitly configured profile."""
+        if self.value in ("auto", "off"):
+            return None
+        return os.path.normpath(os.path.join(self.address.spec_path, self.value))
+
+
+class GoCgoEnabledField(TriBoolField):
+    alias = "cgo_enabled"
+    help = help_text(
+        """
+        Whether to enable cgo (i.e. set `CGO_ENABLED=1`) when building this binary.
+
+        By default, cgo is only enabled for the race detector and the sanitizers, which require it
+        on most platforms.
+        Without cgo the build does not depend on the C toolchain found on the `PATH`, so it is
+        reproducible across machines.
+        """
+    )
+
+
+class GoRaceDetectorEnabledField(BoolField):
+    alias = "race"
+    default = False
+    help = "If true, build this binary with the data race detector (`go build -race`)."
+
+
+class GoMemorySanitizerEnabledField(BoolField):
+    alias = "msan"
+    default = False
+    help = help_text(
+        """
+        If true, build this binary with the C/C++ memory sanitizer (`go build -msan`).
+
+        This requires cgo and a C compiler supporting `-fsanitize=memory`, e.g. Clang.
+        """
+    )
+
+
+class GoAddressSanitizerEnabledField(BoolField):
+    alias = "asan"
+    default = False
+    help = help_text(
+        """
+        If true, build this binary with the C/C++ address sanitizer (`go build -asan`).
+
+        This requires cgo and a C compiler supporting `-fsanitize=address`.
+        """
+    )
+
+
+class GoAssemblerFlagsField(StringSequenceField):
+    alias = "assembler_flags"
+    help = "Extra flags for the Go assembler, passed as `go build -asmflags`."
+
+
+class GoCompilerFlagsField(StringSequenceField):
+    alias = "compiler_flags"
+    help = "Extra flags for the Go compiler, passed as `go build -gcflags`."
+
+
+class GoLinkerFlagsField(StringSequenceField):
+    alias = "linker_flags"
+    help = help_text(
+        """
+        Extra flags for the Go linker, passed as `go build -ldflags`.
+
+        To strip the symbol table and DWARF debug information, use `strip_symbols` instead.
+        """
+    )
+
+
+class GoStripSymbolsField(BoolField):
+    alias = "strip_symbols"
+    default = False
+    help = help_text(
+        """
+        If true, omit the symbol table and DWARF debug information (`-ldflags=-s -w`), making a
+        smaller release binary at the cost of debuggability.
+        """
+    )
+
+
 class GoBinaryTarget(Target):
     alias = "go_binary"
     core_fields = (
@@ -183,28 +288,100 @@ class GoBinaryTarget(Target):
         OutputPathField,
         GoBinaryMainPackageField,
         GoBinaryDependenciesField,
-        # GoCgoEnabledField,
-        # GoRaceDetectorEnabledField,
-        # GoMemorySanitizerEnabledField,
-        # GoAddressSanitizerEnabledField,
-        # GoAssemblerFlagsField,
-        # GoCompilerFlagsField,
-        # GoLinkerFlagsField,
+        GoBinaryPgoField,
+        GoCgoEnabledField,
+        GoRaceDetectorEnabledField,
+        GoMemorySanitizerEnabledField,
+        GoAddressSanitizerEnabledField,
+        GoAssemblerFlagsField,
+        GoCompilerFlagsField,
+        GoLinkerFlagsField,
+        GoStripSymbolsField,
         RestartableField,
         EnvironmentField,
     )
     help = "A Go binary."
 
 
-# TODO: Remove this field as unnecessary.
+# -----------------------------------------------------------------------------------------------
+# `go_third_party_package` targets
+# -----------------------------------------------------------------------------------------------
+
+
 class GoImportPathField(StringField):
     alias = "import_path"
     help = help_text(
         """
         Import path in Go code to import this package.
 
+        A generated `go_third_party_package` target stands for a whole module, so this is the
+        module path, i.e. the import path of the module's root package, rather than that of any
+        other package in the module.
+
         This field should not be overridden; use the value from target generation.
         """
     )
     required = True
     value: str
+
+
+class GoThirdPartyModuleVersionField(StringField):
+    alias = "version"
+    help = help_text(
+        """
+        The version of the module providing this package, as required by `go.mod`, or the
+        `module@version` which a `replace` directive substitutes for it.
+
+        This field should not be overridden; use the value from target generation.
+        """
+    )
+    required = True
+    value: str
+
+
+class GoThirdPartyPackageDependenciesField(Dependencies):
+    pass
+
+
+class GoThirdPartyPackageTarget(Target):
+    alias = "go_third_party_package"
+    core_fields = (
+        *COMMON_TARGET_FIELDS,
+        GoThirdPartyPackageDependenciesField,
+        GoImportPathField,
+        GoThirdPartyModuleVersionField,
+    )
+    help = help_text(
+        """
+        A package from a third-party Go module.
+
+        You should not explicitly create this target in BUILD files. Instead, add a
+        `go_third_party_packages` target next to your `go.mod`, which generates a target for each
+        module required by it.
+
+        Refer to a generated target by the module path, e.g. `go_mod_dir:name#golang.org/x/net`
+        for the `go_third_party_packages(name="name")` target in `go_mod_dir`.
+        """
+    )
+
+
+class GoThirdPartyPackagesTarget(TargetGenerator):
+    alias = "go_third_party_packages"
+    core_fields = (*COMMON_TARGET_FIELDS,)
+    generated_target_cls = GoThirdPartyPackageTarget
+    copied_fields = COMMON_TARGET_FIELDS
+    moved_fields = ()
+    help = help_text(
+        f"""
+        Generate a `{GoThirdPartyPackageTarget.alias}` target for each module required by the
+        `go.mod` file in this target's directory.
+
+        The targets are generated by parsing `go.mod` alone: no Go tooling runs and no modules are
+        downloaded until a generated target is actually used. As for any target generator, all of
+        the targets are generated together, when this target or any generated target is first
+        resolved. Modules replaced by a local directory are first-party code and get no target.
+
+        This is a separate target from `{GoModuleTarget.alias}` so that specs like `::` still
+        match the `{GoModuleTarget.alias}` target itself.
+        """
+    )
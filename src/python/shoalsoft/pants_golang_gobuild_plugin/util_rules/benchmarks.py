@@ -0,0 +1,211 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+from __future__ import annotations
+
+import json
+import math
+import re
+import statistics
+from collections import defaultdict
+from dataclasses import dataclass
+from itertools import combinations
+from typing import Mapping, Sequence
+
+# Version 2 dropped the GOMAXPROCS suffix from benchmark names.
+_FORMAT_VERSION = 2
+
+# Exact U-test distributions are only computed when there are at most this many ways of choosing
+# the samples; larger samples use the normal approximation.
+_MAX_EXACT_COMBINATIONS = 20_000
+
+# `go test` suffixes benchmark names with `-N` when GOMAXPROCS is N > 1.
+_GOMAXPROCS_SUFFIX_RE = re.compile(r"-\d+$")
+
+
+@dataclass(frozen=True)
+class BenchmarkKey:
+    package: str
+    name: str
+    unit: str
+
+    def __str__(self) -> str:
+        return f"{self.package}.{self.name} ({self.unit})"
+
+    @property
+    def higher_is_better(self) -> bool:
+        # Throughput metrics such as `MB/s`, unlike costs such as `ns/op`, `B/op` or `allocs/op`.
+        return self.unit.endswith("/s")
+
+
+def _gomaxprocs_suffix(name: str) -> str | None:
+    match = _GOMAXPROCS_SUFFIX_RE.search(name)
+    return match.group() if match else None
+
+
+def parse_benchmark_output(output: str) -> dict[BenchmarkKey, list[float]]:
+    """Parse the text output of `go test -bench`, collecting each metric over all repetitions.
+
+    Results are lines like `BenchmarkFoo-8  1000  1234 ns/op  128 B/op  2 allocs/op` following a
+    `pkg:` line naming their package. The GOMAXPROCS suffix (`-8`) is dropped from the names of a
+    package's benchmarks when all of them have the same one, so that results compare between
+    machines with different numbers of CPUs.
+    """
+    results: dict[str, list[tuple[str, str, float]]] = defaultdict(list)
+    package = ""
+    for line in output.splitlines():
+        if line.startswith("pkg:"):
+            package = line.partition(":")[2].strip()
+            continue
+        fields = line.split()
+        if len(fields) < 4 or not fields[0].startswith("Benchmark") or not fields[1].isdigit():
+            continue
+        for value, unit in zip(fields[2::2], fields[3::2]):
+            try:
+                results[package].append((fields[0], unit, float(value)))
+            except ValueError:
+                break
+
+    samples: dict[BenchmarkKey, list[float]] = defaultdict(list)
+    for package, package_results in results.items():
+        # NB: Without the suffix (i.e. with GOMAXPROCS=1), names may still end like one, as in
+        # `BenchmarkRead/size-1024`, but then they do not all end in the same one.
+        suffixes = {_gomaxprocs_suffix(name) for name, _, _ in package_results}
+        strip = len(suffixes) == 1 and None not in suffixes
+        for name, unit, value in package_results:
+            if strip:
+                name = _GOMAXPROCS_SUFFIX_RE.sub("", name)
+            samples[BenchmarkKey(package, name, unit)].append(value)
+    return dict(samples)
+
+
+def serialize_benchmarks(samples: Mapping[BenchmarkKey, Sequence[float]]) -> bytes:
+    packages: dict[str, dict[str, dict[str, list[float]]]] = defaultdict(lambda: defaultdict(dict))
+    for key, values in sorted(samples.items(), key=lambda item: str(item[0])):
+        packages[key.package][key.name][key.unit] = list(values)
+    return (
+        json.dumps({"version": _FORMAT_VERSION, "benchmarks": packages}, indent=2, sort_keys=True)
+        + "\n"
+    ).encode()
+
+
+def deserialize_benchmarks(content: bytes) -> dict[BenchmarkKey, list[float]]:
+    raw = json.loads(content)
+    if raw.get("version") != _FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported benchmark baseline version: {raw.get('version')!r}. Regenerate the "
+            "baseline with `--go-bench-update-baseline`."
+        )
+    return {
+        BenchmarkKey(package, name, unit): [float(v) for v in values]
+        for package, benchmarks in raw["benchmarks"].items()
+        for name, metrics in benchmarks.items()
+        for unit, values in metrics.items()
+    }
+
+
+def _ranks(values: Sequence[float]) -> list[float]:
+    """Ranks starting from 1, with tied values sharing their mean rank."""
+    order = sorted(range(len(values)), key=lambda i: values[i])
+    ranks = [0.0] * len(values)
+    i = 0
+    while i < len(order):
+        j = i
+        while j + 1 < len(order) and values[order[j + 1]] == values[order[i]]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[order[k]] = (i + j) / 2 + 1
+        i = j + 1
+    return ranks
+
+
+def mann_whitney_p_value(xs: Sequence[float], ys: Sequence[float]) -> float:
+    """The two-sided p-value of the Mann-Whitney U test that `xs` and `ys` share a distribution.
+
+    Like `benchstat`, this makes no assumption about the distribution of benchmark timings. Small
+    samples without ties use the exact distribution of U, and others its normal approximation.
+    """
+    n, m = len(xs), len(ys)
+    if not n or not m:
+        return 1.0
+    combined = [*xs, *ys]
+    ranks = _ranks(combined)
+    u = sum(ranks[:n]) - n * (n + 1) / 2
+    mean_u = n * m / 2
+    has_ties = len(set(combined)) < len(combined)
+
+    if not has_ties and math.comb(n + m, n) <= _MAX_EXACT_COMBINATIONS:
+        # Count the rank sums of every way of choosing which n of the ranks belong to `xs`.
+        extreme = abs(u - mean_u)
+        total = count = 0
+        for chosen in combinations(range(1, n + m + 1), n):
+            total += 1
+            if abs(sum(chosen) - n * (n + 1) / 2 - mean_u) >= extreme:
+                count += 1
+        return count / total
+
+    tie_counts = [combined.count(value) for value in set(combined)]
+    tie_correction = sum(t**3 - t for t in tie_counts) / ((n + m) * (n + m - 1))
+    variance = n * m / 12 * ((n + m + 1) - tie_correction)
+    if variance <= 0:
+        return 1.0
+    z = (abs(u - mean_u) - 0.5) / math.sqrt(variance)
+    return min(1.0, math.erfc(max(z, 0.0) / math.sqrt(2)))
+
+
+@dataclass(frozen=True)
+class BenchmarkComparison:
+    key: BenchmarkKey
+    baseline_median: float
+    median: float
+    p_value: float
+
+    @property
+    def delta(self) -> float:
+        """The relative change of the median, e.g. 0.1 for 10% more."""
+        if self.baseline_median == 0:
+            return 0.0 if self.median == 0 else math.inf
+        return (self.median - self.baseline_median) / self.baseline_median
+
+    def is_significant(self, alpha: float) -> bool:
+        return self.p_value < alpha
+
+    def is_regression(self, *, alpha: float, threshold: float) -> bool:
+        """Whether the change is significant, in the worse direction, and larger than `threshold`."""
+        worsening = -self.delta if self.key.higher_is_better else self.delta
+        return self.is_significant(alpha) and worsening > threshold
+
+
+def compare_benchmarks(
+    baseline: Mapping[BenchmarkKey, Sequence[float]],
+    current: Mapping[BenchmarkKey, Sequence[float]],
+) -> list[BenchmarkComparison]:
+    """Compare the metrics present in both the baseline and the current run."""
+    return [
+        BenchmarkComparison(
+            key=key,
+            baseline_median=statistics.median(baseline[key]),
+            median=statistics.median(values),
+            p_value=mann_whitney_p_value(baseline[key], values),
+        )
+        for key, values in sorted(current.items(), key=lambda item: str(item[0]))
+        if baseline.get(key) and values
+    ]
+
+
+def unmatched_benchmarks(
+    baseline: Mapping[BenchmarkKey, Sequence[float]],
+    current: Mapping[BenchmarkKey, Sequence[float]],
+) -> tuple[list[BenchmarkKey], list[BenchmarkKey]]:
+    """The metrics only in the baseline, and those only in the current run.
+
+    `compare_benchmarks` skips both, so they are reported separately.
+    """
+    return (
+        sorted(
+            (key for key, values in baseline.items() if values and not current.get(key)), key=str
+        ),
+        sorted(
+            (key for key, values in current.items() if values and not baseline.get(key)), key=str
+        ),
+    )
@@ -0,0 +1,102 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+import textwrap
+
+import pytest
+
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.benchmarks import (
+    BenchmarkComparison,
+    BenchmarkKey,
+    compare_benchmarks,
+    deserialize_benchmarks,
+    mann_whitney_p_value,
+    parse_benchmark_output,
+    serialize_benchmarks,
+    unmatched_benchmarks,
+)
+
+_OUTPUT = textwrap.dedent(
+    """\
+    goos: linux
+    goarch: amd64
+    pkg: example.com/mod/pkg
+    cpu: Some CPU
+    BenchmarkAdd-8   	1000000	      1000 ns/op	     128 B/op	       2 allocs/op
+    BenchmarkAdd-8   	1000000	      1100 ns/op	     128 B/op	       2 allocs/op
+    BenchmarkCopy-8  	   5000	    200000 ns/op	  52.50 MB/s
+    PASS
+    ok  	example.com/mod/pkg	3.021s
+    """
+)
+
+
+def test_parse_benchmark_output() -> None:
+    samples = parse_benchmark_output(_OUTPUT)
+    pkg = "example.com/mod/pkg"
+    assert samples == {
+        BenchmarkKey(pkg, "BenchmarkAdd", "ns/op"): [1000.0, 1100.0],
+        BenchmarkKey(pkg, "BenchmarkAdd", "B/op"): [128.0, 128.0],
+        BenchmarkKey(pkg, "BenchmarkAdd", "allocs/op"): [2.0, 2.0],
+        BenchmarkKey(pkg, "BenchmarkCopy", "ns/op"): [200000.0],
+        BenchmarkKey(pkg, "BenchmarkCopy", "MB/s"): [52.5],
+    }
+    assert deserialize_benchmarks(serialize_benchmarks(samples)) == samples
+
+
+def test_parse_benchmark_output_without_gomaxprocs_suffix() -> None:
+    # With GOMAXPROCS=1, `go test` does not add the suffix, so sub-benchmark names ending like one
+    # are kept as they are.
+    samples = parse_benchmark_output(
+        textwrap.dedent(
+            """\
+            pkg: example.com/mod/pkg
+            BenchmarkRead/size-1024   	1000	      1000 ns/op
+            BenchmarkRead/size-4096   	1000	      3000 ns/op
+            """
+        )
+    )
+    assert set(samples) == {
+        BenchmarkKey("example.com/mod/pkg", "BenchmarkRead/size-1024", "ns/op"),
+        BenchmarkKey("example.com/mod/pkg", "BenchmarkRead/size-4096", "ns/op"),
+    }
+
+
+def test_mann_whitney_p_value() -> None:
+    # Exact: only 2 of the 924 ways of splitting 12 ranks into two groups are this extreme.
+    assert mann_whitney_p_value([1, 2, 3, 4, 5, 6], [7, 8, 9, 10, 11, 12]) == pytest.approx(2 / 924)
+    assert mann_whitney_p_value([1, 2, 3], [1, 2, 3]) == 1.0
+    assert mann_whitney_p_value([10] * 6, [12] * 6) < 0.01
+    assert mann_whitney_p_value([1, 3, 5, 7], [2, 4, 6, 8]) > 0.5
+    assert mann_whitney_p_value([], [1.0]) == 1.0
+
+
+def test_compare_benchmarks() -> None:
+    ns = BenchmarkKey("example.com/pkg", "BenchmarkA", "ns/op")
+    throughput = BenchmarkKey("example.com/pkg", "BenchmarkA", "MB/s")
+    baseline = {ns: [100.0, 101, 99, 100, 102, 98], throughput: [50.0, 51, 49, 50, 52, 48]}
+    current = {ns: [120.0, 121, 119, 120, 122, 118], throughput: [60.0, 61, 59, 60, 62, 58]}
+
+    by_unit = {c.key.unit: c for c in compare_benchmarks(baseline, current)}
+    assert by_unit["ns/op"].delta == pytest.approx(0.2)
+    assert by_unit["ns/op"].is_regression(alpha=0.05, threshold=0.05)
+    assert not by_unit["ns/op"].is_regression(alpha=0.05, threshold=0.25)
+    # More throughput is an improvement.
+    assert by_unit["MB/s"].is_significant(0.05)
+    assert not by_unit["MB/s"].is_regression(alpha=0.05, threshold=0.05)
+
+    # Noise is not a regression, however large the threshold.
+    noisy = BenchmarkComparison(ns, baseline_median=100, median=110, p_value=0.4)
+    assert not noisy.is_regression(alpha=0.05, threshold=0.0)
+
+    assert compare_benchmarks(baseline, {BenchmarkKey("other", "B", "ns/op"): [1.0]}) == []
+
+
+def test_unmatched_benchmarks() -> None:
+    kept = BenchmarkKey("example.com/pkg", "BenchmarkKept", "ns/op")
+    removed = BenchmarkKey("example.com/pkg", "BenchmarkRemoved", "ns/op")
+    added = BenchmarkKey("example.com/pkg", "BenchmarkAdded", "ns/op")
+    assert unmatched_benchmarks({kept: [1.0], removed: [1.0]}, {kept: [1.0], added: [1.0]}) == (
+        [removed],
+        [added],
+    )
@@ -85,6 +85,8 @@ async def determine_main_pkg_for_go_binary(
             )
 
         if not wrapped_specified_tgt.target.has_field(GoPackageSourcesField):
+            # NB: Generated `go_third_party_package` targets stand for whole modules, so this is
+            # the import path of the module's root package.
             return GoBinaryMainPackage(
                 wrapped_specified_tgt.target.address,
                 is_third_party=True,
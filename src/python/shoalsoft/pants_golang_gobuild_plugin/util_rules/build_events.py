@@ -0,0 +1,145 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import tempfile
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Any, Iterable, Iterator, Mapping, Sequence
+
+
+class GoPackageBuildStatus(Enum):
+    COMPILED = "compiled"
+    CACHED = "cached"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+
+
+@dataclass(frozen=True)
+class GoPackageBuildResult:
+    """The outcome of compiling one package in a `go build` invocation."""
+
+    import_path: str
+    status: GoPackageBuildStatus
+    duration: float  # Seconds spent compiling, zero unless the package was compiled.
+
+
+def _parse_time(value: str) -> datetime:
+    return datetime.fromisoformat(value)
+
+
+def package_build_results(action_graph: bytes) -> tuple[GoPackageBuildResult, ...]:
+    """Per-package results from the JSON written by `go build -debug-actiongraph`.
+
+    A compile action which ran a command was compiled (or failed to compile, in which case it did
+    not produce a build ID). One which neither ran a command nor produced a build ID was skipped
+    because a dependency failed: such actions are still given a `TimeStart`. Any other action was
+    served from the build cache.
+    """
+    results = []
+    for action in json.loads(action_graph):
+        if action.get("Mode") != "build" or not action.get("Package"):
+            continue
+        time_start = action.get("TimeStart")
+        time_done = action.get("TimeDone")
+        if action.get("Failed") or (action.get("Cmd") and not action.get("BuildID")):
+            status = GoPackageBuildStatus.FAILED
+        elif not action.get("BuildID"):
+            status = GoPackageBuildStatus.SKIPPED
+        elif action.get("Cmd"):
+            status = GoPackageBuildStatus.COMPILED
+        else:
+            status = GoPackageBuildStatus.CACHED
+
+        duration = 0.0
+        if (
+            status in (GoPackageBuildStatus.COMPILED, GoPackageBuildStatus.FAILED)
+            and time_start
+            and time_done
+        ):
+            duration = (_parse_time(time_done) - _parse_time(time_start)).total_seconds()
+        results.append(
+            GoPackageBuildResult(action["Package"], status=status, duration=max(duration, 0.0))
+        )
+    return tuple(results)
+
+
+def summarize_package_results(results: Iterable[GoPackageBuildResult]) -> str:
+    """A one line summary, e.g. `3 packages: 1 compiled, 2 cached in 0.42s`."""
+    results = list(results)
+    counts = Counter(result.status for result in results)
+    parts = [
+        f"{counts[status]} {status.value}" for status in GoPackageBuildStatus if counts[status]
+    ]
+    noun = "package" if len(results) == 1 else "packages"
+    summary = f"{len(results)} {noun}"
+    if parts:
+        summary += f": {', '.join(parts)}"
+    duration = sum(result.duration for result in results)
+    if duration:
+        summary += f" in {duration:.2f}s"
+    return summary
+
+
+_JSON_VALUE_START_RE = re.compile(r"[ \t\r\n]*(?=[{\[])")
+
+
+def iter_json_stream(text: str) -> Iterator[Any]:
+    """Incrementally decode a stream of concatenated JSON values, such as `go build -json`.
+
+    Any text which is not JSON, such as a failure of the `go` command itself, is yielded line by
+    line as strings.
+    """
+    decoder = json.JSONDecoder()
+    pos = 0
+    while pos < len(text):
+        match = _JSON_VALUE_START_RE.match(text, pos)
+        if match:
+            try:
+                value, pos = decoder.raw_decode(text, match.end())
+            except json.JSONDecodeError:
+                pass
+            else:
+                yield value
+                continue
+        if text[pos] in "\r\n":
+            pos += 1
+            continue
+        end = text.find("\n", pos)
+        end = len(text) if end == -1 else end + 1
+        yield text[pos:end]
+        pos = end
+
+
+def render_build_json(text: str) -> tuple[str, frozenset[str]]:
+    """Render the output of `go build -json` as `go build` would print it without `-json`.
+
+    Also returns the import paths of the packages which failed to build.
+    """
+    output = []
+    failed = set()
+    for value in iter_json_stream(text):
+        if isinstance(value, str):
+            output.append(value)
+        elif isinstance(value, dict):
+            if value.get("Action") == "build-output":
+                output.append(value.get("Output", ""))
+            elif value.get("Action") == "build-fail" and value.get("ImportPath"):
+                failed.add(value["ImportPath"])
+    return "".join(output), frozenset(failed)
+
+
+def write_build_report(path: str, packages: Sequence[Mapping[str, Any]]) -> None:
+    """Atomically write a JSON report of per-package build results."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump({"packages": list(packages)}, f, indent=2)
+        f.write("\n")
+    os.replace(tmp_path, path)
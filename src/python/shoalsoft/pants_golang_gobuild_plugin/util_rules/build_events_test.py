@@ -0,0 +1,106 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+import json
+
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.build_events import (
+    GoPackageBuildResult,
+    GoPackageBuildStatus,
+    iter_json_stream,
+    package_build_results,
+    render_build_json,
+    summarize_package_results,
+)
+
+
+def test_package_build_results() -> None:
+    action_graph = json.dumps(
+        [
+            {
+                "Mode": "build",
+                "Package": "example.com/app",
+                "Cmd": ["compile"],
+                "BuildID": "abc/def",
+                "TimeStart": "2025-01-01T00:00:00.000000001Z",
+                "TimeDone": "2025-01-01T00:00:00.250000001Z",
+            },
+            {
+                "Mode": "build",
+                "Package": "example.com/lib",
+                "BuildID": "ghi/jkl",
+                "TimeStart": "2025-01-01T00:00:00Z",
+                "TimeDone": "2025-01-01T00:00:00.001Z",
+            },
+            {
+                "Mode": "build",
+                "Package": "example.com/broken",
+                "Cmd": ["compile"],
+                "TimeStart": "2025-01-01T00:00:00Z",
+                "TimeDone": "2025-01-01T00:00:01Z",
+            },
+            # As written by Go 1.21: skipped actions are started, but run no command.
+            {
+                "Mode": "build",
+                "Package": "example.com/uses_broken",
+                "TimeStart": "2025-01-01T00:00:01Z",
+                "TimeDone": "2025-01-01T00:00:01.000001Z",
+            },
+            {"Mode": "build", "Package": "example.com/never_started"},
+            {"Mode": "link", "Package": "example.com/app", "Cmd": ["link"]},
+        ]
+    ).encode()
+    assert package_build_results(action_graph) == (
+        GoPackageBuildResult("example.com/app", GoPackageBuildStatus.COMPILED, 0.25),
+        GoPackageBuildResult("example.com/lib", GoPackageBuildStatus.CACHED, 0.0),
+        GoPackageBuildResult("example.com/broken", GoPackageBuildStatus.FAILED, 1.0),
+        GoPackageBuildResult("example.com/uses_broken", GoPackageBuildStatus.SKIPPED, 0.0),
+        GoPackageBuildResult("example.com/never_started", GoPackageBuildStatus.SKIPPED, 0.0),
+    )
+
+
+def test_summarize_package_results() -> None:
+    assert summarize_package_results([]) == "0 packages"
+    assert (
+        summarize_package_results(
+            [
+                GoPackageBuildResult("a", GoPackageBuildStatus.COMPILED, 0.25),
+                GoPackageBuildResult("b", GoPackageBuildStatus.CACHED, 0.0),
+                GoPackageBuildResult("c", GoPackageBuildStatus.CACHED, 0.0),
+            ]
+        )
+        == "3 packages: 1 compiled, 2 cached in 0.25s"
+    )
+
+
+def test_iter_json_stream() -> None:
+    stream = '{"a": 1}\n{"b": [2]}{"c": 3}\ngo: not json\n\t{indented text\n'
+    assert list(iter_json_stream(stream)) == [
+        {"a": 1},
+        {"b": [2]},
+        {"c": 3},
+        "go: not json\n",
+        "\t{indented text\n",
+    ]
+
+
+def test_render_build_json() -> None:
+    stream = "\n".join(
+        json.dumps(event)
+        for event in [
+            {
+                "ImportPath": "example.com/broken",
+                "Action": "build-output",
+                "Output": "# example.com/broken\n",
+            },
+            {
+                "ImportPath": "example.com/broken",
+                "Action": "build-output",
+                "Output": "broken/b.go:2:23: cannot use x\n",
+            },
+            {"ImportPath": "example.com/broken", "Action": "build-fail"},
+        ]
+    )
+    assert render_build_json(stream) == (
+        "# example.com/broken\nbroken/b.go:2:23: cannot use x\n",
+        frozenset({"example.com/broken"}),
+    )
@@ -0,0 +1,173 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+from __future__ import annotations
+
+import importlib.resources
+import os
+from dataclasses import dataclass
+
+from pants.core.goals.test import (
+    CoverageData,
+    CoverageDataCollection,
+    CoverageReports,
+    FilesystemCoverageReport,
+)
+from pants.core.util_rules.distdir import DistDir
+from pants.engine.addresses import Address
+from pants.engine.fs import AddPrefix, CreateDigest, Digest, FileContent, MergeDigests, PathGlobs
+from pants.engine.intrinsics import (
+    add_prefix,
+    create_digest,
+    digest_to_snapshot,
+    execute_process,
+    merge_digests,
+    path_globs_to_digest,
+)
+from pants.engine.process import Process, execute_process_or_raise
+from pants.engine.rules import collect_rules, concurrently, implicitly, rule
+from pants.engine.unions import UnionRule
+from pants.util.logging import LogLevel
+from shoalsoft.pants_golang_gobuild_plugin.subsystems.gotest import GoTestSubsystem
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.go_cache import (
+    SANDBOX_APPEND_ONLY_CACHES,
+    SANDBOX_CACHE_ENV,
+)
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.goroot import GoRoot
+
+# The coverage profile written by `go test -coverprofile` in test sandboxes.
+COVERAGE_PROFILE = "__go_coverage.out"
+
+_MERGED_PROFILE = "coverage.out"
+
+_PROFILES_DIR = "__profiles"
+
+# A Go program merging coverage profiles, shipped alongside this module.
+_MERGE_PROGRAM = "merge_cover_profiles.go"
+
+
+@dataclass(frozen=True)
+class GoCoverageData(CoverageData):
+    """The coverage profiles written by testing one package (one per shard)."""
+
+    address: Address
+    profile_digests: tuple[Digest, ...]
+
+
+class GoCoverageDataCollection(CoverageDataCollection):
+    element_type = GoCoverageData
+
+
+async def _integration_coverage_profile(
+    coverage_dirs: tuple[str, ...], goroot: GoRoot
+) -> Digest | None:
+    """Convert the `GOCOVERDIR` data of integration runs into a text profile."""
+    if not coverage_dirs:
+        return None
+    input_digest = await path_globs_to_digest(
+        PathGlobs([os.path.join(coverage_dir, "*") for coverage_dir in coverage_dirs])
+    )
+    result = await execute_process(
+        Process(
+            argv=[
+                os.path.join(goroot.path, "bin", "go"),
+                "tool",
+                "covdata",
+                "textfmt",
+                f"-i={','.join(coverage_dirs)}",
+                f"-o={COVERAGE_PROFILE}",
+            ],
+            description="Convert Go integration coverage data",
+            input_digest=input_digest,
+            env=SANDBOX_CACHE_ENV,
+            append_only_caches=SANDBOX_APPEND_ONLY_CACHES,
+            output_files=(COVERAGE_PROFILE,),
+            level=LogLevel.DEBUG,
+        ),
+        **implicitly(),
+    )
+    if result.exit_code != 0:
+        raise ValueError(
+            "Failed to convert the Go coverage data in "
+            f"{', '.join(coverage_dirs)}:\n{result.stderr.decode(errors='replace')}"
+        )
+    return result.output_digest
+
+
+@rule(desc="Merge Go coverage profiles", level=LogLevel.DEBUG)
+async def merge_go_coverage(
+    data_collection: GoCoverageDataCollection,
+    go_test_subsystem: GoTestSubsystem,
+    goroot: GoRoot,
+    distdir: DistDir,
+) -> CoverageReports:
+    integration_profile = await _integration_coverage_profile(
+        tuple(go_test_subsystem.integration_coverage_dirs), goroot
+    )
+    profile_digests = [digest for data in data_collection for digest in data.profile_digests]
+    if integration_profile is not None:
+        profile_digests.append(integration_profile)
+    # NB: The profiles are merged by a Go program in a sandbox, so that neither they nor the merged
+    # profile need to be held in memory here.
+    prefixed_digests = await concurrently(
+        add_prefix(AddPrefix(digest, os.path.join(_PROFILES_DIR, str(i))))
+        for i, digest in enumerate(profile_digests)
+    )
+    profiles_digest, merge_program_digest = await concurrently(
+        merge_digests(MergeDigests(prefixed_digests)),
+        create_digest(
+            CreateDigest(
+                [
+                    FileContent(
+                        _MERGE_PROGRAM,
+                        importlib.resources.files(__package__)
+                        .joinpath(_MERGE_PROGRAM)
+                        .read_bytes(),
+                    )
+                ]
+            )
+        ),
+    )
+    profiles_snapshot, input_digest = await concurrently(
+        digest_to_snapshot(profiles_digest),
+        merge_digests(MergeDigests([profiles_digest, merge_program_digest])),
+    )
+    result = await execute_process_or_raise(
+        **implicitly(
+            Process(
+                argv=[
+                    os.path.join(goroot.path, "bin", "go"),
+                    "run",
+                    _MERGE_PROGRAM,
+                    _MERGED_PROFILE,
+                    *profiles_snapshot.files,
+                ],
+                description=f"Merge {len(profiles_snapshot.files)} Go coverage profiles",
+                input_digest=input_digest,
+                env={**SANDBOX_CACHE_ENV, "CGO_ENABLED": "0", "GOTOOLCHAIN": "local"},
+                append_only_caches=SANDBOX_APPEND_ONLY_CACHES,
+                output_files=(_MERGED_PROFILE,),
+                level=LogLevel.DEBUG,
+            )
+        )
+    )
+    snapshot = await digest_to_snapshot(result.output_digest)
+    output_dir = distdir.relpath / "coverage" / "go"
+    return CoverageReports(
+        (
+            FilesystemCoverageReport(
+                coverage_insufficient=False,
+                result_snapshot=snapshot,
+                directory_to_materialize_to=output_dir,
+                report_file=output_dir / _MERGED_PROFILE,
+                report_type="go_cover",
+            ),
+        )
+    )
+
+
+def rules():
+    return (
+        *collect_rules(),
+        UnionRule(CoverageDataCollection, GoCoverageDataCollection),
+    )
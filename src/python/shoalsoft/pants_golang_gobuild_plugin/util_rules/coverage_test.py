@@ -0,0 +1,92 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+import pytest
+
+from pants.core.goals.test import CoverageReports, FilesystemCoverageReport
+from pants.engine.fs import Digest, DigestContents
+from pants.engine.internals.native_engine import Address
+from pants.engine.internals.scheduler import ExecutionError
+from pants.testutil.rule_runner import QueryRule, RuleRunner
+from shoalsoft.pants_golang_gobuild_plugin.register import rules as all_rules
+from shoalsoft.pants_golang_gobuild_plugin.register import target_types
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.coverage import (
+    COVERAGE_PROFILE,
+    GoCoverageData,
+    GoCoverageDataCollection,
+)
+
+
+@pytest.fixture
+def rule_runner() -> RuleRunner:
+    rr = RuleRunner(
+        rules=[
+            *all_rules(),
+            QueryRule(CoverageReports, (GoCoverageDataCollection,)),
+            QueryRule(DigestContents, (Digest,)),
+        ],
+        target_types=target_types(),
+    )
+    rr.set_options(["--golang2-go-search-paths=['<PATH>']"], env_inherit={"PATH", "HOME"})
+    return rr
+
+
+def _merge(rule_runner: RuleRunner, *profiles: str) -> list[str]:
+    data = [
+        GoCoverageData(
+            Address(f"pkg{i}"),
+            (rule_runner.make_snapshot({COVERAGE_PROFILE: profile}).digest,),
+        )
+        for i, profile in enumerate(profiles)
+    ]
+    reports = rule_runner.request(CoverageReports, [GoCoverageDataCollection(data)])
+    (report,) = reports.reports
+    assert isinstance(report, FilesystemCoverageReport)
+    (content,) = rule_runner.request(DigestContents, [report.result_snapshot.digest])
+    return content.content.decode().splitlines()
+
+
+def test_merge_cover_profiles(rule_runner: RuleRunner) -> None:
+    profile_a = "\n".join(
+        [
+            "mode: count",
+            "example.com/m/b/b.go:10.2,12.3 2 1",
+            "example.com/m/a/a.go:3.14,5.2 1 0",
+            "example.com/m/a/a.go:1.1,2.10 1 4",
+        ]
+    )
+    profile_b = "\n".join(
+        [
+            "mode: atomic",
+            "example.com/m/a/a.go:3.14,5.2 1 2",
+            "example.com/m/c/c.go:7.1,8.1 3 0",
+            "",
+        ]
+    )
+    assert _merge(rule_runner, profile_a, profile_b) == [
+        "mode: count",
+        "example.com/m/a/a.go:1.1,2.10 1 4",
+        "example.com/m/a/a.go:3.14,5.2 1 2",
+        "example.com/m/b/b.go:10.2,12.3 2 1",
+        "example.com/m/c/c.go:7.1,8.1 3 0",
+    ]
+
+
+def test_merge_cover_profiles_set_mode(rule_runner: RuleRunner) -> None:
+    profiles = [
+        "mode: set\nexample.com/m/a.go:1.1,2.2 1 1\n",
+        "mode: set\nexample.com/m/a.go:1.1,2.2 1 1\nexample.com/m/a.go:3.1,4.2 1 0\n",
+        # Counts are normalized to flags when merged with `set` profiles.
+        "mode: count\nexample.com/m/a.go:3.1,4.2 1 5\n",
+    ]
+    assert _merge(rule_runner, *profiles) == [
+        "mode: set",
+        "example.com/m/a.go:1.1,2.2 1 1",
+        "example.com/m/a.go:3.1,4.2 1 1",
+    ]
+    assert _merge(rule_runner) == ["mode: set"]
+
+
+def test_merge_cover_profiles_malformed(rule_runner: RuleRunner) -> None:
+    with pytest.raises(ExecutionError, match="malformed coverage block"):
+        _merge(rule_runner, "mode: set\nnot a block\n")
@@ -0,0 +1,145 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+
+from pants.base.specs import DirGlobSpec, RawSpecs
+from pants.engine.addresses import Address
+from pants.engine.fs import CreateDigest, Digest, FileEntry, GlobMatchErrorBehavior
+from pants.engine.internals.graph import hydrate_sources, resolve_targets
+from pants.engine.intrinsics import create_digest, get_digest_contents, get_digest_entries
+from pants.engine.rules import collect_rules, concurrently, implicitly, rule
+from pants.engine.target import (
+    FieldSet,
+    HydrateSourcesRequest,
+    InferDependenciesRequest,
+    InferredDependencies,
+)
+from pants.engine.unions import UnionRule
+from pants.util.logging import LogLevel
+from shoalsoft.pants_golang_gobuild_plugin.target_types import (
+    GoPackageDependenciesField,
+    GoPackageSourcesField,
+)
+from shoalsoft.pants_golang_gobuild_plugin.util_rules import go_mod, stdlib
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.go_mod import (
+    GoModulePathsRequest,
+    OwningGoModRequest,
+    find_go_module_paths,
+    find_owning_go_mod,
+)
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.import_scanner import scan_go_imports
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.stdlib import list_go_stdlib_packages
+
+logger = logging.getLogger(__name__)
+
+# Files are scanned under a fixed name, so that scans are memoized by content alone.
+_SCANNED_FILE = "scanned.go"
+
+
+@dataclass(frozen=True)
+class GoFileImportsRequest:
+    """Request for the imports of the single Go file in `digest`."""
+
+    digest: Digest
+
+
+@dataclass(frozen=True)
+class GoFileImports:
+    import_paths: tuple[str, ...]
+
+
+@rule(desc="Scan Go imports", level=LogLevel.TRACE)
+async def scan_go_file_imports(request: GoFileImportsRequest) -> GoFileImports:
+    contents = await get_digest_contents(request.digest)
+    return GoFileImports(scan_go_imports(contents[0].content) if contents else ())
+
+
+@dataclass(frozen=True)
+class GoPackageInferenceFieldSet(FieldSet):
+    required_fields = (GoPackageSourcesField, GoPackageDependenciesField)
+
+    sources: GoPackageSourcesField
+    dependencies: GoPackageDependenciesField
+
+
+class InferGoPackageDependenciesRequest(InferDependenciesRequest):
+    infer_from = GoPackageInferenceFieldSet
+
+
+@rule(desc="Infer dependencies of Go package", level=LogLevel.DEBUG)
+async def infer_go_package_dependencies(
+    request: InferGoPackageDependenciesRequest,
+) -> InferredDependencies:
+    address = request.field_set.address
+    owning_go_mod, hydrated_sources = await concurrently(
+        find_owning_go_mod(OwningGoModRequest(address)),
+        hydrate_sources(HydrateSourcesRequest(request.field_set.sources), **implicitly()),
+    )
+    module_paths, stdlib_packages, entries = await concurrently(
+        find_go_module_paths(GoModulePathsRequest((owning_go_mod.module_dir,))),
+        list_go_stdlib_packages(**implicitly()),
+        get_digest_entries(hydrated_sources.snapshot.digest),
+    )
+    file_digests = await concurrently(
+        create_digest(CreateDigest([FileEntry(_SCANNED_FILE, entry.file_digest)]))
+        for entry in entries
+        if isinstance(entry, FileEntry) and entry.path.endswith(".go")
+    )
+    all_imports = await concurrently(
+        scan_go_file_imports(GoFileImportsRequest(digest)) for digest in file_digests
+    )
+
+    dependency_dirs = set()
+    for imports in all_imports:
+        for import_path in imports.import_paths:
+            # Standard library imports are classified by a set lookup, rather than matched
+            # against the module paths.
+            if import_path in stdlib_packages:
+                continue
+            package_dir = module_paths.package_dir(import_path)
+            if package_dir is not None and package_dir != address.spec_path:
+                dependency_dirs.add(package_dir)
+    if not dependency_dirs:
+        return InferredDependencies([])
+
+    candidate_targets = await resolve_targets(
+        **implicitly(
+            RawSpecs(
+                dir_globs=tuple(
+                    DirGlobSpec(package_dir) for package_dir in sorted(dependency_dirs)
+                ),
+                unmatched_glob_behavior=GlobMatchErrorBehavior.ignore,
+                description_of_origin="the `go_package` dependency inference rule",
+            )
+        )
+    )
+    packages_by_dir: dict[str, list[Address]] = defaultdict(list)
+    for tgt in candidate_targets:
+        if tgt.has_field(GoPackageSourcesField) and tgt.residence_dir in dependency_dirs:
+            packages_by_dir[tgt.residence_dir].append(tgt.address)
+
+    inferred = []
+    for package_dir, addresses in sorted(packages_by_dir.items()):
+        if len(addresses) > 1:
+            logger.warning(
+                f"{address} imports the Go package in {package_dir}, but it is ambiguous which of "
+                f"these targets owns it, so no dependency was inferred: "
+                f"{sorted(a.spec for a in addresses)}"
+            )
+            continue
+        inferred.append(addresses[0])
+    return InferredDependencies(inferred)
+
+
+def rules():
+    return (
+        *collect_rules(),
+        *go_mod.rules(),
+        *stdlib.rules(),
+        UnionRule(InferDependenciesRequest, InferGoPackageDependenciesRequest),
+    )
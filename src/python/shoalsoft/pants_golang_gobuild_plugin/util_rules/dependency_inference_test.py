@@ -0,0 +1,101 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+import textwrap
+
+import pytest
+
+from pants.engine.internals.native_engine import Address
+from pants.engine.target import InferredDependencies
+from pants.testutil.rule_runner import QueryRule, RuleRunner
+from shoalsoft.pants_golang_gobuild_plugin.register import rules as all_rules
+from shoalsoft.pants_golang_gobuild_plugin.register import target_types
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.dependency_inference import (
+    GoPackageInferenceFieldSet,
+    InferGoPackageDependenciesRequest,
+)
+
+
+@pytest.fixture
+def rule_runner() -> RuleRunner:
+    rr = RuleRunner(
+        rules=[
+            *all_rules(),
+            QueryRule(InferredDependencies, (InferGoPackageDependenciesRequest,)),
+        ],
+        target_types=target_types(),
+    )
+    rr.set_options(["--golang2-go-search-paths=['<PATH>']"], env_inherit={"PATH", "HOME"})
+    return rr
+
+
+def _infer(rule_runner: RuleRunner, address: Address) -> set[Address]:
+    field_set = GoPackageInferenceFieldSet.create(rule_runner.get_target(address))
+    inferred = rule_runner.request(
+        InferredDependencies, [InferGoPackageDependenciesRequest(field_set)]
+    )
+    return set(inferred.include)
+
+
+def test_infer_go_package_dependencies(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "mod/BUILD": "go_module(name='mod')\n",
+            "mod/go.mod": "module example.com/mod\ngo 1.21\n",
+            "mod/app/BUILD": "go_package()\n",
+            "mod/app/app.go": textwrap.dedent(
+                """\
+                package app
+
+                import (
+                    "fmt"
+
+                    "example.com/mod/lib"
+                    "example.com/mod/app/internal"
+                    "golang.org/x/text/language"
+                )
+                """
+            ),
+            "mod/app/app_test.go": 'package app\n\nimport "example.com/mod/testutil"\n',
+            "mod/app/internal/BUILD": "go_package()\n",
+            "mod/app/internal/internal.go": "package internal\n",
+            "mod/lib/BUILD": "go_package()\n",
+            "mod/lib/lib.go": 'package lib\n\nimport "example.com/mod/app/internal"\n',
+            "mod/testutil/BUILD": "go_package()\n",
+            "mod/testutil/testutil.go": "package testutil\n",
+        }
+    )
+    assert _infer(rule_runner, Address("mod/app")) == {
+        Address("mod/app/internal"),
+        Address("mod/lib"),
+        Address("mod/testutil"),
+    }
+    assert _infer(rule_runner, Address("mod/lib")) == {Address("mod/app/internal")}
+    assert _infer(rule_runner, Address("mod/testutil")) == set()
+
+
+def test_infer_skips_stdlib_packages(rule_runner: RuleRunner) -> None:
+    # A standard library import is never inferred to be a dependency on a module package, even
+    # if the module's path matches it (which `go` rejects as ambiguous).
+    rule_runner.write_files(
+        {
+            "mod/BUILD": "go_module(name='mod')\n",
+            "mod/go.mod": "module encoding\ngo 1.21\n",
+            "mod/app/BUILD": "go_package()\n",
+            "mod/app/app.go": textwrap.dedent(
+                """\
+                package app
+
+                import (
+                    "encoding/json"
+                    "encoding/util"
+                )
+                """
+            ),
+            "mod/json/BUILD": "go_package()\n",
+            "mod/json/json.go": "package json\n",
+            "mod/util/BUILD": "go_package()\n",
+            "mod/util/util.go": "package util\n",
+        }
+    )
+    assert _infer(rule_runner, Address("mod/app")) == {Address("mod/util")}
@@ -0,0 +1,126 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+from __future__ import annotations
+
+import heapq
+import json
+import logging
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import Mapping, Sequence
+
+from pants.util.frozendict import FrozenDict
+
+logger = logging.getLogger(__name__)
+
+_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class DurationEstimate:
+    seconds: float
+    last_run: int
+
+
+@dataclass(frozen=True)
+class DurationHistory:
+    """Smoothed wall-clock durations of previous runs, keyed by e.g. a target address.
+
+    Each new observation is blended into the estimate with an exponentially weighted moving
+    average, and estimates which have not been observed for `max_age` runs are dropped so that
+    removed or renamed targets do not accumulate.
+    """
+
+    run: int = 0
+    estimates: FrozenDict[str, DurationEstimate] = FrozenDict()
+
+    def get(self, key: str) -> float | None:
+        estimate = self.estimates.get(key)
+        return estimate.seconds if estimate else None
+
+    def updated(
+        self, observations: Mapping[str, float], *, decay: float, max_age: int
+    ) -> DurationHistory:
+        run = self.run + 1
+        estimates = {
+            key: estimate
+            for key, estimate in self.estimates.items()
+            if run - estimate.last_run <= max_age
+        }
+        for key, seconds in observations.items():
+            previous = estimates.get(key)
+            if previous is not None:
+                seconds = decay * seconds + (1 - decay) * previous.seconds
+            estimates[key] = DurationEstimate(seconds=seconds, last_run=run)
+        return DurationHistory(run=run, estimates=FrozenDict(sorted(estimates.items())))
+
+
+def estimate_durations(keys: Sequence[str], history: DurationHistory) -> list[float]:
+    """Estimated durations for the given keys, assuming the slowest time for unknown keys.
+
+    Work without any history is scheduled as early as the slowest known work, so that new work
+    which turns out to be slow does not end up on the tail of the run.
+    """
+    known = [history.get(key) for key in keys]
+    default = max((d for d in known if d is not None), default=1.0)
+    return [d if d is not None else default for d in known]
+
+
+def partition_longest_first(durations: Sequence[float], num_bins: int) -> list[list[int]]:
+    """Partition indices into `num_bins` bins with balanced total durations.
+
+    Uses the longest-processing-time-first heuristic: in decreasing order of duration, each index
+    goes into the bin with the least total duration so far. Ties go to the earliest bin, so equal
+    durations are dealt round-robin.
+    """
+    num_bins = max(num_bins, 1)
+    bin_loads = [(0.0, i) for i in range(num_bins)]
+    bins: list[list[int]] = [[] for _ in range(num_bins)]
+    for i in sorted(range(len(durations)), key=lambda i: -durations[i]):
+        load, b = heapq.heappop(bin_loads)
+        bins[b].append(i)
+        heapq.heappush(bin_loads, (load + durations[i], b))
+    return bins
+
+
+def read_duration_history(path: str) -> DurationHistory:
+    try:
+        with open(path) as f:
+            raw = json.load(f)
+        if raw.get("version") != _FORMAT_VERSION:
+            return DurationHistory()
+        return DurationHistory(
+            run=int(raw["run"]),
+            estimates=FrozenDict(
+                {
+                    key: DurationEstimate(seconds=float(value[0]), last_run=int(value[1]))
+                    for key, value in raw["estimates"].items()
+                }
+            ),
+        )
+    except FileNotFoundError:
+        return DurationHistory()
+    except (OSError, ValueError, KeyError, TypeError, IndexError) as e:
+        logger.warning(f"Ignoring unreadable duration history at {path}: {e}")
+        return DurationHistory()
+
+
+def write_duration_history(path: str, history: DurationHistory) -> None:
+    """Atomically persist the duration history."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump(
+            {
+                "version": _FORMAT_VERSION,
+                "run": history.run,
+                "estimates": {
+                    key: [estimate.seconds, estimate.last_run]
+                    for key, estimate in history.estimates.items()
+                },
+            },
+            f,
+        )
+    os.replace(tmp_path, path)
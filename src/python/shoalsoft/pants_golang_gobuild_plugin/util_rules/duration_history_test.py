@@ -0,0 +1,60 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.duration_history import (
+    DurationHistory,
+    estimate_durations,
+    partition_longest_first,
+    read_duration_history,
+    write_duration_history,
+)
+
+
+def test_updated_blends_and_expires_estimates() -> None:
+    history = DurationHistory().updated({"a": 10.0, "b": 4.0}, decay=0.5, max_age=2)
+    assert history.run == 1
+    assert history.get("a") == 10.0
+
+    history = history.updated({"a": 20.0}, decay=0.5, max_age=2)
+    assert history.get("a") == pytest.approx(15.0)
+    assert history.get("b") == 4.0
+
+    # `b` was last observed in run 1 and is forgotten once it is more than 2 runs old.
+    history = history.updated({"a": 15.0}, decay=0.5, max_age=2)
+    assert history.get("b") == 4.0
+    history = history.updated({"a": 15.0}, decay=0.5, max_age=2)
+    assert history.get("b") is None
+    assert history.get("a") == pytest.approx(15.0)
+
+
+def test_read_write_round_trip(tmp_path: Path) -> None:
+    path = str(tmp_path / "history" / "durations.json")
+    assert read_duration_history(path) == DurationHistory()
+
+    history = DurationHistory().updated({"src/go:mod": 12.5}, decay=1.0, max_age=5)
+    write_duration_history(path, history)
+    assert read_duration_history(path) == history
+
+
+def test_read_corrupt_history(tmp_path: Path) -> None:
+    path = tmp_path / "durations.json"
+    path.write_text("{not json")
+    assert read_duration_history(str(path)) == DurationHistory()
+
+
+def test_estimate_durations() -> None:
+    history = DurationHistory().updated({"a:mod": 5.0, "b:mod": 2.0}, decay=0.5, max_age=10)
+    assert estimate_durations(["a:mod", "b:mod", "new:mod"], history) == [5.0, 2.0, 5.0]
+    assert estimate_durations(["new:mod"], DurationHistory()) == [1.0]
+
+
+def test_partition_longest_first() -> None:
+    assert partition_longest_first([1.0, 10.0, 3.0, 4.0, 2.0], 2) == [[1], [3, 2, 4, 0]]
+    assert partition_longest_first([1.0, 1.0, 1.0], 2) == [[0, 2], [1]]
+    assert partition_longest_first([], 3) == [[], [], []]
@@ -0,0 +1,222 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import Iterable
+
+from pants.base.build_environment import get_buildroot
+from pants.engine.rules import collect_rules, rule
+from pants.option.global_options import GlobalOptions
+from pants.util.frozendict import FrozenDict
+from pants.util.logging import LogLevel
+from shoalsoft.pants_golang_gobuild_plugin.subsystems.golang import GolangSubsystem
+
+
+@dataclass(frozen=True)
+class GoCacheDirs:
+    """Persistent cache directories shared by all Go processes run by the plugin.
+
+    Processes which run in the workspace use the caches under `base_dir`, and sandboxed ones the
+    `SANDBOX_APPEND_ONLY_CACHES` under `named_caches_dir`.
+    """
+
+    base_dir: str
+    named_caches_dir: str
+
+    @property
+    def build_cache(self) -> str:
+        return os.path.join(self.base_dir, "build")
+
+    @property
+    def module_cache(self) -> str:
+        return os.path.join(self.base_dir, "mod")
+
+    @property
+    def sandbox_build_cache(self) -> str:
+        return os.path.join(self.named_caches_dir, _SANDBOX_BUILD_CACHE)
+
+    @property
+    def sandbox_module_cache(self) -> str:
+        return os.path.join(self.named_caches_dir, _SANDBOX_MODULE_CACHE)
+
+    @property
+    def check_stats_file(self) -> str:
+        return os.path.join(self.base_dir, "last_check_stats.json")
+
+    @property
+    def check_durations_file(self) -> str:
+        return os.path.join(self.base_dir, "check_durations.json")
+
+    @property
+    def test_durations_file(self) -> str:
+        return os.path.join(self.base_dir, "test_durations.json")
+
+    @property
+    def env(self) -> FrozenDict[str, str]:
+        """Environment variables which point the Go toolchain at these caches."""
+        return FrozenDict(
+            {
+                "GOCACHE": self.build_cache,
+                "GOMODCACHE": self.module_cache,
+            }
+        )
+
+
+# Sandboxed processes use Pants named caches rather than `[golang2].cache_dir`, so that their
+# cache keys do not depend on where the caches live on a particular machine.
+_SANDBOX_BUILD_CACHE = "shoalsoft_go_build"
+_SANDBOX_MODULE_CACHE = "shoalsoft_go_mod"
+
+SANDBOX_APPEND_ONLY_CACHES = FrozenDict(
+    {
+        _SANDBOX_BUILD_CACHE: ".cache/go-build",
+        _SANDBOX_MODULE_CACHE: ".cache/go-mod",
+    }
+)
+
+SANDBOX_CACHE_ENV = FrozenDict(
+    {
+        "GOCACHE": "{chroot}/.cache/go-build",
+        "GOMODCACHE": "{chroot}/.cache/go-mod",
+        "GOPATH": "{chroot}/.gopath",
+    }
+)
+
+
+@dataclass(frozen=True)
+class GoBuildCacheStats:
+    """Build cache hits and misses for the compile actions of one or more `go build` runs."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_ratio(self) -> float | None:
+        total = self.hits + self.misses
+        return self.hits / total if total else None
+
+    def __add__(self, other: GoBuildCacheStats) -> GoBuildCacheStats:
+        return GoBuildCacheStats(hits=self.hits + other.hits, misses=self.misses + other.misses)
+
+    @classmethod
+    def from_action_graph(cls, content: bytes) -> GoBuildCacheStats:
+        """Count cache hits in the JSON written by `go build -debug-actiongraph`.
+
+        A compile action which ran a command and produced a build ID was a cache miss; one which
+        produced a build ID without running a command was served from the build cache. Actions
+        which failed, or were skipped because a dependency failed, produced no build ID and are
+        counted as neither.
+        """
+        hits = 0
+        misses = 0
+        for action in json.loads(content):
+            if action.get("Mode") != "build" or action.get("Failed") or not action.get("BuildID"):
+                continue
+            if action.get("Cmd"):
+                misses += 1
+            else:
+                hits += 1
+        return cls(hits=hits, misses=misses)
+
+
+def write_check_stats(path: str, stats: GoBuildCacheStats) -> None:
+    """Atomically persist the cache stats of the most recent `check` run."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump({"hits": stats.hits, "misses": stats.misses}, f)
+    os.replace(tmp_path, path)
+
+
+def read_check_stats(path: str) -> GoBuildCacheStats | None:
+    try:
+        with open(path) as f:
+            raw = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return GoBuildCacheStats(hits=int(raw.get("hits", 0)), misses=int(raw.get("misses", 0)))
+
+
+@dataclass(frozen=True)
+class GoBuildCacheEntry:
+    path: str
+    size: int
+    last_used: float
+
+
+def scan_build_cache(build_cache: str) -> list[GoBuildCacheEntry]:
+    """List the entries in a Go build cache.
+
+    Entries live in 256 subdirectories named after the first byte of their hash. The Go toolchain
+    refreshes the mtime of entries it uses, so the later of atime and mtime is taken as the last
+    use.
+    """
+    if not os.path.isdir(build_cache):
+        return []
+
+    entries = []
+    for subdir in os.scandir(build_cache):
+        if len(subdir.name) != 2 or not subdir.is_dir(follow_symlinks=False):
+            continue
+        for entry in os.scandir(subdir.path):
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            st = entry.stat(follow_symlinks=False)
+            entries.append(
+                GoBuildCacheEntry(
+                    path=entry.path,
+                    size=st.st_size,
+                    last_used=max(st.st_atime, st.st_mtime),
+                )
+            )
+    return entries
+
+
+def directory_size(path: str) -> int:
+    """The total size of the files under `path`, without following symlinks."""
+    size = 0
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            try:
+                size += os.lstat(os.path.join(dirpath, filename)).st_size
+            except FileNotFoundError:
+                pass
+    return size
+
+
+def entries_to_evict(
+    entries: Iterable[GoBuildCacheEntry], max_size: int
+) -> list[GoBuildCacheEntry]:
+    """Select the least recently used entries to remove to bring the cache within `max_size`."""
+    sorted_entries = sorted(entries, key=lambda e: (e.last_used, e.path))
+    total_size = sum(e.size for e in sorted_entries)
+    evicted = []
+    for entry in sorted_entries:
+        if total_size <= max_size:
+            break
+        evicted.append(entry)
+        total_size -= entry.size
+    return evicted
+
+
+@rule(desc="Determine Go cache directories", level=LogLevel.DEBUG)
+async def setup_go_cache_dirs(
+    golang_subsystem: GolangSubsystem, global_options: GlobalOptions
+) -> GoCacheDirs:
+    named_caches_dir = os.path.join(
+        get_buildroot(), os.path.expanduser(global_options.named_caches_dir)
+    )
+    base_dir = golang_subsystem.cache_dir or os.path.join(named_caches_dir, "shoalsoft_go")
+    base_dir = os.path.join(get_buildroot(), os.path.expanduser(base_dir))
+    return GoCacheDirs(
+        base_dir=os.path.normpath(base_dir), named_caches_dir=os.path.normpath(named_caches_dir)
+    )
+
+
+def rules():
+    return collect_rules()
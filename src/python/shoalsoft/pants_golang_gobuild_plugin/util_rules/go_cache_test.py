@@ -0,0 +1,118 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from pants.engine.rules import QueryRule
+from pants.testutil.rule_runner import RuleRunner
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.go_cache import (
+    GoBuildCacheStats,
+    GoCacheDirs,
+    directory_size,
+    entries_to_evict,
+    read_check_stats,
+)
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.go_cache import rules as go_cache_rules
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.go_cache import (
+    scan_build_cache,
+    write_check_stats,
+)
+
+
+@pytest.fixture
+def rule_runner() -> RuleRunner:
+    return RuleRunner(rules=[*go_cache_rules(), QueryRule(GoCacheDirs, [])])
+
+
+def test_default_cache_dirs(rule_runner: RuleRunner) -> None:
+    rule_runner.set_options(["--named-caches-dir=/named/caches"])
+    cache_dirs = rule_runner.request(GoCacheDirs, [])
+    assert cache_dirs.build_cache == "/named/caches/shoalsoft_go/build"
+    assert cache_dirs.module_cache == "/named/caches/shoalsoft_go/mod"
+    assert cache_dirs.sandbox_build_cache == "/named/caches/shoalsoft_go_build"
+    assert cache_dirs.sandbox_module_cache == "/named/caches/shoalsoft_go_mod"
+    assert dict(cache_dirs.env) == {
+        "GOCACHE": "/named/caches/shoalsoft_go/build",
+        "GOMODCACHE": "/named/caches/shoalsoft_go/mod",
+    }
+
+
+def test_cache_dir_option(rule_runner: RuleRunner) -> None:
+    rule_runner.set_options(["--golang2-cache-dir=/custom/go"])
+    cache_dirs = rule_runner.request(GoCacheDirs, [])
+    assert cache_dirs.build_cache == "/custom/go/build"
+    assert cache_dirs.module_cache == "/custom/go/mod"
+
+
+def test_build_cache_stats_from_action_graph() -> None:
+    action_graph = json.dumps(
+        [
+            {"ID": 0, "Mode": "go build"},
+            {
+                "ID": 1,
+                "Mode": "build",
+                "Package": "example.com/foo",
+                "Cmd": ["compile"],
+                "BuildID": "a/b",
+            },
+            {"ID": 2, "Mode": "build", "Package": "fmt", "BuildID": "c/d"},
+            {"ID": 3, "Mode": "build", "Package": "errors", "BuildID": "e/f"},
+            {"ID": 4, "Mode": "link", "Package": "example.com/foo/cmd", "Cmd": ["link"]},
+            # Neither a failed compile nor one skipped because of it counts.
+            {"ID": 5, "Mode": "build", "Package": "example.com/broken", "Cmd": ["compile"]},
+            {"ID": 6, "Mode": "build", "Package": "example.com/uses_broken"},
+            {"ID": 7, "Mode": "build", "Package": "example.com/bad", "Failed": True},
+        ]
+    ).encode()
+    stats = GoBuildCacheStats.from_action_graph(action_graph)
+    assert stats == GoBuildCacheStats(hits=2, misses=1)
+    assert stats + stats == GoBuildCacheStats(hits=4, misses=2)
+    assert stats.hit_ratio == pytest.approx(2 / 3)
+    assert GoBuildCacheStats().hit_ratio is None
+
+
+def test_check_stats_round_trip(tmp_path: Path) -> None:
+    path = str(tmp_path / "stats" / "last_check_stats.json")
+    assert read_check_stats(path) is None
+    write_check_stats(path, GoBuildCacheStats(hits=7, misses=3))
+    assert read_check_stats(path) == GoBuildCacheStats(hits=7, misses=3)
+
+
+def test_scan_and_evict_build_cache(tmp_path: Path) -> None:
+    (tmp_path / "README").write_text("This directory holds cached build artifacts from Go.")
+    for i, name in enumerate(("ab/aaaa-a", "ab/bbbb-d", "cd/cccc-d")):
+        entry_path = tmp_path / name
+        entry_path.parent.mkdir(exist_ok=True)
+        entry_path.write_bytes(b"x" * 100)
+        os.utime(entry_path, (1000 + i, 1000 + i))
+
+    entries = scan_build_cache(str(tmp_path))
+    assert sorted(os.path.relpath(e.path, tmp_path) for e in entries) == [
+        "ab/aaaa-a",
+        "ab/bbbb-d",
+        "cd/cccc-d",
+    ]
+
+    def evicted_names(max_size: int) -> list[str]:
+        return [os.path.relpath(e.path, tmp_path) for e in entries_to_evict(entries, max_size)]
+
+    assert evicted_names(300) == []
+    assert evicted_names(250) == ["ab/aaaa-a"]
+    assert evicted_names(100) == ["ab/aaaa-a", "ab/bbbb-d"]
+    assert evicted_names(0) == ["ab/aaaa-a", "ab/bbbb-d", "cd/cccc-d"]
+
+    assert scan_build_cache(str(tmp_path / "does-not-exist")) == []
+
+
+def test_directory_size(tmp_path: Path) -> None:
+    (tmp_path / "a").write_bytes(b"x" * 10)
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "b").write_bytes(b"x" * 5)
+    assert directory_size(str(tmp_path)) == 15
+    assert directory_size(str(tmp_path / "does-not-exist")) == 0
@@ -0,0 +1,145 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+# Portions from Pantsbuild project under this license:
+# Copyright 2025 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import os
+import re
+from dataclasses import dataclass
+
+from pants.base.specs import AncestorGlobSpec, RawSpecs
+from pants.build_graph.address import Address, ResolveError
+from pants.engine.engine_aware import EngineAwareParameter
+from pants.engine.fs import PathGlobs
+from pants.engine.internals.graph import resolve_targets
+from pants.engine.intrinsics import get_digest_contents
+from pants.engine.rules import collect_rules, implicitly, rule
+from pants.util.frozendict import FrozenDict
+from pants.util.logging import LogLevel
+from shoalsoft.pants_golang_gobuild_plugin.target_types import GoModuleSourcesField
+
+
+@dataclass(frozen=True)
+class OwningGoModRequest(EngineAwareParameter):
+    address: Address
+
+    def debug_hint(self) -> str:
+        return self.address.spec
+
+
+@dataclass(frozen=True)
+class OwningGoMod:
+    """The `go_module` target for the nearest `go.mod` in the target's directory or an ancestor."""
+
+    address: Address
+
+    @property
+    def module_dir(self) -> str:
+        return self.address.spec_path
+
+
+@rule(desc="Find the owning `go_module` target", level=LogLevel.DEBUG)
+async def find_owning_go_mod(request: OwningGoModRequest) -> OwningGoMod:
+    spec_path = request.address.spec_path
+    candidate_targets = await resolve_targets(
+        **implicitly(
+            RawSpecs(
+                ancestor_globs=(AncestorGlobSpec(spec_path),),
+                description_of_origin="the `go_module` owner rule",
+            )
+        )
+    )
+    module_targets = [tgt for tgt in candidate_targets if tgt.has_field(GoModuleSourcesField)]
+    if not module_targets:
+        raise ResolveError(
+            f"The target {request.address} does not have a `go_module` target in its directory "
+            f"{spec_path or '.'} or any of its ancestor directories, so it is not part of a Go "
+            "module.\n\n"
+            "To fix, add a `go_module` target to the BUILD file in the directory with the "
+            "package's `go.mod` file, e.g. by running `pants tailor ::`."
+        )
+    # The nearest `go.mod` owns the package, just as for the Go toolchain.
+    owner = max(module_targets, key=lambda tgt: len(tgt.address.spec_path))
+    return OwningGoMod(owner.address)
+
+
+_MODULE_DIRECTIVE_RE = re.compile(
+    r"""^\s*module\s+(?:"(?P<quoted>[^"]+)"|(?P<bare>[^\s/]\S*))\s*(?://.*)?$""", re.MULTILINE
+)
+
+
+def parse_module_path(content: str) -> str | None:
+    """The module path declared by the `module` directive of a `go.mod` file."""
+    match = _MODULE_DIRECTIVE_RE.search(content)
+    if not match:
+        return None
+    return match.group("quoted") or match.group("bare")
+
+
+@dataclass(frozen=True)
+class GoModulePathsRequest:
+    module_dirs: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class GoModulePaths:
+    """The module paths of first-party modules, keyed by their buildroot-relative directory."""
+
+    paths: FrozenDict[str, str]
+
+    def package_dir(self, import_path: str) -> str | None:
+        """The directory of a first-party package, or None for packages of other modules."""
+        candidates = [
+            (module_dir, module_path)
+            for module_dir, module_path in self.paths.items()
+            if import_path == module_path or import_path.startswith(f"{module_path}/")
+        ]
+        if not candidates:
+            return None
+        # Nested modules own the packages beneath them, so prefer the longest module path.
+        module_dir, module_path = max(candidates, key=lambda candidate: len(candidate[1]))
+        relative_dir = import_path[len(module_path) :].lstrip("/")
+        return os.path.join(module_dir, relative_dir) if relative_dir else module_dir
+
+    def import_path(self, package_dir: str) -> str | None:
+        """The import path of the first-party package in `package_dir`."""
+        candidates = [
+            module_dir
+            for module_dir in self.paths
+            if not module_dir
+            or package_dir == module_dir
+            or package_dir.startswith(f"{module_dir}/")
+        ]
+        if not candidates:
+            return None
+        module_dir = max(candidates, key=len)
+        relative_dir = package_dir[len(module_dir) :].lstrip("/")
+        module_path = self.paths[module_dir]
+        return f"{module_path}/{relative_dir}" if relative_dir else module_path
+
+
+@rule(desc="Read Go module paths", level=LogLevel.DEBUG)
+async def find_go_module_paths(request: GoModulePathsRequest) -> GoModulePaths:
+    digest_contents = await get_digest_contents(
+        **implicitly(
+            {
+                PathGlobs(
+                    [os.path.join(module_dir, "go.mod") for module_dir in request.module_dirs]
+                ): PathGlobs
+            }
+        )
+    )
+    paths = {}
+    for file_content in digest_contents:
+        module_path = parse_module_path(file_content.content.decode(errors="replace"))
+        if module_path:
+            paths[os.path.dirname(file_content.path)] = module_path
+    return GoModulePaths(FrozenDict(sorted(paths.items())))
+
+
+def rules():
+    return collect_rules()
@@ -0,0 +1,140 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+# Tokens of a `go.mod` line: quoted strings, the `=>` of `replace`, block parentheses, comments,
+# and bare words.
+_TOKEN_RE = re.compile(r'"(?:[^"\\]|\\.)*"|`[^`]*`|=>|[()]|//.*|[^\s()"`]+')
+
+_INDIRECT_COMMENT_RE = re.compile(r"^//\s*indirect\s*(?:;|$)")
+
+
+class GoModParseError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class GoModRequire:
+    path: str
+    version: str
+    indirect: bool
+
+
+@dataclass(frozen=True)
+class GoModReplace:
+    """A `replace` directive. Without `new_version`, `new_path` is a local directory."""
+
+    old_path: str
+    old_version: str | None
+    new_path: str
+    new_version: str | None
+
+    @property
+    def is_local(self) -> bool:
+        return self.new_version is None
+
+
+@dataclass(frozen=True)
+class GoModFile:
+    requires: tuple[GoModRequire, ...]
+    replaces: tuple[GoModReplace, ...]
+
+    def replacement(self, path: str, version: str) -> GoModReplace | None:
+        """The `replace` directive which applies to the module `path` at `version`, if any.
+
+        As for the Go toolchain, a replacement of a specific version takes precedence over one
+        of all versions.
+        """
+        all_versions = None
+        for replace in self.replaces:
+            if replace.old_path != path:
+                continue
+            if replace.old_version == version:
+                return replace
+            if replace.old_version is None:
+                all_versions = replace
+        return all_versions
+
+
+def _unquote(token: str) -> str:
+    if token.startswith("`"):
+        return token[1:-1]
+    if token.startswith('"'):
+        return token[1:-1].encode("latin-1", errors="backslashreplace").decode("unicode_escape")
+    return token
+
+
+def _tokenize(line: str) -> tuple[list[str], str | None]:
+    """Split a line into its tokens and its trailing comment, if any."""
+    tokens = []
+    for token in _TOKEN_RE.findall(line):
+        if token.startswith("//"):
+            return tokens, token
+        tokens.append(token)
+    return tokens, None
+
+
+def _iter_directives(lines: Iterable[str]) -> Iterator[tuple[int, str, list[str], str | None]]:
+    """Yield the line number, verb, arguments and comment of each directive, expanding blocks."""
+    block_verb: str | None = None
+    for lineno, line in enumerate(lines, start=1):
+        tokens, comment = _tokenize(line)
+        if not tokens:
+            continue
+        if block_verb is not None:
+            if tokens == [")"]:
+                block_verb = None
+            else:
+                yield lineno, block_verb, tokens, comment
+            continue
+        verb, *args = tokens
+        if args == ["("]:
+            block_verb = verb
+        elif args[:1] == ["("] and args[-1:] == [")"]:
+            # A block on a single line, e.g. `require ()`.
+            if len(args) > 2:
+                yield lineno, verb, args[1:-1], comment
+        else:
+            yield lineno, verb, args, comment
+    if block_verb is not None:
+        raise GoModParseError(f"Unterminated `{block_verb}` block.")
+
+
+def parse_go_mod(lines: Iterable[str]) -> GoModFile:
+    """Parse the lines of a `go.mod` file.
+
+    Only the `require` and `replace` directives, which determine the third-party modules used, are
+    kept; others, like `exclude` and `retract`, are skipped.
+    """
+    requires = []
+    replaces = []
+    for lineno, verb, args, comment in _iter_directives(lines):
+        if verb == "require":
+            if len(args) != 2:
+                raise GoModParseError(f"Line {lineno}: expected `require <module> <version>`.")
+            indirect = comment is not None and bool(_INDIRECT_COMMENT_RE.match(comment))
+            requires.append(GoModRequire(_unquote(args[0]), _unquote(args[1]), indirect))
+        elif verb == "replace":
+            if "=>" not in args:
+                raise GoModParseError(f"Line {lineno}: expected `replace <old> => <new>`.")
+            arrow = args.index("=>")
+            old, new = args[:arrow], args[arrow + 1 :]
+            if len(old) not in (1, 2) or len(new) not in (1, 2):
+                raise GoModParseError(
+                    f"Line {lineno}: expected `replace <module> [<version>] => <module> "
+                    "[<version>]`."
+                )
+            replaces.append(
+                GoModReplace(
+                    old_path=_unquote(old[0]),
+                    old_version=_unquote(old[1]) if len(old) == 2 else None,
+                    new_path=_unquote(new[0]),
+                    new_version=_unquote(new[1]) if len(new) == 2 else None,
+                )
+            )
+    return GoModFile(requires=tuple(requires), replaces=tuple(replaces))
@@ -0,0 +1,95 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+import textwrap
+
+import pytest
+
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.go_mod_parser import (
+    GoModParseError,
+    GoModReplace,
+    GoModRequire,
+    parse_go_mod,
+)
+
+
+def test_parse_go_mod() -> None:
+    content = textwrap.dedent(
+        """\
+        // Comments are ignored.
+        module "example.com/mod" // trailing comment
+
+        go 1.22
+        toolchain go1.22.3
+
+        require golang.org/x/net v0.20.0
+
+        require (
+            github.com/google/uuid v1.6.0
+            golang.org/x/text v0.14.0 // indirect
+            golang.org/x/sys v0.16.0 // indirectly mentioned
+        )
+
+        require ()
+
+        exclude golang.org/x/net v0.19.0
+        exclude (
+            golang.org/x/text v0.13.0
+        )
+
+        replace github.com/google/uuid => github.com/fork/uuid v1.6.1
+        replace (
+            golang.org/x/sys v0.16.0 => ../sys
+            `golang.org/x/text` v0.14.0 => golang.org/x/text v0.15.0
+        )
+
+        retract v1.0.0
+        """
+    )
+    go_mod = parse_go_mod(content.splitlines())
+    assert go_mod.requires == (
+        GoModRequire("golang.org/x/net", "v0.20.0", indirect=False),
+        GoModRequire("github.com/google/uuid", "v1.6.0", indirect=False),
+        GoModRequire("golang.org/x/text", "v0.14.0", indirect=True),
+        GoModRequire("golang.org/x/sys", "v0.16.0", indirect=False),
+    )
+    assert go_mod.replaces == (
+        GoModReplace("github.com/google/uuid", None, "github.com/fork/uuid", "v1.6.1"),
+        GoModReplace("golang.org/x/sys", "v0.16.0", "../sys", None),
+        GoModReplace("golang.org/x/text", "v0.14.0", "golang.org/x/text", "v0.15.0"),
+    )
+
+    uuid_replace = go_mod.replacement("github.com/google/uuid", "v1.6.0")
+    assert uuid_replace is not None and not uuid_replace.is_local
+    sys_replace = go_mod.replacement("golang.org/x/sys", "v0.16.0")
+    assert sys_replace is not None and sys_replace.is_local
+    assert go_mod.replacement("golang.org/x/sys", "v0.17.0") is None
+    assert go_mod.replacement("golang.org/x/net", "v0.20.0") is None
+
+
+def test_parse_go_mod_prefers_version_specific_replacements() -> None:
+    go_mod = parse_go_mod(
+        [
+            "module example.com/mod",
+            "replace example.com/dep => example.com/all v1.0.0",
+            "replace example.com/dep v1.2.0 => example.com/specific v1.0.0",
+        ]
+    )
+    replace = go_mod.replacement("example.com/dep", "v1.2.0")
+    assert replace is not None and replace.new_path == "example.com/specific"
+    replace = go_mod.replacement("example.com/dep", "v1.3.0")
+    assert replace is not None and replace.new_path == "example.com/all"
+
+
+@pytest.mark.parametrize(
+    "lines",
+    [
+        ["require example.com/dep"],
+        ["require (", "example.com/dep v1.0.0"],
+        ["replace example.com/dep v1.0.0"],
+        ["replace => ../dep"],
+    ],
+)
+def test_parse_go_mod_errors(lines: list[str]) -> None:
+    with pytest.raises(GoModParseError):
+        parse_go_mod(lines)
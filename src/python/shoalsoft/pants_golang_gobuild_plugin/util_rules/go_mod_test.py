@@ -0,0 +1,38 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+from pants.util.frozendict import FrozenDict
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.go_mod import (
+    GoModulePaths,
+    parse_module_path,
+)
+
+
+def test_parse_module_path() -> None:
+    assert parse_module_path("// comment\nmodule example.com/foo // trailing\n\ngo 1.21\n") == (
+        "example.com/foo"
+    )
+    assert parse_module_path('module "example.com/quoted"\n') == "example.com/quoted"
+    assert parse_module_path("go 1.21\n") is None
+
+
+def test_package_dir_and_import_path() -> None:
+    module_paths = GoModulePaths(
+        FrozenDict(
+            {
+                "": "example.com/root",
+                "nested": "example.com/root/nested",
+                "other": "example.com/other",
+            }
+        )
+    )
+    assert module_paths.package_dir("example.com/root") == ""
+    assert module_paths.package_dir("example.com/root/pkg/sub") == "pkg/sub"
+    assert module_paths.package_dir("example.com/root/nested/pkg") == "nested/pkg"
+    assert module_paths.package_dir("example.com/other") == "other"
+    assert module_paths.package_dir("example.com/rootless") is None
+    assert module_paths.package_dir("fmt") is None
+    assert module_paths.import_path("") == "example.com/root"
+    assert module_paths.import_path("pkg/sub") == "example.com/root/pkg/sub"
+    assert module_paths.import_path("nested/pkg") == "example.com/root/nested/pkg"
+    assert module_paths.import_path("other") == "example.com/other"
@@ -0,0 +1,121 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from pants.engine.engine_aware import EngineAwareParameter
+from pants.engine.env_vars import EnvironmentVarsRequest
+from pants.engine.fs import CreateDigest, Digest, FileContent, MergeDigests
+from pants.engine.internals.platform_rules import environment_vars_subset
+from pants.engine.intrinsics import create_digest, merge_digests
+from pants.engine.rules import collect_rules, concurrently, implicitly, rule
+from pants.util.frozendict import FrozenDict
+from pants.util.logging import LogLevel
+from shoalsoft.pants_golang_gobuild_plugin.subsystems.golang import GolangSubsystem
+from shoalsoft.pants_golang_gobuild_plugin.util_rules import module_sources
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.go_cache import SANDBOX_CACHE_ENV
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.go_work import (
+    go_work_version,
+    synthesize_go_work,
+)
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.goroot import GoRoot
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.module_sources import (
+    GoModuleSourcesRequest,
+    capture_go_module_sources,
+)
+
+# Name of the `go.work` file synthesized for the modules in a sandbox.
+SANDBOX_GO_WORK_FILE = "__go.work"
+
+_C_TOOLCHAIN_ENV_VARS = ("PATH", "CC", "CXX")
+
+
+@dataclass(frozen=True)
+class GoSandboxRequest(EngineAwareParameter):
+    """Request for a sandbox in which the `go` tool can build the given modules hermetically."""
+
+    module_dirs: tuple[str, ...]
+
+    def debug_hint(self) -> str:
+        return ", ".join(module_dir or "." for module_dir in self.module_dirs)
+
+
+@dataclass(frozen=True)
+class GoSandbox:
+    """The files and environment for running the `go` tool in a sandbox.
+
+    The sandbox contains the sources of each module, laid out as in the build root, and a
+    synthesized `go.work` file using them. `env` points `go` at that workspace and at caches which
+    are independent of the machine, since the environment is part of the process cache key. It
+    does not include `PATH`: see `GoCgoEnv`.
+    """
+
+    digest: Digest
+    env: FrozenDict[str, str]
+
+
+@rule(desc="Set up Go sandbox", level=LogLevel.DEBUG)
+async def setup_go_sandbox(request: GoSandboxRequest, goroot: GoRoot) -> GoSandbox:
+    all_module_sources = await concurrently(
+        capture_go_module_sources(GoModuleSourcesRequest(module_dir))
+        for module_dir in request.module_dirs
+    )
+    go_work_digest = await create_digest(
+        CreateDigest(
+            [
+                FileContent(
+                    SANDBOX_GO_WORK_FILE,
+                    synthesize_go_work(
+                        request.module_dirs, go_version=go_work_version(goroot), base_dir="."
+                    ),
+                )
+            ]
+        )
+    )
+    digest = await merge_digests(
+        MergeDigests([go_work_digest, *(sources.digest for sources in all_module_sources)])
+    )
+    return GoSandbox(
+        digest=digest,
+        env=FrozenDict(
+            {
+                **SANDBOX_CACHE_ENV,
+                "GOWORK": f"{{chroot}}/{SANDBOX_GO_WORK_FILE}",
+                "GOTOOLCHAIN": "local",
+                # GOROOT is referenced by absolute path rather than captured in the sandbox, so its
+                # version and target platform invalidate cached results when the toolchain changes.
+                "__SHOALSOFT_GO_SDK": f"{goroot.full_version}/{goroot.goos}/{goroot.goarch}",
+            }
+        ),
+    )
+
+
+@dataclass(frozen=True)
+class GoCgoEnv:
+    """The environment selecting whether the `go` tool uses cgo in a sandbox.
+
+    `CGO_ENABLED` is always set: otherwise, Go 1.20+ disables cgo when it finds no C compiler, as
+    in a sandbox without a `PATH`, and silently skips cgo files and their imports.
+    """
+
+    env: FrozenDict[str, str]
+
+
+@rule(desc="Set up Go cgo environment", level=LogLevel.DEBUG)
+async def setup_go_cgo_env(golang_subsystem: GolangSubsystem) -> GoCgoEnv:
+    if not golang_subsystem.cgo_enabled:
+        return GoCgoEnv(FrozenDict({"CGO_ENABLED": "0"}))
+    # The C toolchain is found on the `PATH`, unless it is configured explicitly.
+    env_vars = await environment_vars_subset(
+        **implicitly(EnvironmentVarsRequest(_C_TOOLCHAIN_ENV_VARS, allowed=_C_TOOLCHAIN_ENV_VARS))
+    )
+    return GoCgoEnv(FrozenDict({"CGO_ENABLED": "1", **env_vars}))
+
+
+def rules():
+    return (
+        *collect_rules(),
+        *module_sources.rules(),
+    )
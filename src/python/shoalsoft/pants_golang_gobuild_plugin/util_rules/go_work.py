@@ -0,0 +1,161 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from typing import Iterable
+
+from pants.engine.fs import PathGlobs
+from pants.engine.intrinsics import get_digest_contents
+from pants.engine.rules import collect_rules, implicitly, rule
+from pants.util.logging import LogLevel
+from pants.util.ordered_set import FrozenOrderedSet
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.goroot import GoRoot
+
+
+def _strip_comment(line: str) -> str:
+    # `//` starts a line comment in `go.work` files.
+    return line.split("//", 1)[0].strip()
+
+
+def _unquote(value: str) -> str:
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in ('"', "`"):
+        return value[1:-1]
+    return value
+
+
+def parse_go_work_uses(content: str) -> tuple[str, ...]:
+    """Return the module directories from the `use` directives of a `go.work` file.
+
+    The directories are returned exactly as written, i.e. relative to the `go.work` file unless
+    they are absolute.
+    """
+    uses: list[str] = []
+    in_use_block = False
+    for raw_line in content.splitlines():
+        line = _strip_comment(raw_line)
+        if not line:
+            continue
+        if in_use_block:
+            if line == ")":
+                in_use_block = False
+            else:
+                uses.append(_unquote(line))
+            continue
+        directive, _, rest = line.partition(" ")
+        if directive != "use":
+            continue
+        rest = rest.strip()
+        if rest == "(":
+            in_use_block = True
+        elif rest:
+            uses.append(_unquote(rest))
+    return tuple(uses)
+
+
+@dataclass(frozen=True)
+class GoWorkFile:
+    """A `go.work` file in the repository and the module directories it uses."""
+
+    path: str
+    module_dirs: FrozenOrderedSet[str]
+
+    @property
+    def dir(self) -> str:
+        return os.path.dirname(self.path)
+
+
+@dataclass(frozen=True)
+class FindGoWorkFilesRequest:
+    module_dirs: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class GoWorkFiles:
+    files: tuple[GoWorkFile, ...]
+
+    def workspace_for(self, module_dir: str) -> GoWorkFile | None:
+        """The nearest `go.work` file in an ancestor directory which uses the module."""
+        candidates = [
+            work_file
+            for work_file in self.files
+            if module_dir in work_file.module_dirs
+            and (not work_file.dir or f"{module_dir}/".startswith(f"{work_file.dir}/"))
+        ]
+        if not candidates:
+            return None
+        return max(candidates, key=lambda work_file: len(work_file.dir))
+
+
+def _normalize_dir(path: str) -> str:
+    normalized = os.path.normpath(path)
+    return "" if normalized == "." else normalized
+
+
+def _ancestor_dirs(path: str) -> Iterable[str]:
+    while path:
+        yield path
+        path = os.path.dirname(path)
+    yield ""
+
+
+@rule(desc="Find `go.work` files", level=LogLevel.DEBUG)
+async def find_go_work_files(request: FindGoWorkFilesRequest) -> GoWorkFiles:
+    candidate_paths = sorted(
+        {
+            os.path.join(ancestor, "go.work")
+            for module_dir in request.module_dirs
+            for ancestor in _ancestor_dirs(module_dir)
+        }
+    )
+    digest_contents = await get_digest_contents(
+        **implicitly({PathGlobs(candidate_paths): PathGlobs})
+    )
+
+    files = []
+    for file_content in digest_contents:
+        work_dir = os.path.dirname(file_content.path)
+        uses = parse_go_work_uses(file_content.content.decode(errors="replace"))
+        files.append(
+            GoWorkFile(
+                path=file_content.path,
+                module_dirs=FrozenOrderedSet(
+                    _normalize_dir(os.path.join(work_dir, use))
+                    for use in uses
+                    if not os.path.isabs(use)
+                ),
+            )
+        )
+    return GoWorkFiles(tuple(files))
+
+
+def go_work_version(goroot: GoRoot) -> str:
+    """The version to use for the `go` directive of a synthesized `go.work` file.
+
+    Since Go 1.21, a workspace's `go` version must be at least that of every module it uses, so
+    the full toolchain version is used where it is accepted.
+    """
+    if not goroot.is_compatible_version("1.21"):
+        return goroot.version
+    return goroot.full_version.removeprefix("go").split()[0]
+
+
+def synthesize_go_work(module_dirs: Iterable[str], *, go_version: str, base_dir: str) -> bytes:
+    """Render a `go.work` file using the given buildroot-relative module directories.
+
+    `base_dir` is the location of the build root as seen by the process using the file, e.g. its
+    absolute path, or `.` for a sandbox laid out like the build root.
+    """
+    lines = [f"go {go_version}", "", "use ("]
+    for module_dir in module_dirs:
+        path = os.path.join(base_dir, module_dir) if module_dir else base_dir
+        lines.append(f"\t{json.dumps(path) if ' ' in path else path}")
+    lines.append(")")
+    return ("\n".join(lines) + "\n").encode()
+
+
+def rules():
+    return collect_rules()
@@ -0,0 +1,54 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+from __future__ import annotations
+
+import textwrap
+
+from pants.util.ordered_set import FrozenOrderedSet
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.go_work import (
+    GoWorkFile,
+    GoWorkFiles,
+    parse_go_work_uses,
+    synthesize_go_work,
+)
+
+
+def test_parse_go_work_uses() -> None:
+    content = textwrap.dedent(
+        """\
+        go 1.22
+
+        // A comment mentioning use ./not-a-module
+        use ./tools // trailing comment
+
+        use (
+            ./a
+            "./b with spaces"
+            ../outside
+        )
+
+        replace example.com/x => ./x
+        """
+    )
+    assert parse_go_work_uses(content) == ("./tools", "./a", "./b with spaces", "../outside")
+
+
+def test_workspace_for() -> None:
+    root_work = GoWorkFile("go.work", FrozenOrderedSet(["a", "nested/b"]))
+    nested_work = GoWorkFile("nested/go.work", FrozenOrderedSet(["nested/b", "nested/c"]))
+    go_work_files = GoWorkFiles((root_work, nested_work))
+
+    assert go_work_files.workspace_for("a") == root_work
+    assert go_work_files.workspace_for("nested/b") == nested_work
+    assert go_work_files.workspace_for("nested/c") == nested_work
+    assert go_work_files.workspace_for("unused") is None
+
+
+def test_synthesize_go_work() -> None:
+    assert synthesize_go_work(["", "a/b"], go_version="1.22.1", base_dir="/repo") == (
+        b"go 1.22.1\n\nuse (\n\t/repo\n\t/repo/a/b\n)\n"
+    )
+    assert synthesize_go_work(["", "a/b"], go_version="1.21", base_dir=".") == (
+        b"go 1.21\n\nuse (\n\t.\n\t./a/b\n)\n"
+    )
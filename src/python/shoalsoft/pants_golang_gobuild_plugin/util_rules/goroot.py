@@ -20,11 +20,12 @@ from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 from pants.util.strutil import bullet_list, softwrap
 from shoalsoft.pants_golang_gobuild_plugin.subsystems.golang import GolangSubsystem
-from shoalsoft.pants_golang_gobuild_plugin.util_rules import go_bootstrap
+from shoalsoft.pants_golang_gobuild_plugin.util_rules import go_bootstrap, go_cache
 from shoalsoft.pants_golang_gobuild_plugin.util_rules.go_bootstrap import (
     GoBootstrap,
     compatible_go_version,
 )
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.go_cache import GoCacheDirs
 
 logger = logging.getLogger(__name__)
 
@@ -54,11 +55,16 @@ class GoRoot:
     def goarch(self) -> str:
         return self._raw_metadata["GOARCH"]
 
+    @property
+    def build_cache_path(self) -> str:
+        return self._raw_metadata["GOCACHE"]
+
 
 @rule(desc="Find Go binary", level=LogLevel.DEBUG)
 async def setup_goroot(
     golang_subsystem: GolangSubsystem,
     go_bootstrap: GoBootstrap,
+    go_cache_dirs: GoCacheDirs,
     env_target: EnvironmentTarget,
 ) -> GoRoot:
     search_paths = go_bootstrap.go_search_paths
@@ -128,7 +134,7 @@ async def setup_goroot(
                         description=f"Determine Go SDK metadata for {binary_path.path}",
                         level=LogLevel.DEBUG,
                         cache_scope=env_target.executable_search_path_cache_scope(),
-                        env={"GOPATH": "/does/not/matter"},
+                        env={"GOPATH": "/does/not/matter", **go_cache_dirs.env},
                     ),
                 )
             )
@@ -172,4 +178,5 @@ def rules():
     return (
         *collect_rules(),
         *go_bootstrap.rules(),
+        *go_cache.rules(),
     )
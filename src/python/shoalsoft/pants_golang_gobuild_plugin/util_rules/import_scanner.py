@@ -0,0 +1,88 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+from __future__ import annotations
+
+import re
+from typing import Iterator
+
+# Tokens of the prologue of a Go file. Whitespace and comments are matched so that they can be
+# skipped; any other single character is matched as punctuation.
+_TOKEN_RE = re.compile(
+    rb"""
+    (?P<skip>\s+|//[^\n]*|/\*.*?\*/)
+    |(?P<string>"(?:[^"\\\n]|\\.)*"|`[^`]*`)
+    |(?P<ident>[A-Za-z_][A-Za-z0-9_]*)
+    |(?P<punct>.)
+    """,
+    re.DOTALL | re.VERBOSE,
+)
+
+# A `//go:embed` directive, which must start a line comment of its own.
+_EMBED_DIRECTIVE_RE = re.compile(rb"^[ \t]*//go:embed[ \t]+([^\r\n]*)", re.MULTILINE)
+
+_EMBED_PATTERN_RE = re.compile(rb'"(?:[^"\\]|\\.)*"|`[^`]*`|\S+')
+
+
+def _tokens(content: bytes) -> Iterator[bytes]:
+    # NB: `finditer` is lazy, so only as much of the file is tokenized as the caller consumes.
+    for match in _TOKEN_RE.finditer(content):
+        if match.lastgroup != "skip":
+            yield match.group()
+
+
+def _unquote(literal: bytes) -> str:
+    value = literal[1:-1].decode("utf-8", errors="replace")
+    if literal.startswith(b'"') and "\\" in value:
+        value = value.encode("latin-1", errors="backslashreplace").decode("unicode_escape")
+    return value
+
+
+def scan_go_imports(content: bytes) -> tuple[str, ...]:
+    """Return the import paths of a Go source file.
+
+    Imports must precede all other declarations, so scanning stops at the first token after the
+    `package` clause that does not belong to an import declaration: the rest of the file is never
+    tokenized. The pseudo-package `C` of cgo is omitted.
+    """
+    tokens = _tokens(content)
+    if next(tokens, None) != b"package" or next(tokens, None) is None:
+        return ()
+
+    imports: list[str] = []
+
+    def add(literal: bytes) -> None:
+        if literal[:1] in (b'"', b"`"):
+            path = _unquote(literal)
+            if path != "C":
+                imports.append(path)
+
+    for token in tokens:
+        if token == b";":
+            continue
+        if token != b"import":
+            break
+        token = next(tokens, b"")
+        if token != b"(":
+            # A single import spec: an optional name followed by the path.
+            add(token if token[:1] in (b'"', b"`") else next(tokens, b""))
+            continue
+        for token in tokens:
+            if token == b")":
+                break
+            add(token)
+    return tuple(imports)
+
+
+def scan_go_embed_patterns(content: bytes) -> tuple[str, ...]:
+    """Return the patterns of the `//go:embed` directives of a Go source file."""
+    if b"//go:embed" not in content:
+        return ()
+    patterns = []
+    for directive in _EMBED_DIRECTIVE_RE.finditer(content):
+        for token in _EMBED_PATTERN_RE.findall(directive.group(1)):
+            if token[:1] in (b'"', b"`"):
+                patterns.append(_unquote(token))
+            else:
+                patterns.append(token.decode("utf-8", errors="replace"))
+    return tuple(patterns)
@@ -0,0 +1,85 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+import textwrap
+
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.import_scanner import (
+    scan_go_embed_patterns,
+    scan_go_imports,
+)
+
+
+def test_scan_go_imports() -> None:
+    content = textwrap.dedent(
+        """\
+        //go:build linux
+
+        // Package foo does things. /* Not a comment.
+        package foo // import "example.com/ignored"
+
+        /* import "commented/out" */
+        import "fmt"
+        import (
+            "os"
+            str "strings"
+            . "example.com/m/dot"
+            _ "embed" // Trailing comment.
+            `example.com/raw`
+        )
+
+        // #include <stdio.h>
+        import "C"
+        import ("a"; "b")
+
+        func main() {}
+
+        import "after/declarations"
+        """
+    ).encode()
+    assert scan_go_imports(content) == (
+        "fmt",
+        "os",
+        "strings",
+        "example.com/m/dot",
+        "embed",
+        "example.com/raw",
+        "a",
+        "b",
+    )
+
+
+def test_scan_go_imports_edge_cases() -> None:
+    assert scan_go_imports(b"") == ()
+    assert scan_go_imports(b"package main\n") == ()
+    assert scan_go_imports(b"not Go") == ()
+    assert scan_go_imports(b'package x; import "\\u0061b"') == ("ab",)
+    # The rest of the file is not tokenized, even if it is not valid Go.
+    assert scan_go_imports(b'package x\nimport "y"\nvar z = "\xff unterminated') == ("y",)
+
+
+def test_scan_go_embed_patterns() -> None:
+    content = textwrap.dedent(
+        """\
+        package x
+
+        import "embed"
+
+        //go:embed static/*.html version.txt
+        var static embed.FS
+
+        var (
+            //go:embed "with space.txt" `raw.txt` all:templates
+            templates embed.FS
+        )
+
+        // Not a directive: //go:embed ignored.txt
+        """
+    ).encode()
+    assert scan_go_embed_patterns(content) == (
+        "static/*.html",
+        "version.txt",
+        "with space.txt",
+        "raw.txt",
+        "all:templates",
+    )
+    assert scan_go_embed_patterns(b'package x\n\nimport "fmt"\n') == ()
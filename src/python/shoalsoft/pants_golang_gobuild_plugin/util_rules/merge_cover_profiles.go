@@ -0,0 +1,247 @@
+// Pants Plugin to invoke Official Go toolchain.
+// Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+// Merge `go test -coverprofile` profiles into a single profile:
+//
+//	go run merge_cover_profiles.go OUTPUT PROFILE...
+//
+// Each profile is sorted by block position on its own and written back out, and the sorted
+// profiles are then merged block by block while the merged profile is written. Only one profile
+// is held in memory at a time. Counts of the same block are summed, or combined as a flag in
+// `set` mode. Profiles of different modes are normalized: if any is in `set` mode, the merged
+// profile is too, and otherwise counts from `count` and `atomic` profiles are summed as `count`.
+package main
+
+import (
+	"bufio"
+	"container/heap"
+	"fmt"
+	"os"
+	"sort"
+	"strconv"
+	"strings"
+)
+
+type block struct {
+	location                             string
+	file                                 string
+	startLine, startCol, endLine, endCol int
+	stmts, count                         int
+}
+
+func parseBlock(line string) (block, error) {
+	// Each block is written as `file:startLine.startCol,endLine.endCol numStmts count`.
+	fields := strings.Fields(line)
+	if len(fields) != 3 {
+		return block{}, fmt.Errorf("malformed coverage block %q", line)
+	}
+	b := block{location: fields[0]}
+	i := strings.LastIndex(b.location, ":")
+	if i < 0 {
+		return block{}, fmt.Errorf("malformed coverage block %q", line)
+	}
+	b.file = b.location[:i]
+	if _, err := fmt.Sscanf(
+		b.location[i+1:], "%d.%d,%d.%d", &b.startLine, &b.startCol, &b.endLine, &b.endCol,
+	); err != nil {
+		return block{}, fmt.Errorf("malformed coverage block %q: %v", line, err)
+	}
+	var err error
+	if b.stmts, err = strconv.Atoi(fields[1]); err != nil {
+		return block{}, fmt.Errorf("malformed coverage block %q: %v", line, err)
+	}
+	if b.count, err = strconv.Atoi(fields[2]); err != nil {
+		return block{}, fmt.Errorf("malformed coverage block %q: %v", line, err)
+	}
+	return b, nil
+}
+
+func less(a, b *block) bool {
+	if a.file != b.file {
+		return a.file < b.file
+	}
+	if a.startLine != b.startLine {
+		return a.startLine < b.startLine
+	}
+	if a.startCol != b.startCol {
+		return a.startCol < b.startCol
+	}
+	if a.endLine != b.endLine {
+		return a.endLine < b.endLine
+	}
+	return a.endCol < b.endCol
+}
+
+// sortProfile sorts the blocks of the profile at path into path + ".sorted", returning its mode.
+func sortProfile(path string) (string, error) {
+	data, err := os.ReadFile(path)
+	if err != nil {
+		return "", err
+	}
+	mode := ""
+	var blocks []block
+	for _, line := range strings.Split(string(data), "\n") {
+		line = strings.TrimSpace(line)
+		if line == "" {
+			continue
+		}
+		if strings.HasPrefix(line, "mode:") {
+			if mode == "" {
+				mode = strings.TrimSpace(strings.TrimPrefix(line, "mode:"))
+			}
+			continue
+		}
+		b, err := parseBlock(line)
+		if err != nil {
+			return "", fmt.Errorf("%s: %v", path, err)
+		}
+		blocks = append(blocks, b)
+	}
+	sort.SliceStable(blocks, func(i, j int) bool { return less(&blocks[i], &blocks[j]) })
+
+	f, err := os.Create(path + ".sorted")
+	if err != nil {
+		return "", err
+	}
+	w := bufio.NewWriter(f)
+	for _, b := range blocks {
+		fmt.Fprintf(w, "%s %d %d\n", b.location, b.stmts, b.count)
+	}
+	if err := w.Flush(); err != nil {
+		return "", err
+	}
+	return mode, f.Close()
+}
+
+func mergedMode(modes []string) string {
+	merged := ""
+	for _, mode := range modes {
+		switch {
+		case mode == "" || mode == merged:
+		case merged == "":
+			merged = mode
+		case mode == "set" || merged == "set":
+			merged = "set"
+		default:
+			merged = "count"
+		}
+	}
+	if merged == "" {
+		return "set"
+	}
+	return merged
+}
+
+type cursor struct {
+	scanner *bufio.Scanner
+	current block
+}
+
+func (c *cursor) advance() (bool, error) {
+	if !c.scanner.Scan() {
+		return false, c.scanner.Err()
+	}
+	b, err := parseBlock(c.scanner.Text())
+	c.current = b
+	return err == nil, err
+}
+
+type cursorHeap []*cursor
+
+func (h cursorHeap) Len() int            { return len(h) }
+func (h cursorHeap) Less(i, j int) bool  { return less(&h[i].current, &h[j].current) }
+func (h cursorHeap) Swap(i, j int)       { h[i], h[j] = h[j], h[i] }
+func (h *cursorHeap) Push(x interface{}) { *h = append(*h, x.(*cursor)) }
+func (h *cursorHeap) Pop() interface{} {
+	old := *h
+	c := old[len(old)-1]
+	*h = old[:len(old)-1]
+	return c
+}
+
+func merge(output string, profiles []string) error {
+	modes := make([]string, len(profiles))
+	for i, profile := range profiles {
+		mode, err := sortProfile(profile)
+		if err != nil {
+			return err
+		}
+		modes[i] = mode
+	}
+	mode := mergedMode(modes)
+
+	h := cursorHeap{}
+	for _, profile := range profiles {
+		f, err := os.Open(profile + ".sorted")
+		if err != nil {
+			return err
+		}
+		defer f.Close()
+		c := &cursor{scanner: bufio.NewScanner(f)}
+		c.scanner.Buffer(make([]byte, 64*1024), 1024*1024)
+		if ok, err := c.advance(); err != nil {
+			return err
+		} else if ok {
+			h = append(h, c)
+		}
+	}
+	heap.Init(&h)
+
+	f, err := os.Create(output)
+	if err != nil {
+		return err
+	}
+	w := bufio.NewWriter(f)
+	fmt.Fprintf(w, "mode: %s\n", mode)
+	var pending *block
+	flush := func() {
+		if pending == nil {
+			return
+		}
+		if mode == "set" && pending.count > 1 {
+			pending.count = 1
+		}
+		fmt.Fprintf(w, "%s %d %d\n", pending.location, pending.stmts, pending.count)
+	}
+	for h.Len() > 0 {
+		c := h[0]
+		b := c.current
+		if pending != nil && pending.location == b.location {
+			if mode == "set" {
+				if b.count > pending.count {
+					pending.count = b.count
+				}
+			} else {
+				pending.count += b.count
+			}
+		} else {
+			flush()
+			pending = &b
+		}
+		ok, err := c.advance()
+		if err != nil {
+			return err
+		}
+		if ok {
+			heap.Fix(&h, 0)
+		} else {
+			heap.Pop(&h)
+		}
+	}
+	flush()
+	if err := w.Flush(); err != nil {
+		return err
+	}
+	return f.Close()
+}
+
+func main() {
+	if len(os.Args) < 2 {
+		fmt.Fprintln(os.Stderr, "usage: merge_cover_profiles OUTPUT PROFILE...")
+		os.Exit(2)
+	}
+	if err := merge(os.Args[1], os.Args[2:]); err != nil {
+		fmt.Fprintln(os.Stderr, err)
+		os.Exit(1)
+	}
+}
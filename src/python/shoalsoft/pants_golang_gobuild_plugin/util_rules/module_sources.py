@@ -0,0 +1,150 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+
+from pants.engine.engine_aware import EngineAwareParameter
+from pants.engine.fs import CreateDigest, Digest, FileEntry, MergeDigests, PathGlobs
+from pants.engine.intrinsics import (
+    create_digest,
+    get_digest_contents,
+    get_digest_entries,
+    merge_digests,
+    path_globs_to_digest,
+    path_globs_to_paths,
+)
+from pants.engine.rules import collect_rules, concurrently, rule
+from pants.util.logging import LogLevel
+from shoalsoft.pants_golang_gobuild_plugin.target_types import GoPackageSourcesField
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.import_scanner import scan_go_embed_patterns
+
+# The files of a module which can affect how it builds, besides the files its packages embed.
+_BUILD_FILE_GLOBS = (
+    "go.mod",
+    "go.sum",
+    "vendor/modules.txt",
+    *(f"**/*{ext}" for ext in GoPackageSourcesField.expected_file_extensions),
+)
+
+# Files are scanned under a fixed name, so that scans are memoized by content alone.
+_SCANNED_FILE = "scanned.go"
+
+
+@dataclass(frozen=True)
+class GoModuleSourcesRequest(EngineAwareParameter):
+    """Request for the files needed to build the Go module rooted at `module_dir`."""
+
+    module_dir: str
+
+    def debug_hint(self) -> str:
+        return self.module_dir or "."
+
+
+@dataclass(frozen=True)
+class GoModuleSources:
+    """The files of a Go module which affect its build, laid out relative to the build root.
+
+    This includes `go.mod`, `go.sum`, package sources and any files they embed, but excludes the
+    files of nested modules, which the Go toolchain ignores. Other files, e.g. documentation, are
+    excluded too, so that changing them does not invalidate builds.
+    """
+
+    module_dir: str
+    digest: Digest
+
+
+@dataclass(frozen=True)
+class GoModuleFilesRequest(EngineAwareParameter):
+    """Request for every file of the Go module rooted at `module_dir` beneath `subdir`."""
+
+    module_dir: str
+    subdir: str
+
+    def debug_hint(self) -> str:
+        return self.subdir or "."
+
+
+@dataclass(frozen=True)
+class GoModuleFiles:
+    """All of the files of a directory tree of a Go module, e.g. the data read by tests.
+
+    As for `GoModuleSources`, the files of nested modules are excluded.
+    """
+
+    digest: Digest
+
+
+@dataclass(frozen=True)
+class GoFileEmbedsRequest:
+    """Request for the `//go:embed` patterns of the single Go file in `digest`."""
+
+    digest: Digest
+
+
+@dataclass(frozen=True)
+class GoFileEmbeds:
+    patterns: tuple[str, ...]
+
+
+@rule(desc="Scan Go embed patterns", level=LogLevel.TRACE)
+async def scan_go_file_embeds(request: GoFileEmbedsRequest) -> GoFileEmbeds:
+    contents = await get_digest_contents(request.digest)
+    return GoFileEmbeds(scan_go_embed_patterns(contents[0].content) if contents else ())
+
+
+async def _nested_module_excludes(module_dir: str, subdir: str) -> list[str]:
+    go_mod_paths = await path_globs_to_paths(PathGlobs([os.path.join(subdir, "**", "go.mod")]))
+    nested_module_dirs = sorted(
+        {os.path.dirname(path) for path in go_mod_paths.files} - {module_dir}
+    )
+    return [f"!{os.path.join(nested_dir, '**')}" for nested_dir in nested_module_dirs]
+
+
+@rule(desc="Capture Go module sources", level=LogLevel.DEBUG)
+async def capture_go_module_sources(request: GoModuleSourcesRequest) -> GoModuleSources:
+    module_dir = request.module_dir
+    excludes = await _nested_module_excludes(module_dir, module_dir)
+    build_files_digest = await path_globs_to_digest(
+        PathGlobs([*(os.path.join(module_dir, glob) for glob in _BUILD_FILE_GLOBS), *excludes])
+    )
+
+    go_file_entries = [
+        entry
+        for entry in await get_digest_entries(build_files_digest)
+        if isinstance(entry, FileEntry) and entry.path.endswith(".go")
+    ]
+    file_digests = await concurrently(
+        create_digest(CreateDigest([FileEntry(_SCANNED_FILE, entry.file_digest)]))
+        for entry in go_file_entries
+    )
+    all_embeds = await concurrently(
+        scan_go_file_embeds(GoFileEmbedsRequest(digest)) for digest in file_digests
+    )
+    embed_globs = []
+    for entry, embeds in zip(go_file_entries, all_embeds):
+        for pattern in embeds.patterns:
+            # A pattern matching a directory embeds the directory's whole tree.
+            path = os.path.join(os.path.dirname(entry.path), pattern.removeprefix("all:"))
+            embed_globs.extend([path, os.path.join(path, "**")])
+    if not embed_globs:
+        return GoModuleSources(module_dir=module_dir, digest=build_files_digest)
+
+    embedded_files_digest = await path_globs_to_digest(PathGlobs([*embed_globs, *excludes]))
+    digest = await merge_digests(MergeDigests([build_files_digest, embedded_files_digest]))
+    return GoModuleSources(module_dir=module_dir, digest=digest)
+
+
+@rule(desc="Capture Go module files", level=LogLevel.DEBUG)
+async def capture_go_module_files(request: GoModuleFilesRequest) -> GoModuleFiles:
+    excludes = await _nested_module_excludes(request.module_dir, request.subdir)
+    digest = await path_globs_to_digest(
+        PathGlobs([os.path.join(request.subdir, "**", "*"), *excludes])
+    )
+    return GoModuleFiles(digest)
+
+
+def rules():
+    return collect_rules()
@@ -0,0 +1,80 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+import textwrap
+
+import pytest
+
+from pants.engine.fs import Digest, DigestContents
+from pants.testutil.rule_runner import QueryRule, RuleRunner
+from shoalsoft.pants_golang_gobuild_plugin.util_rules import module_sources
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.module_sources import (
+    GoModuleFiles,
+    GoModuleFilesRequest,
+    GoModuleSources,
+    GoModuleSourcesRequest,
+)
+
+
+@pytest.fixture
+def rule_runner() -> RuleRunner:
+    return RuleRunner(
+        rules=[
+            *module_sources.rules(),
+            QueryRule(GoModuleSources, (GoModuleSourcesRequest,)),
+            QueryRule(GoModuleFiles, (GoModuleFilesRequest,)),
+            QueryRule(DigestContents, (Digest,)),
+        ]
+    )
+
+
+def _paths(rule_runner: RuleRunner, digest: Digest) -> set[str]:
+    return {fc.path for fc in rule_runner.request(DigestContents, [digest])}
+
+
+def test_module_sources_only_capture_build_files(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "go.mod": "module example.com/root\ngo 1.21\n",
+            "go.sum": "",
+            "README.md": "Not part of the build.",
+            "BUILD": "",
+            "root.go": "package root\n",
+            "asm/asm_amd64.s": "",
+            "web/web.go": textwrap.dedent(
+                """\
+                package web
+
+                import "embed"
+
+                //go:embed static version.txt
+                var files embed.FS
+                """
+            ),
+            "web/static/index.html": "<html/>",
+            "web/version.txt": "1",
+            "web/notes.txt": "Not embedded.",
+            "web/testdata/golden.txt": "Read by tests.",
+            "nested/go.mod": "module example.com/nested\ngo 1.21\n",
+            "nested/nested.go": "package nested\n",
+        }
+    )
+    sources = rule_runner.request(GoModuleSources, [GoModuleSourcesRequest("")])
+    assert _paths(rule_runner, sources.digest) == {
+        "go.mod",
+        "go.sum",
+        "root.go",
+        "asm/asm_amd64.s",
+        "web/web.go",
+        "web/static/index.html",
+        "web/version.txt",
+    }
+
+    files = rule_runner.request(GoModuleFiles, [GoModuleFilesRequest("", "web")])
+    assert _paths(rule_runner, files.digest) == {
+        "web/web.go",
+        "web/static/index.html",
+        "web/version.txt",
+        "web/notes.txt",
+        "web/testdata/golden.txt",
+    }
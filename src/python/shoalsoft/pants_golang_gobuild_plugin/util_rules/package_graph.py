@@ -0,0 +1,220 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+from __future__ import annotations
+
+import json
+import os
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator
+
+from pants.engine.engine_aware import EngineAwareParameter
+from pants.engine.process import Process, execute_process_or_raise
+from pants.engine.rules import collect_rules, concurrently, implicitly, rule
+from pants.util.frozendict import FrozenDict
+from pants.util.logging import LogLevel
+from shoalsoft.pants_golang_gobuild_plugin.util_rules import go_mod, go_sandbox
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.go_cache import SANDBOX_APPEND_ONLY_CACHES
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.go_mod import (
+    GoModulePaths,
+    GoModulePathsRequest,
+    find_go_module_paths,
+)
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.go_sandbox import (
+    GoSandboxRequest,
+    setup_go_cgo_env,
+    setup_go_sandbox,
+)
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.goroot import GoRoot
+
+# The fields of `go list -json` which the index keeps. Asking for only these keeps `go list` from
+# computing (and printing) the rest, e.g. the stale status of every package. Selecting fields needs
+# Go 1.19; older toolchains print every field, and the rest are ignored.
+_LIST_JSON_FIELDS = (
+    "ImportPath",
+    "Name",
+    "Standard",
+    "GoFiles",
+    "CgoFiles",
+    "TestGoFiles",
+    "XTestGoFiles",
+    "Imports",
+    "TestImports",
+    "XTestImports",
+    "EmbedPatterns",
+    "Error",
+)
+
+
+@dataclass(frozen=True)
+class GoListedPackage:
+    """A package of the module's package graph, as reported by `go list`."""
+
+    import_path: str
+    name: str
+    # The buildroot-relative directory of a first-party package, or None for other packages.
+    dir: str | None
+    is_standard: bool
+    go_files: tuple[str, ...]
+    cgo_files: tuple[str, ...]
+    test_go_files: tuple[str, ...]
+    xtest_go_files: tuple[str, ...]
+    imports: tuple[str, ...]
+    test_imports: tuple[str, ...]
+    xtest_imports: tuple[str, ...]
+    embed_patterns: tuple[str, ...]
+    error: str | None
+
+    @property
+    def is_first_party(self) -> bool:
+        return self.dir is not None
+
+
+@dataclass(frozen=True)
+class GoPackageGraphRequest(EngineAwareParameter):
+    """Request for the package graph of the module in `module_dir`."""
+
+    module_dir: str
+
+    def debug_hint(self) -> str:
+        return self.module_dir or "."
+
+
+@dataclass(frozen=True)
+class GoPackageGraph:
+    """The packages of a module and all of their transitive dependencies, by import path.
+
+    The graph is listed by a single `go list -json -deps` of the whole module, so consumers which
+    need information about many packages share one process rather than each launching their own.
+    """
+
+    packages: FrozenDict[str, GoListedPackage]
+
+    def first_party_packages(self) -> tuple[GoListedPackage, ...]:
+        return tuple(pkg for pkg in self.packages.values() if pkg.is_first_party)
+
+    def packages_by_dir(self) -> dict[str, GoListedPackage]:
+        """Map the buildroot-relative directory of each first-party package to the package."""
+        return {pkg.dir: pkg for pkg in self.packages.values() if pkg.dir is not None}
+
+    def reverse_imports(self) -> dict[str, set[str]]:
+        """Map the import path of each package to the first-party packages which import it.
+
+        Only the imports of the packages themselves are edges: test imports are not part of what
+        a package's importers build.
+        """
+        importers: dict[str, set[str]] = defaultdict(set)
+        for pkg in self.first_party_packages():
+            for import_path in pkg.imports:
+                importers[import_path].add(pkg.import_path)
+        return importers
+
+    def affected_packages(self, changed_import_paths: Iterable[str]) -> set[str]:
+        """The import paths of the first-party packages whose build or tests may be affected.
+
+        A package is affected if it is one of the changed packages or transitively imports one of
+        them, or if its tests import an affected package.
+        """
+        importers = self.reverse_imports()
+        affected = set(changed_import_paths)
+        queue = list(affected)
+        while queue:
+            for importer in importers.get(queue.pop(), ()):
+                if importer not in affected:
+                    affected.add(importer)
+                    queue.append(importer)
+        tested = {
+            pkg.import_path
+            for pkg in self.first_party_packages()
+            if not affected.isdisjoint(pkg.test_imports)
+            or not affected.isdisjoint(pkg.xtest_imports)
+        }
+        return {
+            pkg.import_path
+            for pkg in self.first_party_packages()
+            if pkg.import_path in affected or pkg.import_path in tested
+        }
+
+
+def _iter_json_objects(stdout: str) -> Iterator[dict[str, Any]]:
+    # `go list -json` prints a stream of concatenated objects rather than a JSON array.
+    decoder = json.JSONDecoder()
+    index = 0
+    while True:
+        while index < len(stdout) and stdout[index].isspace():
+            index += 1
+        if index == len(stdout):
+            return
+        obj, index = decoder.raw_decode(stdout, index)
+        yield obj
+
+
+def parse_package_graph(stdout: str, module_paths: GoModulePaths) -> GoPackageGraph:
+    """Parse the output of `go list -json` into a `GoPackageGraph`."""
+    packages: dict[str, GoListedPackage] = {}
+    for obj in _iter_json_objects(stdout):
+        import_path = obj["ImportPath"]
+        is_standard = bool(obj.get("Standard"))
+        error = obj.get("Error")
+        packages[import_path] = GoListedPackage(
+            import_path=import_path,
+            name=obj.get("Name", ""),
+            dir=None if is_standard else module_paths.package_dir(import_path),
+            is_standard=is_standard,
+            go_files=tuple(obj.get("GoFiles", ())),
+            cgo_files=tuple(obj.get("CgoFiles", ())),
+            test_go_files=tuple(obj.get("TestGoFiles", ())),
+            xtest_go_files=tuple(obj.get("XTestGoFiles", ())),
+            imports=tuple(obj.get("Imports", ())),
+            test_imports=tuple(obj.get("TestImports", ())),
+            xtest_imports=tuple(obj.get("XTestImports", ())),
+            embed_patterns=tuple(obj.get("EmbedPatterns", ())),
+            error=error.get("Err") if error else None,
+        )
+    return GoPackageGraph(FrozenDict(sorted(packages.items())))
+
+
+@rule(desc="List Go package graph", level=LogLevel.DEBUG)
+async def list_go_package_graph(request: GoPackageGraphRequest, goroot: GoRoot) -> GoPackageGraph:
+    sandbox, module_paths, cgo_env = await concurrently(
+        setup_go_sandbox(GoSandboxRequest((request.module_dir,)), goroot),
+        find_go_module_paths(GoModulePathsRequest((request.module_dir,))),
+        setup_go_cgo_env(**implicitly()),
+    )
+    # NB: The process is keyed by the module's sandbox digest, so the graph is only listed again
+    # when the module's sources change.
+    result = await execute_process_or_raise(
+        **implicitly(
+            Process(
+                argv=[
+                    os.path.join(goroot.path, "bin", "go"),
+                    "list",
+                    "-e",
+                    "-deps",
+                    (
+                        f"-json={','.join(_LIST_JSON_FIELDS)}"
+                        if goroot.is_compatible_version("1.19")
+                        else "-json"
+                    ),
+                    os.path.join(".", request.module_dir, "..."),
+                ],
+                description=f"List Go package graph: {request.module_dir or '.'}",
+                input_digest=sandbox.digest,
+                # NB: Without cgo, cgo files and the imports only they make are left out of the
+                # graph.
+                env={**sandbox.env, **cgo_env.env},
+                append_only_caches=SANDBOX_APPEND_ONLY_CACHES,
+                level=LogLevel.DEBUG,
+            )
+        )
+    )
+    return parse_package_graph(result.stdout.decode(errors="replace"), module_paths)
+
+
+def rules():
+    return (
+        *collect_rules(),
+        *go_mod.rules(),
+        *go_sandbox.rules(),
+    )
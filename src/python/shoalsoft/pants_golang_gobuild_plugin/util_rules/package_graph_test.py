@@ -0,0 +1,191 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+import json
+import textwrap
+from typing import Sequence
+
+import pytest
+
+from pants.testutil.rule_runner import QueryRule, RuleRunner
+from pants.util.frozendict import FrozenDict
+from shoalsoft.pants_golang_gobuild_plugin.register import rules as all_rules
+from shoalsoft.pants_golang_gobuild_plugin.register import target_types
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.go_mod import GoModulePaths
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.package_graph import (
+    GoListedPackage,
+    GoPackageGraph,
+    GoPackageGraphRequest,
+    parse_package_graph,
+)
+
+
+@pytest.fixture
+def rule_runner() -> RuleRunner:
+    rr = RuleRunner(
+        rules=[*all_rules(), QueryRule(GoPackageGraph, (GoPackageGraphRequest,))],
+        target_types=target_types(),
+    )
+    rr.set_options(["--golang2-go-search-paths=['<PATH>']"], env_inherit={"PATH", "HOME"})
+    return rr
+
+
+def test_parse_package_graph() -> None:
+    module_paths = GoModulePaths(FrozenDict({"mod": "example.com/mod"}))
+    objects = [
+        {"ImportPath": "fmt", "Name": "fmt", "Standard": True, "GoFiles": ["print.go"]},
+        {
+            "ImportPath": "missing.example/z",
+            "Error": {"ImportStack": ["example.com/mod/b"], "Err": "no required module"},
+        },
+        {
+            "ImportPath": "example.com/mod/b",
+            "Name": "b",
+            "GoFiles": ["b.go"],
+            "CgoFiles": ["cgo.go"],
+            "Imports": ["missing.example/z"],
+        },
+        {
+            "ImportPath": "example.com/mod",
+            "Name": "a",
+            "GoFiles": ["a.go"],
+            "TestGoFiles": ["a_test.go"],
+            "XTestGoFiles": ["x_test.go"],
+            "EmbedPatterns": ["x.txt"],
+            "Imports": ["embed", "example.com/mod/b", "fmt"],
+            "TestImports": ["testing"],
+            "XTestImports": ["example.com/mod", "testing"],
+        },
+    ]
+    # `go list -json` prints indented objects back to back.
+    stdout = "".join(json.dumps(obj, indent="\t") + "\n" for obj in objects)
+
+    graph = parse_package_graph(stdout, module_paths)
+    assert list(graph.packages) == [
+        "example.com/mod",
+        "example.com/mod/b",
+        "fmt",
+        "missing.example/z",
+    ]
+    assert graph.packages["example.com/mod"] == GoListedPackage(
+        import_path="example.com/mod",
+        name="a",
+        dir="mod",
+        is_standard=False,
+        go_files=("a.go",),
+        cgo_files=(),
+        test_go_files=("a_test.go",),
+        xtest_go_files=("x_test.go",),
+        imports=("embed", "example.com/mod/b", "fmt"),
+        test_imports=("testing",),
+        xtest_imports=("example.com/mod", "testing"),
+        embed_patterns=("x.txt",),
+        error=None,
+    )
+    assert graph.packages["example.com/mod/b"].cgo_files == ("cgo.go",)
+    assert graph.packages["fmt"].is_standard and graph.packages["fmt"].dir is None
+    assert graph.packages["missing.example/z"].error == "no required module"
+    assert [pkg.import_path for pkg in graph.first_party_packages()] == [
+        "example.com/mod",
+        "example.com/mod/b",
+    ]
+    assert graph.packages_by_dir() == {
+        "mod": graph.packages["example.com/mod"],
+        "mod/b": graph.packages["example.com/mod/b"],
+    }
+
+
+def test_parse_package_graph_empty() -> None:
+    assert parse_package_graph("", GoModulePaths(FrozenDict())).packages == FrozenDict()
+
+
+def _package(
+    import_path: str,
+    *,
+    imports: Sequence[str] = (),
+    test_imports: Sequence[str] = (),
+    xtest_imports: Sequence[str] = (),
+) -> GoListedPackage:
+    return GoListedPackage(
+        import_path=import_path,
+        name=import_path.rsplit("/", 1)[-1],
+        dir=import_path.replace("example.com/", "") if "." in import_path else None,
+        is_standard="." not in import_path,
+        go_files=(),
+        cgo_files=(),
+        test_go_files=(),
+        xtest_go_files=(),
+        imports=tuple(imports),
+        test_imports=tuple(test_imports),
+        xtest_imports=tuple(xtest_imports),
+        embed_patterns=(),
+        error=None,
+    )
+
+
+def test_affected_packages() -> None:
+    packages = [
+        _package("fmt"),
+        _package("example.com/mod/base", imports=["fmt"]),
+        _package("example.com/mod/mid", imports=["example.com/mod/base"]),
+        _package("example.com/mod/top", imports=["example.com/mod/mid"]),
+        # Only the tests of `testonly` import `base`, so its importers are not affected.
+        _package("example.com/mod/testonly", test_imports=["example.com/mod/mid"]),
+        _package("example.com/mod/user", imports=["example.com/mod/testonly"]),
+        _package("example.com/mod/xtest", xtest_imports=["example.com/mod/top"]),
+        _package("example.com/mod/unrelated", imports=["fmt"]),
+    ]
+    graph = GoPackageGraph(FrozenDict((pkg.import_path, pkg) for pkg in packages))
+
+    assert graph.affected_packages(["example.com/mod/base"]) == {
+        "example.com/mod/base",
+        "example.com/mod/mid",
+        "example.com/mod/top",
+        "example.com/mod/testonly",
+        "example.com/mod/xtest",
+    }
+    assert graph.affected_packages(["example.com/mod/top"]) == {
+        "example.com/mod/top",
+        "example.com/mod/xtest",
+    }
+    assert graph.affected_packages(["example.com/mod/unrelated"]) == {"example.com/mod/unrelated"}
+    # Only first-party packages are ever affected.
+    assert graph.affected_packages(["fmt"]) == {
+        "example.com/mod/base",
+        "example.com/mod/mid",
+        "example.com/mod/top",
+        "example.com/mod/testonly",
+        "example.com/mod/xtest",
+        "example.com/mod/unrelated",
+    }
+    assert graph.affected_packages([]) == set()
+
+
+def test_package_graph_includes_cgo_imports(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "mod/go.mod": "module example.com/mod\ngo 1.21\n",
+            "mod/a/a.go": "package a\n",
+            # `b` is only imported by a cgo file of `a`.
+            "mod/a/cgo.go": textwrap.dedent(
+                """\
+                package a
+
+                // #include <stdlib.h>
+                import "C"
+
+                import "example.com/mod/b"
+
+                var _ = b.B
+                """
+            ),
+            "mod/b/b.go": "package b\n\nconst B = 1\n",
+        }
+    )
+    graph = rule_runner.request(GoPackageGraph, [GoPackageGraphRequest("mod")])
+    assert graph.packages["example.com/mod/a"].cgo_files == ("cgo.go",)
+    assert graph.reverse_imports()["example.com/mod/b"] == {"example.com/mod/a"}
+    assert graph.affected_packages(["example.com/mod/b"]) == {
+        "example.com/mod/a",
+        "example.com/mod/b",
+    }
@@ -0,0 +1,177 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import os
+from dataclasses import dataclass
+
+from pants.engine.engine_aware import EngineAwareParameter
+from pants.engine.fs import DigestSubset, MergeDigests, PathGlobs
+from pants.engine.intrinsics import (
+    digest_subset_to_digest,
+    digest_to_snapshot,
+    execute_process,
+    merge_digests,
+)
+from pants.engine.process import Process
+from pants.engine.rules import collect_rules, concurrently, implicitly, rule
+from pants.util.logging import LogLevel
+from shoalsoft.pants_golang_gobuild_plugin.util_rules import go_mod, go_sandbox
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.go_cache import SANDBOX_APPEND_ONLY_CACHES
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.go_mod import (
+    GoModulePaths,
+    GoModulePathsRequest,
+    find_go_module_paths,
+)
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.go_sandbox import (
+    SANDBOX_GO_WORK_FILE,
+    GoSandbox,
+    GoSandboxRequest,
+    setup_go_cgo_env,
+    setup_go_sandbox,
+)
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.goroot import GoRoot
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.module_sources import (
+    GoModuleFilesRequest,
+    capture_go_module_files,
+)
+
+logger = logging.getLogger(__name__)
+
+# For each non-standard package in the closure, its import path followed by the files it embeds,
+# separated by tabs.
+_LIST_DEPS_TEMPLATE = (
+    "{{if not .Standard}}{{.ImportPath}}"
+    "{{range .EmbedFiles}}\t{{.}}{{end}}"
+    "{{range .TestEmbedFiles}}\t{{.}}{{end}}"
+    "{{range .XTestEmbedFiles}}\t{{.}}{{end}}"
+    "{{end}}"
+)
+
+
+@dataclass(frozen=True)
+class GoPackageInputsRequest(EngineAwareParameter):
+    """Request for the sandbox needed to build and test only the package in `pkg_dir`."""
+
+    module_dir: str
+    pkg_dir: str
+
+    def debug_hint(self) -> str:
+        return self.pkg_dir or "."
+
+
+@dataclass(frozen=True)
+class GoPackageInputs:
+    """A module sandbox narrowed to the files which can affect testing a package.
+
+    The narrowed sandbox keeps the module's `go.mod` and `go.sum`, every file of the package's
+    directory tree (which tests commonly read, e.g. `testdata`), and the Go files and embedded
+    files of the first-party packages it transitively imports, including from its tests. Since
+    Pants keys cached process results on their inputs, changes to unrelated packages of the module
+    no longer invalidate the package's results.
+    """
+
+    sandbox: GoSandbox
+
+
+def parse_package_closure(stdout: str, module_paths: GoModulePaths) -> tuple[set[str], set[str]]:
+    """Parse the output of `go list -deps` using `_LIST_DEPS_TEMPLATE`.
+
+    Returns the directories of the first-party packages and the paths of the files they embed.
+    """
+    package_dirs: set[str] = set()
+    embedded_files: set[str] = set()
+    for line in stdout.splitlines():
+        if not line.strip():
+            continue
+        import_path, *embeds = line.split("\t")
+        # Test variants are listed as e.g. `example.com/pkg [example.com/pkg.test]`.
+        package_dir = module_paths.package_dir(import_path.split(" ", 1)[0])
+        if package_dir is None:
+            continue
+        package_dirs.add(package_dir)
+        embedded_files.update(os.path.join(package_dir, embed) for embed in embeds)
+    return package_dirs, embedded_files
+
+
+@rule(desc="Find Go package inputs", level=LogLevel.DEBUG)
+async def find_go_package_inputs(
+    request: GoPackageInputsRequest, goroot: GoRoot
+) -> GoPackageInputs:
+    is_module_root = not request.pkg_dir or request.pkg_dir == request.module_dir
+    sandbox, module_paths, package_tree, cgo_env = await concurrently(
+        setup_go_sandbox(GoSandboxRequest((request.module_dir,)), goroot),
+        find_go_module_paths(GoModulePathsRequest((request.module_dir,))),
+        # The package at the module root owns the whole tree of the module.
+        capture_go_module_files(
+            GoModuleFilesRequest(
+                request.module_dir, request.module_dir if is_module_root else request.pkg_dir
+            )
+        ),
+        setup_go_cgo_env(**implicitly()),
+    )
+    full_sandbox = dataclasses.replace(
+        sandbox, digest=await merge_digests(MergeDigests([sandbox.digest, package_tree.digest]))
+    )
+    if is_module_root:
+        return GoPackageInputs(full_sandbox)
+
+    result = await execute_process(
+        Process(
+            argv=[
+                os.path.join(goroot.path, "bin", "go"),
+                "list",
+                "-e",
+                "-deps",
+                "-test",
+                f"-f={_LIST_DEPS_TEMPLATE}",
+                f"./{request.pkg_dir}",
+            ],
+            description=f"List Go package dependencies: {request.pkg_dir or '.'}",
+            input_digest=sandbox.digest,
+            # NB: Without cgo, the imports of cgo files would be missing from the closure, though
+            # the package's tests build with them.
+            env={**sandbox.env, **cgo_env.env},
+            append_only_caches=SANDBOX_APPEND_ONLY_CACHES,
+            level=LogLevel.DEBUG,
+        ),
+        **implicitly(),
+    )
+    if result.exit_code != 0:
+        # Leave reporting the problem to the process using the whole module.
+        logger.debug(
+            f"Unable to list the dependencies of Go package `{request.pkg_dir}`:\n"
+            f"{result.stderr.decode(errors='replace')}"
+        )
+        return GoPackageInputs(full_sandbox)
+
+    package_dirs, embedded_files = parse_package_closure(
+        result.stdout.decode(errors="replace"), module_paths
+    )
+    module_files = {
+        os.path.join(request.module_dir, "go.mod"),
+        os.path.join(request.module_dir, "go.sum"),
+        SANDBOX_GO_WORK_FILE,
+    }
+    snapshot = await digest_to_snapshot(sandbox.digest)
+    kept_files = [
+        path
+        for path in snapshot.files
+        if path in module_files or path in embedded_files or os.path.dirname(path) in package_dirs
+    ]
+    closure_digest = await digest_subset_to_digest(
+        DigestSubset(sandbox.digest, PathGlobs(kept_files))
+    )
+    digest = await merge_digests(MergeDigests([closure_digest, package_tree.digest]))
+    return GoPackageInputs(dataclasses.replace(sandbox, digest=digest))
+
+
+def rules():
+    return (
+        *collect_rules(),
+        *go_mod.rules(),
+        *go_sandbox.rules(),
+    )
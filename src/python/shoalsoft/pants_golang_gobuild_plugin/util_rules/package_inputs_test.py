@@ -0,0 +1,115 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+import textwrap
+
+import pytest
+
+from pants.engine.fs import Digest, DigestContents
+from pants.testutil.rule_runner import QueryRule, RuleRunner
+from pants.util.frozendict import FrozenDict
+from shoalsoft.pants_golang_gobuild_plugin.register import rules as all_rules
+from shoalsoft.pants_golang_gobuild_plugin.register import target_types
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.go_mod import GoModulePaths
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.package_inputs import (
+    GoPackageInputs,
+    GoPackageInputsRequest,
+    parse_package_closure,
+)
+
+
+@pytest.fixture
+def rule_runner() -> RuleRunner:
+    rr = RuleRunner(
+        rules=[
+            *all_rules(),
+            QueryRule(GoPackageInputs, (GoPackageInputsRequest,)),
+            QueryRule(DigestContents, (Digest,)),
+        ],
+        target_types=target_types(),
+    )
+    rr.set_options(["--golang2-go-search-paths=['<PATH>']"], env_inherit={"PATH", "HOME"})
+    return rr
+
+
+def test_parse_package_closure() -> None:
+    module_paths = GoModulePaths(FrozenDict({"mod": "example.com/mod"}))
+    stdout = "\n".join(
+        [
+            "",
+            "example.com/mod/b\tdata/x.txt\tdata/y.txt",
+            "golang.org/x/text/language",
+            "example.com/mod/a",
+            "",
+            "example.com/mod/a [example.com/mod/a.test]",
+            "example.com/mod/c",
+        ]
+    )
+    package_dirs, embedded_files = parse_package_closure(stdout, module_paths)
+    assert package_dirs == {"mod/a", "mod/b", "mod/c"}
+    assert embedded_files == {"mod/b/data/x.txt", "mod/b/data/y.txt"}
+
+
+def test_package_inputs_ignore_unrelated_packages(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "mod/BUILD": "go_module(name='mod')\n",
+            "mod/go.mod": "module example.com/mod\ngo 1.21\n",
+            "mod/base/base.go": "package base\n\nfunc Base() int { return 1 }\n",
+            "mod/app/app.go": textwrap.dedent(
+                """\
+                package app
+
+                import "example.com/mod/base"
+
+                func App() int { return base.Base() }
+                """
+            ),
+            "mod/app/app_test.go": 'package app\n\nimport "testing"\n\nfunc TestApp(t *testing.T) {}\n',
+            "mod/unrelated/unrelated.go": "package unrelated\n\nfunc U() int { return 1 }\n",
+        }
+    )
+    request = GoPackageInputsRequest("mod", "mod/app")
+
+    inputs = rule_runner.request(GoPackageInputs, [request])
+    paths = {fc.path for fc in rule_runner.request(DigestContents, [inputs.sandbox.digest])}
+    assert {"mod/go.mod", "mod/app/app.go", "mod/app/app_test.go", "mod/base/base.go"} <= paths
+    assert "mod/unrelated/unrelated.go" not in paths
+
+    # Editing a package which `app` does not import leaves its inputs, and so its cached test
+    # results, unchanged.
+    rule_runner.write_files(
+        {"mod/unrelated/unrelated.go": "package unrelated\n\nfunc U() int { return 2 }\n"}
+    )
+    assert rule_runner.request(GoPackageInputs, [request]).sandbox.digest == inputs.sandbox.digest
+
+    # Editing an imported package does change them.
+    rule_runner.write_files({"mod/base/base.go": "package base\n\nfunc Base() int { return 2 }\n"})
+    assert rule_runner.request(GoPackageInputs, [request]).sandbox.digest != inputs.sandbox.digest
+
+
+def test_package_inputs_keep_cgo_imports(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "mod/BUILD": "go_module(name='mod')\n",
+            "mod/go.mod": "module example.com/mod\ngo 1.21\n",
+            "mod/base/base.go": "package base\n\nconst Base = 1\n",
+            "mod/app/app.go": "package app\n",
+            # `base` is only imported by a cgo file.
+            "mod/app/cgo.go": textwrap.dedent(
+                """\
+                package app
+
+                // #include <stdlib.h>
+                import "C"
+
+                import "example.com/mod/base"
+
+                var _ = base.Base
+                """
+            ),
+        }
+    )
+    inputs = rule_runner.request(GoPackageInputs, [GoPackageInputsRequest("mod", "mod/app")])
+    paths = {fc.path for fc in rule_runner.request(DigestContents, [inputs.sandbox.digest])}
+    assert "mod/base/base.go" in paths
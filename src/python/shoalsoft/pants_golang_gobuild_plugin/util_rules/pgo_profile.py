@@ -0,0 +1,72 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from pants.engine.engine_aware import EngineAwareParameter
+from pants.engine.fs import EMPTY_DIGEST, Digest, GlobMatchErrorBehavior, PathGlobs
+from pants.engine.intrinsics import path_globs_to_digest
+from pants.engine.rules import collect_rules, rule
+from pants.engine.target import InvalidFieldException
+from pants.util.logging import LogLevel
+from shoalsoft.pants_golang_gobuild_plugin.target_types import GoBinaryPgoField
+from shoalsoft.pants_golang_gobuild_plugin.util_rules import goroot
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.goroot import GoRoot
+
+
+@dataclass(frozen=True)
+class GoPgoProfileRequest(EngineAwareParameter):
+    field: GoBinaryPgoField
+
+    def debug_hint(self) -> str:
+        return self.field.address.spec
+
+
+@dataclass(frozen=True)
+class GoPgoProfile:
+    """The profile to build a `go_binary` with, and the `-pgo` flag selecting it, if any.
+
+    `digest` holds the profile at its build root relative path, so that merging it into the
+    build's inputs keys cached builds on the profile's content. `build_flag` is None where the
+    toolchain's default already selects the profile, or where the toolchain predates `-pgo`.
+    """
+
+    digest: Digest
+    build_flag: str | None
+
+
+@rule(desc="Find Go PGO profile", level=LogLevel.DEBUG)
+async def find_go_pgo_profile(request: GoPgoProfileRequest, goroot: GoRoot) -> GoPgoProfile:
+    field = request.field
+    profile_path = field.profile_path
+    if not goroot.is_compatible_version("1.20"):
+        # The `-pgo` flag was added in Go 1.20: older toolchains never optimize with a profile.
+        if profile_path is not None:
+            raise InvalidFieldException(
+                f"The `{field.alias}` field of {field.address} is set to the profile "
+                f"{field.value}, but profile-guided optimization requires Go 1.20 or later, and "
+                f"the Go toolchain is {goroot.full_version}."
+            )
+        return GoPgoProfile(EMPTY_DIGEST, None)
+    if profile_path is None:
+        # `auto` is the default since Go 1.21.
+        if field.value == "auto" and goroot.is_compatible_version("1.21"):
+            return GoPgoProfile(EMPTY_DIGEST, None)
+        return GoPgoProfile(EMPTY_DIGEST, f"-pgo={field.value}")
+    digest = await path_globs_to_digest(
+        PathGlobs(
+            [profile_path],
+            glob_match_error_behavior=GlobMatchErrorBehavior.error,
+            description_of_origin=f"the `{field.alias}` field of {field.address}",
+        )
+    )
+    return GoPgoProfile(digest, f"-pgo={{chroot}}/{profile_path}")
+
+
+def rules():
+    return (
+        *collect_rules(),
+        *goroot.rules(),
+    )
@@ -0,0 +1,72 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+import pytest
+
+from pants.engine.fs import EMPTY_DIGEST, DigestContents
+from pants.engine.internals.native_engine import Address, Digest
+from pants.engine.internals.scheduler import ExecutionError
+from pants.testutil.rule_runner import QueryRule, RuleRunner
+from shoalsoft.pants_golang_gobuild_plugin.target_types import GoBinaryPgoField, GoBinaryTarget
+from shoalsoft.pants_golang_gobuild_plugin.util_rules import pgo_profile
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.goroot import GoRoot
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.pgo_profile import (
+    GoPgoProfile,
+    GoPgoProfileRequest,
+)
+
+
+@pytest.fixture
+def rule_runner() -> RuleRunner:
+    rr = RuleRunner(
+        rules=[
+            *pgo_profile.rules(),
+            QueryRule(GoPgoProfile, (GoPgoProfileRequest,)),
+            QueryRule(DigestContents, (Digest,)),
+            QueryRule(GoRoot, ()),
+        ],
+        target_types=[GoBinaryTarget],
+    )
+    rr.set_options(["--golang2-go-search-paths=['<PATH>']"], env_inherit={"PATH", "HOME"})
+    return rr
+
+
+def _profile(rule_runner: RuleRunner, address: Address) -> GoPgoProfile:
+    field = rule_runner.get_target(address)[GoBinaryPgoField]
+    return rule_runner.request(GoPgoProfile, [GoPgoProfileRequest(field)])
+
+
+def test_pgo_profile(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "svc/BUILD": "go_binary(name='auto')\ngo_binary(name='off', pgo='off')\n"
+            "go_binary(name='file', pgo='profiles/cpu.pgo')\n"
+            "go_binary(name='missing', pgo='missing.pgo')\n",
+            "svc/profiles/cpu.pgo": "profile",
+        }
+    )
+    goroot = rule_runner.request(GoRoot, [])
+    if not goroot.is_compatible_version("1.20"):
+        # Toolchains without `-pgo` are only passed no flag, and reject explicit profiles.
+        assert _profile(rule_runner, Address("svc", target_name="auto")) == GoPgoProfile(
+            EMPTY_DIGEST, None
+        )
+        with pytest.raises(ExecutionError, match="requires Go 1.20"):
+            _profile(rule_runner, Address("svc", target_name="file"))
+        return
+
+    # `auto` is the default since Go 1.21, so the flag is omitted there.
+    assert _profile(rule_runner, Address("svc", target_name="auto")) == GoPgoProfile(
+        EMPTY_DIGEST, None if goroot.is_compatible_version("1.21") else "-pgo=auto"
+    )
+    assert _profile(rule_runner, Address("svc", target_name="off")) == GoPgoProfile(
+        EMPTY_DIGEST, "-pgo=off"
+    )
+
+    profile = _profile(rule_runner, Address("svc", target_name="file"))
+    assert profile.build_flag == "-pgo={chroot}/svc/profiles/cpu.pgo"
+    (content,) = rule_runner.request(DigestContents, [profile.digest])
+    assert content.path == "svc/profiles/cpu.pgo"
+
+    with pytest.raises(ExecutionError, match="missing.pgo"):
+        _profile(rule_runner, Address("svc", target_name="missing"))
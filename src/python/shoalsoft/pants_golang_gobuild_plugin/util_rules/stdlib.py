@@ -0,0 +1,69 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+
+from pants.engine.process import Process, execute_process_or_raise
+from pants.engine.rules import collect_rules, implicitly, rule
+from pants.util.logging import LogLevel
+from shoalsoft.pants_golang_gobuild_plugin.util_rules import goroot
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.go_cache import (
+    SANDBOX_APPEND_ONLY_CACHES,
+    SANDBOX_CACHE_ENV,
+)
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.goroot import GoRoot
+
+
+@dataclass(frozen=True)
+class GoStdLibPackages:
+    """The import paths of the standard library packages of the `GoRoot`."""
+
+    import_paths: frozenset[str]
+
+    def __contains__(self, import_path: object) -> bool:
+        return import_path in self.import_paths
+
+    def __len__(self) -> int:
+        return len(self.import_paths)
+
+
+def parse_stdlib_packages(stdout: str) -> GoStdLibPackages:
+    return GoStdLibPackages(frozenset(line for line in stdout.split() if line))
+
+
+@rule(desc="List Go standard library packages", level=LogLevel.DEBUG)
+async def list_go_stdlib_packages(goroot: GoRoot) -> GoStdLibPackages:
+    result = await execute_process_or_raise(
+        **implicitly(
+            Process(
+                argv=[
+                    os.path.join(goroot.path, "bin", "go"),
+                    "list",
+                    "-e",
+                    "-f={{.ImportPath}}",
+                    "std",
+                ],
+                description=f"List Go standard library packages ({goroot.full_version})",
+                env={
+                    **SANDBOX_CACHE_ENV,
+                    "GOTOOLCHAIN": "local",
+                    # The list depends only on the toolchain and the platform, which key the result
+                    # in the persistent process cache: it is not listed again until they change.
+                    "__SHOALSOFT_GO_SDK": f"{goroot.full_version}/{goroot.goos}/{goroot.goarch}",
+                },
+                append_only_caches=SANDBOX_APPEND_ONLY_CACHES,
+                level=LogLevel.DEBUG,
+            )
+        )
+    )
+    return parse_stdlib_packages(result.stdout.decode())
+
+
+def rules():
+    return (
+        *collect_rules(),
+        *goroot.rules(),
+    )
@@ -0,0 +1,34 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+import pytest
+
+from pants.testutil.rule_runner import QueryRule, RuleRunner
+from shoalsoft.pants_golang_gobuild_plugin.util_rules import stdlib
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.stdlib import (
+    GoStdLibPackages,
+    parse_stdlib_packages,
+)
+
+
+@pytest.fixture
+def rule_runner() -> RuleRunner:
+    rr = RuleRunner(rules=[*stdlib.rules(), QueryRule(GoStdLibPackages, ())])
+    rr.set_options(["--golang2-go-search-paths=['<PATH>']"], env_inherit={"PATH", "HOME"})
+    return rr
+
+
+def test_parse_stdlib_packages() -> None:
+    stdlib = parse_stdlib_packages("archive/tar\nfmt\nnet/http\n\nvendor/golang.org/x/net/idna\n")
+    assert len(stdlib) == 4
+    assert "fmt" in stdlib
+    assert "net/http" in stdlib
+    assert "net" not in stdlib
+    assert "golang.org/x/net/idna" not in stdlib
+    assert "example.com/fmt" not in stdlib
+
+
+def test_list_go_stdlib_packages(rule_runner: RuleRunner) -> None:
+    stdlib = rule_runner.request(GoStdLibPackages, [])
+    assert {"fmt", "net/http", "encoding/json"} <= stdlib.import_paths
+    assert "golang.org/x/net/idna" not in stdlib
@@ -0,0 +1,208 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+from __future__ import annotations
+
+import re
+import xml.etree.ElementTree as ET
+from collections import defaultdict
+from dataclasses import dataclass
+from enum import Enum
+from typing import Sequence
+
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.build_events import iter_json_stream
+
+# How the test binary reports a panicking test, including one which timed out.
+_PANIC_RE = re.compile(r"^panic: ", re.MULTILINE)
+
+
+class GoTestOutcome(Enum):
+    PASS = "pass"
+    FAIL = "fail"
+    SKIP = "skip"
+
+
+@dataclass(frozen=True)
+class GoTestCaseResult:
+    """The outcome of one test function (or subtest) from a `go test -json` run."""
+
+    package: str
+    name: str
+    outcome: GoTestOutcome
+    elapsed: float
+    output: str
+
+    @property
+    def top_level_name(self) -> str:
+        return self.name.split("/", 1)[0]
+
+
+@dataclass(frozen=True)
+class GoTestPackageResult:
+    package: str
+    outcome: GoTestOutcome
+    elapsed: float
+
+
+@dataclass(frozen=True)
+class GoTestRun:
+    """The parsed events of a `go test -json` run.
+
+    `output` is the output as `go test -v` would print it. `interrupted` is set if a test binary
+    stopped part way through, by panicking, timing out or exiting, so that later tests never ran.
+    """
+
+    output: str
+    cases: tuple[GoTestCaseResult, ...]
+    packages: tuple[GoTestPackageResult, ...]
+    interrupted: bool = False
+
+    @property
+    def failed_cases(self) -> tuple[GoTestCaseResult, ...]:
+        return tuple(case for case in self.cases if case.outcome == GoTestOutcome.FAIL)
+
+
+def parse_test_events(stream: str) -> GoTestRun:
+    """Incrementally parse the event stream written by `go test -json` (i.e. `go tool test2json`).
+
+    Text which is not JSON, such as build errors, is kept as part of the output.
+    """
+    output: list[str] = []
+    test_output: dict[tuple[str, str], list[str]] = defaultdict(list)
+    cases: list[GoTestCaseResult] = []
+    packages: list[GoTestPackageResult] = []
+    running: set[tuple[str, str]] = set()
+    for event in iter_json_stream(stream):
+        if isinstance(event, str):
+            output.append(event)
+            continue
+        if not isinstance(event, dict):
+            continue
+        action = event.get("Action")
+        package = event.get("Package", "")
+        test = event.get("Test")
+        if action == "output":
+            output.append(event.get("Output", ""))
+            if test:
+                test_output[(package, test)].append(event.get("Output", ""))
+            continue
+        if action == "run" and test:
+            running.add((package, test))
+            continue
+        if action not in ("pass", "fail", "skip"):
+            continue
+        outcome = GoTestOutcome(action)
+        elapsed = float(event.get("Elapsed") or 0.0)
+        if test:
+            running.discard((package, test))
+            cases.append(
+                GoTestCaseResult(
+                    package=package,
+                    name=test,
+                    outcome=outcome,
+                    elapsed=elapsed,
+                    output="".join(test_output.pop((package, test), ())),
+                )
+            )
+        else:
+            packages.append(GoTestPackageResult(package, outcome=outcome, elapsed=elapsed))
+    text = "".join(output)
+    return GoTestRun(
+        output=text,
+        cases=tuple(cases),
+        packages=tuple(packages),
+        # NB: A test which is still running when the binary exits has no result.
+        interrupted=bool(running) or _PANIC_RE.search(text) is not None,
+    )
+
+
+def merge_test_runs(runs: Sequence[GoTestRun]) -> GoTestRun:
+    """Merge the runs of shards of the same test binary.
+
+    A package fails if it fails in any run, and its elapsed time is the longest of its runs.
+    """
+    outcomes: dict[str, GoTestOutcome] = {}
+    elapsed: dict[str, float] = {}
+    for run in runs:
+        for package in run.packages:
+            previous = outcomes.get(package.package)
+            if (
+                previous is None
+                or previous == GoTestOutcome.SKIP
+                or package.outcome == GoTestOutcome.FAIL
+            ):
+                outcomes[package.package] = package.outcome
+            elapsed[package.package] = max(elapsed.get(package.package, 0.0), package.elapsed)
+    return GoTestRun(
+        output="".join(run.output for run in runs),
+        cases=tuple(case for run in runs for case in run.cases),
+        packages=tuple(
+            GoTestPackageResult(package, outcome=outcome, elapsed=elapsed[package])
+            for package, outcome in outcomes.items()
+        ),
+        interrupted=any(run.interrupted for run in runs),
+    )
+
+
+def merge_retried_test_run(run: GoTestRun, retry: GoTestRun) -> GoTestRun:
+    """Merge the results of re-running the failed top-level tests of a run, or all of its tests.
+
+    The retried tests' results, including those of their subtests, replace the original ones. A
+    package's outcome is that of the retry, since only its failed tests are re-run.
+    """
+    retried = {(case.package, case.top_level_name) for case in retry.cases}
+    retry_packages = {package.package: package for package in retry.packages}
+    return GoTestRun(
+        output=run.output + retry.output,
+        cases=(
+            *(case for case in run.cases if (case.package, case.top_level_name) not in retried),
+            *retry.cases,
+        ),
+        packages=tuple(
+            (
+                GoTestPackageResult(
+                    package.package,
+                    outcome=retry_packages[package.package].outcome,
+                    elapsed=package.elapsed + retry_packages[package.package].elapsed,
+                )
+                if package.package in retry_packages
+                else package
+            )
+            for package in run.packages
+        ),
+        interrupted=retry.interrupted,
+    )
+
+
+def junit_xml(run: GoTestRun) -> bytes:
+    """Render test results as JUnit XML, which Pants uses to report per-test timings."""
+    cases_by_package: dict[str, list[GoTestCaseResult]] = defaultdict(list)
+    for case in run.cases:
+        cases_by_package[case.package].append(case)
+    package_elapsed = {package.package: package.elapsed for package in run.packages}
+
+    testsuites = ET.Element("testsuites")
+    for package in sorted(set(cases_by_package) | set(package_elapsed)):
+        package_cases = cases_by_package[package]
+        testsuite = ET.SubElement(
+            testsuites,
+            "testsuite",
+            name=package,
+            tests=str(len(package_cases)),
+            failures=str(sum(1 for c in package_cases if c.outcome == GoTestOutcome.FAIL)),
+            skipped=str(sum(1 for c in package_cases if c.outcome == GoTestOutcome.SKIP)),
+            time=f"{package_elapsed.get(package, 0.0):.3f}",
+        )
+        for case in package_cases:
+            testcase = ET.SubElement(
+                testsuite,
+                "testcase",
+                classname=package,
+                name=case.name,
+                time=f"{case.elapsed:.3f}",
+            )
+            if case.outcome == GoTestOutcome.FAIL:
+                ET.SubElement(testcase, "failure", message="Failed").text = case.output
+            elif case.outcome == GoTestOutcome.SKIP:
+                ET.SubElement(testcase, "skipped", message="Skipped").text = case.output
+    return ET.tostring(testsuites, encoding="utf-8", xml_declaration=True)
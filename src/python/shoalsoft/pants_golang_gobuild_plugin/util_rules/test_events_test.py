@@ -0,0 +1,177 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+import json
+import xml.etree.ElementTree as ET
+
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.test_events import (
+    GoTestCaseResult,
+    GoTestOutcome,
+    GoTestPackageResult,
+    GoTestRun,
+    junit_xml,
+    merge_retried_test_run,
+    merge_test_runs,
+    parse_test_events,
+)
+
+_EVENTS = [
+    {"Action": "start", "Package": "example.com/pkg"},
+    {"Action": "run", "Package": "example.com/pkg", "Test": "TestOk"},
+    {
+        "Action": "output",
+        "Package": "example.com/pkg",
+        "Test": "TestOk",
+        "Output": "=== RUN   TestOk\n",
+    },
+    {
+        "Action": "output",
+        "Package": "example.com/pkg",
+        "Test": "TestOk",
+        "Output": "--- PASS: TestOk (0.01s)\n",
+    },
+    {"Action": "pass", "Package": "example.com/pkg", "Test": "TestOk", "Elapsed": 0.01},
+    {"Action": "run", "Package": "example.com/pkg", "Test": "TestBad"},
+    {
+        "Action": "output",
+        "Package": "example.com/pkg",
+        "Test": "TestBad",
+        "Output": "=== RUN   TestBad\n",
+    },
+    {
+        "Action": "output",
+        "Package": "example.com/pkg",
+        "Test": "TestBad",
+        "Output": "    pkg_test.go:9: boom\n",
+    },
+    {"Action": "fail", "Package": "example.com/pkg", "Test": "TestBad", "Elapsed": 0.5},
+    {"Action": "output", "Package": "example.com/pkg", "Output": "FAIL\n"},
+    {"Action": "fail", "Package": "example.com/pkg", "Elapsed": 0.6},
+]
+
+
+def test_parse_test_events() -> None:
+    stream = "".join(json.dumps(event) + "\n" for event in _EVENTS)
+    run = parse_test_events(stream)
+    assert run.output == (
+        "=== RUN   TestOk\n--- PASS: TestOk (0.01s)\n=== RUN   TestBad\n"
+        "    pkg_test.go:9: boom\nFAIL\n"
+    )
+    assert run.cases == (
+        GoTestCaseResult(
+            "example.com/pkg",
+            "TestOk",
+            GoTestOutcome.PASS,
+            0.01,
+            "=== RUN   TestOk\n--- PASS: TestOk (0.01s)\n",
+        ),
+        GoTestCaseResult(
+            "example.com/pkg",
+            "TestBad",
+            GoTestOutcome.FAIL,
+            0.5,
+            "=== RUN   TestBad\n    pkg_test.go:9: boom\n",
+        ),
+    )
+    assert run.packages == (GoTestPackageResult("example.com/pkg", GoTestOutcome.FAIL, 0.6),)
+    assert [case.name for case in run.failed_cases] == ["TestBad"]
+
+
+def test_parse_test_events_keeps_text() -> None:
+    run = parse_test_events(
+        '# example.com/pkg\npkg.go:3:1: syntax error\n{"Action": "output", "Output": "FAIL\\n"}\n'
+    )
+    assert run.output == "# example.com/pkg\npkg.go:3:1: syntax error\nFAIL\n"
+
+
+def test_parse_test_events_interrupted() -> None:
+    stream = "".join(json.dumps(event) + "\n" for event in _EVENTS)
+    assert not parse_test_events(stream).interrupted
+
+    def events(*events: dict) -> str:
+        return "".join(
+            json.dumps({"Package": "example.com/pkg", **event}) + "\n" for event in events
+        )
+
+    # A panicking test fails, and ends the run.
+    panicked = events(
+        {"Action": "run", "Test": "TestPanic"},
+        {"Action": "output", "Test": "TestPanic", "Output": "panic: boom [recovered]\n"},
+        {"Action": "fail", "Test": "TestPanic", "Elapsed": 0.0},
+        {"Action": "fail", "Elapsed": 0.1},
+    )
+    assert parse_test_events(panicked).interrupted
+
+    # A test which exits, or times out, has no result.
+    exited = events(
+        {"Action": "run", "Test": "TestExit"},
+        {"Action": "output", "Test": "TestExit", "Output": "=== RUN   TestExit\n"},
+        {"Action": "fail", "Elapsed": 0.1},
+    )
+    assert parse_test_events(exited).interrupted
+
+
+def test_junit_xml() -> None:
+    stream = "".join(json.dumps(event) + "\n" for event in _EVENTS)
+    root = ET.fromstring(junit_xml(parse_test_events(stream)))
+    (testsuite,) = root
+    assert testsuite.attrib == {
+        "name": "example.com/pkg",
+        "tests": "2",
+        "failures": "1",
+        "skipped": "0",
+        "time": "0.600",
+    }
+    ok, bad = testsuite
+    assert ok.attrib["name"] == "TestOk" and ok.attrib["time"] == "0.010"
+    assert bad.find("failure") is not None
+
+
+def test_merge_test_runs() -> None:
+    def run(outcome: GoTestOutcome, elapsed: float) -> GoTestRun:
+        return GoTestRun(
+            output=f"{outcome.value}\n",
+            cases=(GoTestCaseResult("example.com/pkg", "TestX", outcome, elapsed, ""),),
+            packages=(GoTestPackageResult("example.com/pkg", outcome=outcome, elapsed=elapsed),),
+        )
+
+    merged = merge_test_runs([run(GoTestOutcome.PASS, 0.5), run(GoTestOutcome.FAIL, 0.2)])
+    assert merged.output == "pass\nfail\n"
+    assert len(merged.cases) == 2
+    assert merged.packages == (
+        GoTestPackageResult("example.com/pkg", outcome=GoTestOutcome.FAIL, elapsed=0.5),
+    )
+
+    merged = merge_test_runs([run(GoTestOutcome.SKIP, 0.0), run(GoTestOutcome.PASS, 0.1)])
+    assert merged.packages[0].outcome == GoTestOutcome.PASS
+
+
+def test_merge_retried_test_run() -> None:
+    def case(name: str, outcome: GoTestOutcome) -> GoTestCaseResult:
+        return GoTestCaseResult("example.com/pkg", name, outcome, 0.1, "")
+
+    run = GoTestRun(
+        output="first\n",
+        cases=(
+            case("TestOk", GoTestOutcome.PASS),
+            case("TestFlaky/sub", GoTestOutcome.FAIL),
+            case("TestFlaky", GoTestOutcome.FAIL),
+        ),
+        packages=(GoTestPackageResult("example.com/pkg", outcome=GoTestOutcome.FAIL, elapsed=1.0),),
+    )
+    retry = GoTestRun(
+        output="retry\n",
+        cases=(case("TestFlaky/sub", GoTestOutcome.PASS), case("TestFlaky", GoTestOutcome.PASS)),
+        packages=(GoTestPackageResult("example.com/pkg", outcome=GoTestOutcome.PASS, elapsed=0.5),),
+    )
+    merged = merge_retried_test_run(run, retry)
+    assert merged.output == "first\nretry\n"
+    assert [(c.name, c.outcome) for c in merged.cases] == [
+        ("TestOk", GoTestOutcome.PASS),
+        ("TestFlaky/sub", GoTestOutcome.PASS),
+        ("TestFlaky", GoTestOutcome.PASS),
+    ]
+    assert not merged.failed_cases
+    assert merged.packages == (
+        GoTestPackageResult("example.com/pkg", outcome=GoTestOutcome.PASS, elapsed=1.5),
+    )
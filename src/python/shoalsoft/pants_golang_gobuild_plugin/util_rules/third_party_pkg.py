@@ -0,0 +1,88 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+from __future__ import annotations
+
+import codecs
+import io
+import os
+
+from pants.engine.fs import GlobMatchErrorBehavior, PathGlobs
+from pants.engine.intrinsics import get_digest_contents
+from pants.engine.rules import collect_rules, implicitly, rule
+from pants.engine.target import GeneratedTargets, GenerateTargetsRequest, InvalidTargetException
+from pants.engine.unions import UnionMembership, UnionRule
+from pants.util.logging import LogLevel
+from shoalsoft.pants_golang_gobuild_plugin.target_types import (
+    GoImportPathField,
+    GoThirdPartyModuleVersionField,
+    GoThirdPartyPackagesTarget,
+    GoThirdPartyPackageTarget,
+)
+from shoalsoft.pants_golang_gobuild_plugin.util_rules.go_mod_parser import (
+    GoModParseError,
+    parse_go_mod,
+)
+
+
+class GenerateGoThirdPartyPackageTargetsRequest(GenerateTargetsRequest):
+    generate_from = GoThirdPartyPackagesTarget
+
+
+@rule(desc="Generate `go_third_party_package` targets from `go.mod`", level=LogLevel.DEBUG)
+async def generate_go_third_party_package_targets(
+    request: GenerateGoThirdPartyPackageTargetsRequest,
+    union_membership: UnionMembership,
+) -> GeneratedTargets:
+    generator = request.generator
+    go_mod_path = os.path.join(generator.address.spec_path, "go.mod")
+    contents = await get_digest_contents(
+        **implicitly(
+            {
+                PathGlobs(
+                    [go_mod_path],
+                    glob_match_error_behavior=GlobMatchErrorBehavior.error,
+                    description_of_origin=f"the `{generator.alias}` target {generator.address}",
+                ): PathGlobs
+            }
+        )
+    )
+    try:
+        # NB: Lines are decoded one at a time as the parser consumes them, rather than decoding
+        # and splitting the whole file up front.
+        go_mod = parse_go_mod(codecs.iterdecode(io.BytesIO(contents[0].content), "utf-8"))
+    except GoModParseError as e:
+        raise InvalidTargetException(
+            f"The target {generator.address} could not parse {go_mod_path}: {e}"
+        ) from e
+
+    # NB: Pants generates all of a generator's targets together, whenever any of them (or the
+    # generator) is resolved, so this only parses `go.mod` and creates one target per module.
+    generated = []
+    for require in go_mod.requires:
+        replace = go_mod.replacement(require.path, require.version)
+        if replace is not None and replace.is_local:
+            continue
+        version = (
+            require.version if replace is None else f"{replace.new_path}@{replace.new_version}"
+        )
+        generated.append(
+            GoThirdPartyPackageTarget(
+                {
+                    **request.template,
+                    GoImportPathField.alias: require.path,
+                    GoThirdPartyModuleVersionField.alias: version,
+                },
+                request.template_address.create_generated(require.path),
+                union_membership,
+                residence_dir=generator.address.spec_path,
+            )
+        )
+    return GeneratedTargets(generator, generated)
+
+
+def rules():
+    return (
+        *collect_rules(),
+        UnionRule(GenerateTargetsRequest, GenerateGoThirdPartyPackageTargetsRequest),
+    )
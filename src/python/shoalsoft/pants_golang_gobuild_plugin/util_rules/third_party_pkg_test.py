@@ -0,0 +1,59 @@
+# Pants Plugin to invoke Official Go toolchain.
+# Copyright (C) 2025 Shoal Software LLC. All rights reserved.
+
+import textwrap
+
+import pytest
+
+from pants.engine.addresses import Address
+from pants.engine.target import AllTargets
+from pants.testutil.rule_runner import QueryRule, RuleRunner
+from shoalsoft.pants_golang_gobuild_plugin.register import rules as all_rules
+from shoalsoft.pants_golang_gobuild_plugin.register import target_types
+from shoalsoft.pants_golang_gobuild_plugin.target_types import (
+    GoImportPathField,
+    GoThirdPartyModuleVersionField,
+)
+
+
+@pytest.fixture
+def rule_runner() -> RuleRunner:
+    return RuleRunner(rules=[*all_rules(), QueryRule(AllTargets, [])], target_types=target_types())
+
+
+def test_generate_go_third_party_package_targets(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "mod/BUILD": "go_module(name='mod')\ngo_third_party_packages(name='third_party')\n",
+            "mod/go.mod": textwrap.dedent(
+                """\
+                module example.com/mod
+
+                go 1.21
+
+                require (
+                    github.com/google/uuid v1.6.0
+                    golang.org/x/text v0.14.0 // indirect
+                    example.com/local v0.0.0
+                )
+
+                replace example.com/local => ../local
+                replace golang.org/x/text => golang.org/x/text v0.15.0
+                """
+            ),
+        }
+    )
+    uuid = rule_runner.get_target(
+        Address("mod", target_name="third_party", generated_name="github.com/google/uuid")
+    )
+    assert uuid[GoImportPathField].value == "github.com/google/uuid"
+    assert uuid[GoThirdPartyModuleVersionField].value == "v1.6.0"
+    text = rule_runner.get_target(
+        Address("mod", target_name="third_party", generated_name="golang.org/x/text")
+    )
+    assert text[GoThirdPartyModuleVersionField].value == "golang.org/x/text@v0.15.0"
+
+    # The `go_module` target is not replaced by generated targets, and locally replaced modules get no target.
+    addresses = {tgt.address for tgt in rule_runner.request(AllTargets, [])}
+    assert Address("mod", target_name="mod") in addresses
+    assert not any(a.generated_name == "example.com/local" for a in addresses)